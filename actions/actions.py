@@ -33,8 +33,10 @@ from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet
 
+from .metrics import ActionMetricsMixin
 
-class ActionMedicineInformation(Action):
+
+class ActionMedicineInformation(ActionMetricsMixin, Action):
     """Provide medicine information and dosage guidance"""
 
     def name(self) -> Text:
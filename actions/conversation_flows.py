@@ -6,8 +6,10 @@ from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet, FollowupAction
 
+from .metrics import ActionMetricsMixin
 
-class ActionAskDuration(Action):
+
+class ActionAskDuration(ActionMetricsMixin, Action):
     """Ask for symptom duration with context-aware buttons"""
 
     def name(self) -> Text:
@@ -34,7 +36,7 @@ class ActionAskDuration(Action):
         return []
 
 
-class ActionAskSeverity(Action):
+class ActionAskSeverity(ActionMetricsMixin, Action):
     """Ask for symptom severity with intuitive options"""
 
     def name(self) -> Text:
@@ -58,7 +60,7 @@ class ActionAskSeverity(Action):
         return []
 
 
-class ActionAskOtherSymptoms(Action):
+class ActionAskOtherSymptoms(ActionMetricsMixin, Action):
     """Ask for additional symptoms based on primary symptom"""
 
     def name(self) -> Text:
@@ -101,7 +103,7 @@ class ActionAskOtherSymptoms(Action):
         return []
 
 
-class ActionAskLocation(Action):
+class ActionAskLocation(ActionMetricsMixin, Action):
     """Ask for user location for finding nearby services"""
 
     def name(self) -> Text:
@@ -126,7 +128,7 @@ class ActionAskLocation(Action):
         return []
 
 
-class ActionAskAge(Action):
+class ActionAskAge(ActionMetricsMixin, Action):
     """Ask for patient age for personalized advice"""
 
     def name(self) -> Text:
@@ -159,7 +161,7 @@ class ActionAskAge(Action):
         return []
 
 
-class ActionProvidePreventionAdvice(Action):
+class ActionProvidePreventionAdvice(ActionMetricsMixin, Action):
     """Provide contextual prevention advice based on symptoms/diseases"""
 
     def name(self) -> Text:
@@ -358,7 +360,7 @@ class ActionProvidePreventionAdvice(Action):
         """
 
 
-class ActionDefaultFallback(Action):
+class ActionDefaultFallback(ActionMetricsMixin, Action):
     """Intelligent fallback with health context and helpful suggestions"""
 
     def name(self) -> Text:
@@ -2,6 +2,7 @@
 # CoWIN, IHIP, Hospital Finder, Disease Surveillance
 
 from typing import Any, Text, Dict, List
+import os
 import requests
 import json
 from datetime import datetime
@@ -11,8 +12,29 @@ from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet
 
+from .metrics import ActionMetricsMixin, http_get
 
-class ActionCheckVaccination(Action):
+# Per-district outbreak stats written by `python dashboard/outbreak_engine.py`
+OUTBREAK_STATS_PATH = os.getenv("FALCONCARE_OUTBREAK_STATS", "models/outbreak_stats.json")
+
+_outbreak_stats = {}
+
+
+def load_outbreak_stats(path=OUTBREAK_STATS_PATH):
+    """Outbreak stats, re-read only when the file changes; None if there are none"""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _outbreak_stats.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            cached = (mtime, json.load(f))
+        _outbreak_stats[path] = cached
+    return cached[1]
+
+
+class ActionCheckVaccination(ActionMetricsMixin, Action):
     """CoWIN API integration for vaccination center lookup"""
 
     def name(self) -> Text:
@@ -36,7 +58,7 @@ class ActionCheckVaccination(Action):
             params = {"pincode": pincode, "date": today}
             headers = {"User-Agent": "Mozilla/5.0"}
             
-            response = requests.get(url, params=params, headers=headers, timeout=5)
+            response = http_get(url, params=params, headers=headers, timeout=5)
             data = response.json()
             
             if data.get('centers'):
@@ -83,7 +105,7 @@ class ActionCheckVaccination(Action):
         return []
 
 
-class ActionDiseaseStats(Action):
+class ActionDiseaseStats(ActionMetricsMixin, Action):
     """Mock IHIP integration for disease surveillance data"""
 
     def name(self) -> Text:
@@ -96,8 +118,8 @@ class ActionDiseaseStats(Action):
         # Get district from slot or use default
         district = tracker.get_slot("user_location") or "रायपुर"
         
-        # Mock IHIP data (in production, connect to real API)
-        disease_data = self._get_mock_disease_data()
+        # Outbreak detector signals, mock IHIP data until the detector has run
+        disease_data = self._get_disease_data()
         
         district_lower = district.lower()
         district_key = self._match_district(district_lower, disease_data.keys())
@@ -128,6 +150,13 @@ class ActionDiseaseStats(Action):
         
         return []
 
+    def _get_disease_data(self):
+        """Trends and alerts from the outbreak detector's stats if available"""
+        stats = load_outbreak_stats()
+        if stats is not None:
+            return stats
+        return self._get_mock_disease_data()
+
     def _get_mock_disease_data(self):
         """Mock disease surveillance data for demo"""
         return {
@@ -179,7 +208,7 @@ class ActionDiseaseStats(Action):
         return trend_map.get(trend, "स्थिर")
 
 
-class ActionFindHospital(Action):
+class ActionFindHospital(ActionMetricsMixin, Action):
     """Find nearest hospitals and healthcare facilities"""
 
     def name(self) -> Text:
@@ -287,7 +316,7 @@ class ActionFindHospital(Action):
         return hospital_database.get("raipur", [])
 
 
-class ActionVaccinationReminder(Action):
+class ActionVaccinationReminder(ActionMetricsMixin, Action):
     """Vaccination schedule and reminder system"""
 
     def name(self) -> Text:
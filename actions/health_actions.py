@@ -12,13 +12,29 @@ from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet, FollowupAction
 
+from symptom_normalizer import NORMALIZER
 
-class ActionTriageSymptoms(Action):
+from .metrics import ActionMetricsMixin
+
+
+class ActionTriageSymptoms(ActionMetricsMixin, Action):
     """
     Intelligent medical triage system with RED/YELLOW/GREEN classification
     Analyzes symptoms, duration, severity, and patient age for risk assessment
     """
 
+    # Emergency symptoms requiring immediate attention (RED), as canonical symptom IDs
+    RED_FLAGS = {
+        "chest pain", "shortness of breath", "unconscious", "heart attack",
+        "severe bleeding", "stroke", "suicidal thoughts", "injury", "seizures",
+    }
+
+    # Warning symptoms needing medical attention (YELLOW)
+    YELLOW_FLAGS = {
+        "high fever", "persistent fever", "severe vomiting", "vomiting blood",
+        "severe diarrhea", "dehydration", "blood in stool", "severe headache", "severe weakness",
+    }
+
     def name(self) -> Text:
         return "action_triage_symptoms"
 
@@ -26,25 +42,6 @@ class ActionTriageSymptoms(Action):
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
-        # Emergency symptoms requiring immediate attention (RED)
-        RED_FLAGS = [
-            "chest pain", "सीने में दर्द", "difficulty breathing", "सांस नहीं आ रही",
-            "unconscious", "बेहोश", "heart attack", "दिल का दौरा",
-            "severe bleeding", "खून बह रहा", "stroke", "लकवा",
-            "severe chest pain", "तेज सीने का दर्द", "can't breathe", "सांस फूल रही",
-            "suicide", "आत्महत्या", "bleeding heavily", "बहुत खून",
-            "accident", "दुर्घटना", "seizure", "दौरा पड़ना"
-        ]
-
-        # Warning symptoms needing medical attention (YELLOW)
-        YELLOW_FLAGS = [
-            "high fever 3 days", "3 दिन से तेज बुखार", "severe vomiting", "बहुत उल्टी",
-            "blood in vomit", "खून की उल्टी", "severe diarrhea", "बहुत दस्त",
-            "dehydration", "पानी की कमी", "persistent fever", "लगातार बुखार",
-            "blood in stool", "खून के दस्त", "severe headache", "तेज सिरदर्द",
-            "very weak", "बहुत कमजोरी", "fever with rash", "बुखार और दाने"
-        ]
-
         # Extract information from tracker
         current_intent = tracker.latest_message.get('intent', {}).get('name', '')
         user_message = tracker.latest_message.get('text', '').lower()
@@ -54,24 +51,21 @@ class ActionTriageSymptoms(Action):
         severity = tracker.get_slot("severity") or ""
         patient_age = tracker.get_slot("patient_age") or ""
 
+        symptoms = set(NORMALIZER.symptoms(user_message)) | set(NORMALIZER.symptoms(symptom))
+
         # Calculate risk score
         risk_score = 0
         triage_level = "GREEN"
 
         # Check for emergency symptoms (RED flags)
-        for red_flag in RED_FLAGS:
-            if red_flag.lower() in user_message or red_flag.lower() in symptom.lower():
-                risk_score += 100
-                triage_level = "RED"
-                break
-
-        # Check for warning symptoms (YELLOW flags) if not RED
-        if triage_level != "RED":
-            for yellow_flag in YELLOW_FLAGS:
-                if yellow_flag.lower() in user_message or yellow_flag.lower() in symptom.lower():
-                    risk_score += 50
-                    triage_level = "YELLOW"
-                    break
+        if symptoms & self.RED_FLAGS:
+            risk_score += 100
+            triage_level = "RED"
+
+        # Check for warning symptoms (YELLOW flags) if not RED; fever with rash counts too
+        elif symptoms & self.YELLOW_FLAGS or {"fever", "rash"} <= symptoms:
+            risk_score += 50
+            triage_level = "YELLOW"
 
         # Severity multiplier
         if "severe" in severity.lower() or "तेज" in severity or "बहुत" in severity:
@@ -124,11 +118,11 @@ class ActionTriageSymptoms(Action):
         else:  # GREEN
             dispatcher.utter_message(response="utter_mild_advice")
             # Provide specific home care advice based on symptom
-            if "fever" in symptom.lower() or "बुखार" in symptom:
+            if "fever" in symptoms:
                 advice = "💧 पानी पिएं, आराम करें, पैरासिटामोल ले सकते हैं। अगर 48 घंटे में सुधार न हो तो डॉक्टर से मिलें।"
-            elif "cough" in symptom.lower() or "खांसी" in symptom:
+            elif "cough" in symptoms:
                 advice = "🍯 गुनगुना पानी और शहद लें। भाप लें। धूम्रपान से बचें।"
-            elif "stomach" in symptom.lower() or "पेट" in symptom:
+            elif "abdominal pain" in symptoms:
                 advice = "💧 ORS घोल पिएं। हल्का भोजन लें। तली चीजें न खाएं।"
             else:
                 advice = "💧 आराम करें, पानी पिएं। 2-3 दिन में सुधार न हो तो डॉक्टर से मिलें।"
@@ -137,7 +131,7 @@ class ActionTriageSymptoms(Action):
             return [SlotSet("triage_level", "GREEN")]
 
 
-class ActionEmergencyCall(Action):
+class ActionEmergencyCall(ActionMetricsMixin, Action):
     """Emergency response action for RED triage cases"""
 
     def name(self) -> Text:
@@ -199,7 +193,7 @@ class ActionEmergencyCall(Action):
             print(f"Error logging emergency: {e}")
 
 
-class ActionDetectMyth(Action):
+class ActionDetectMyth(ActionMetricsMixin, Action):
     """Detect and counter health myths and misinformation"""
 
     def name(self) -> Text:
@@ -0,0 +1,199 @@
+# FalconCare - Action Server Metrics
+# Latency/error histograms for every custom action and its upstream HTTP calls,
+# exposed in Prometheus text format on the action server's /metrics endpoint
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Calls slower than this are candidates for the slow-call log
+SLOW_CALL_SECONDS = float(os.getenv("FALCONCARE_SLOW_ACTION_MS", "500")) / 1000
+
+# Fraction of slow calls logged with their slot values (0 disables the log)
+SLOW_CALL_SAMPLE_RATE = float(os.getenv("FALCONCARE_SLOW_ACTION_SAMPLE", "0.1"))
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values"""
+
+    def __init__(self, name, help_text, label_names, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self.series.items()):
+                label_text = ",".join(f'{k}="{v}"' for k, v in zip(self.label_names, labels))
+                for bound, bucket_count in zip(self.buckets, counts):
+                    lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {bucket_count}')
+                lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {count}')
+                lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+                lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by label values"""
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels):
+        with self._lock:
+            self.series[labels] = self.series.get(labels, 0) + 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self.series.items()):
+                label_text = ",".join(f'{k}="{v}"' for k, v in zip(self.label_names, labels))
+                lines.append(f"{self.name}{{{label_text}}} {value}")
+        return lines
+
+
+ACTION_LATENCY = Histogram(
+    "falconcare_action_duration_seconds", "Wall time of custom action runs", ("action",)
+)
+ACTION_HTTP_LATENCY = Histogram(
+    "falconcare_action_http_duration_seconds", "Upstream HTTP time spent inside custom actions", ("action", "host")
+)
+ACTION_ERRORS = Counter(
+    "falconcare_action_errors_total", "Custom action runs that raised", ("action", "error")
+)
+ACTION_HTTP_ERRORS = Counter(
+    "falconcare_action_http_errors_total", "Upstream HTTP calls from actions that failed", ("action", "host")
+)
+METRICS = (ACTION_LATENCY, ACTION_HTTP_LATENCY, ACTION_ERRORS, ACTION_HTTP_ERRORS)
+
+
+def render_metrics():
+    """All action metrics in Prometheus text exposition format"""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# The action run (name, accumulated HTTP seconds) the current call belongs to
+_current_call = contextvars.ContextVar("falconcare_action_call", default=None)
+
+
+def http_get(url, **kwargs):
+    """requests.get() that records its time against the running action"""
+    call = _current_call.get()
+    action = call["action"] if call else "none"
+    host = urlparse(url).netloc
+    start = time.perf_counter()
+    try:
+        return requests.get(url, **kwargs)
+    except requests.RequestException:
+        ACTION_HTTP_ERRORS.inc(action, host)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        ACTION_HTTP_LATENCY.observe(elapsed, action, host)
+        if call:
+            call["http_seconds"] += elapsed
+
+
+def _log_slow_call(action, elapsed, http_seconds, tracker):
+    if elapsed < SLOW_CALL_SECONDS or random.random() >= SLOW_CALL_SAMPLE_RATE:
+        return
+    logger.warning("Slow action call: %s", json.dumps({
+        "action": action,
+        "duration_ms": round(elapsed * 1000, 1),
+        "http_ms": round(http_seconds * 1000, 1),
+        "sender_id": getattr(tracker, "sender_id", None),
+        "slots": tracker.current_slot_values() if hasattr(tracker, "current_slot_values") else {},
+    }, ensure_ascii=False, default=str))
+
+
+def _instrument(run):
+    """Wrap an action's run() (sync or async) with timing and error counting"""
+
+    def start(self):
+        call = {"action": self.name(), "http_seconds": 0.0}
+        return call, _current_call.set(call), time.perf_counter()
+
+    def finish(call, token, started, tracker, error=None):
+        elapsed = time.perf_counter() - started
+        _current_call.reset(token)
+        ACTION_LATENCY.observe(elapsed, call["action"])
+        if error is not None:
+            ACTION_ERRORS.inc(call["action"], type(error).__name__)
+        _log_slow_call(call["action"], elapsed, call["http_seconds"], tracker)
+
+    if inspect.iscoroutinefunction(run):
+        @functools.wraps(run)
+        async def instrumented(self, dispatcher, tracker, domain):
+            call, token, started = start(self)
+            try:
+                result = await run(self, dispatcher, tracker, domain)
+            except Exception as e:
+                finish(call, token, started, tracker, e)
+                raise
+            finish(call, token, started, tracker)
+            return result
+    else:
+        @functools.wraps(run)
+        def instrumented(self, dispatcher, tracker, domain):
+            call, token, started = start(self)
+            try:
+                result = run(self, dispatcher, tracker, domain)
+            except Exception as e:
+                finish(call, token, started, tracker, e)
+                raise
+            finish(call, token, started, tracker)
+            return result
+
+    instrumented._instrumented = True
+    return instrumented
+
+
+class ActionMetricsMixin:
+    """
+    Mixin that times the run() of every action class using it:
+    class ActionX(ActionMetricsMixin, Action)
+
+    Not an Action itself, so the SDK's action discovery doesn't register it.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        run = cls.__dict__.get("run")
+        if run is not None and not getattr(run, "_instrumented", False):
+            cls.run = _instrument(run)
@@ -0,0 +1,34 @@
+# FalconCare - Action Server
+# `rasa run actions` plus a Prometheus /metrics endpoint for action latencies
+#
+# Usage: python -m actions.server [port]
+
+import logging
+import os
+import sys
+
+from rasa_sdk.endpoint import create_app
+from sanic import response
+
+from .metrics import render_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = int(os.getenv("FALCONCARE_ACTIONS_PORT", "5055"))
+
+
+def create_action_server():
+    app = create_app("actions")
+
+    async def metrics(request):
+        return response.text(render_metrics(), content_type="text/plain; version=0.0.4")
+
+    app.add_route(metrics, "/metrics", methods=["GET"])
+    return app
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
+    logger.info(f"Starting FalconCare action server on port {port} (metrics at /metrics)")
+    create_action_server().run(host="0.0.0.0", port=port, workers=1)
@@ -0,0 +1,68 @@
+"""
+Unit tests for FalconCare action metrics
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from actions import metrics
+from rasa_sdk import Action
+
+from actions.metrics import ActionMetricsMixin, render_metrics
+
+
+# Action classes are defined inside the tests: the action server imports every
+# module in this package, and would register module-level Action subclasses
+class TestActionMetrics:
+    """Timing, error counting and exposition of instrumented actions"""
+
+    def test_run_is_timed(self):
+        class ActionOk(ActionMetricsMixin, Action):
+            def name(self):
+                return "action_test_ok"
+
+            def run(self, dispatcher, tracker, domain):
+                return []
+
+        assert ActionOk().run(Mock(), Mock(), {}) == []
+        assert metrics.ACTION_LATENCY.series[("action_test_ok",)][2] >= 1
+        assert 'falconcare_action_duration_seconds_count{action="action_test_ok"}' in render_metrics()
+
+    def test_errors_are_counted_and_reraised(self):
+        class ActionBroken(ActionMetricsMixin, Action):
+            def name(self):
+                return "action_test_broken"
+
+            def run(self, dispatcher, tracker, domain):
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            ActionBroken().run(Mock(), Mock(), {})
+        assert metrics.ACTION_ERRORS.series[("action_test_broken", "ValueError")] >= 1
+
+    def test_async_run_is_timed(self):
+        class ActionAsync(ActionMetricsMixin, Action):
+            def name(self):
+                return "action_test_async"
+
+            async def run(self, dispatcher, tracker, domain):
+                return ["done"]
+
+        assert asyncio.run(ActionAsync().run(Mock(), Mock(), {})) == ["done"]
+        assert metrics.ACTION_LATENCY.series[("action_test_async",)][2] >= 1
+
+    def test_http_time_is_attributed_to_action(self, monkeypatch):
+        monkeypatch.setattr(metrics.requests, "get", lambda url, **kwargs: Mock(status_code=200))
+
+        class ActionHttp(ActionMetricsMixin, Action):
+            def name(self):
+                return "action_test_http"
+
+            def run(self, dispatcher, tracker, domain):
+                metrics.http_get("https://cdn-api.co-vin.in/api/v2/x", timeout=5)
+                return []
+
+        ActionHttp().run(Mock(), Mock(), {})
+        assert ("action_test_http", "cdn-api.co-vin.in") in metrics.ACTION_HTTP_LATENCY.series
@@ -11,19 +11,36 @@ Disclaimer: This is not medical advice. Please consult a doctor.
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import (
-    JWTManager, create_access_token, jwt_required, get_jwt_identity
+    JWTManager, create_access_token, current_user, jwt_required, get_jwt_identity
 )
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func
-from passlib.hash import bcrypt
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 import json
+import math
 import re
 import os
+import threading
+import time
+import zlib
 from datetime import datetime, timedelta
 import requests
 
+from compression import PrecompressedResponse, ResponseCompression
+from json_provider import json_provider
+from migrate import upgrade_database
+from password_hashing import (
+    AUTH_EMAIL_BURST, AUTH_EMAIL_PER_MINUTE, AUTH_IP_BURST, AUTH_IP_PER_MINUTE,
+    HasherBusy, PasswordHasher, TokenBucket,
+)
+from symptom_index import SymptomIndex
+from symptom_normalizer import NORMALIZER
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
+app.json = json_provider(app)
+ResponseCompression(app)  # gzip/brotli for larger text responses
 
 # Configuration
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'dev-secret')
@@ -37,6 +54,9 @@ db = SQLAlchemy(app)
 # Constants
 DISCLAIMER = "This is not medical advice. Please consult a doctor."
 
+# bcrypt runs on its own bounded pool; see password_hashing.py
+PASSWORD_HASHER = PasswordHasher()
+
 # Models
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -45,10 +65,10 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def set_password(self, password: str):
-        self.password_hash = bcrypt.hash(password)
+        self.password_hash = PASSWORD_HASHER.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return bcrypt.verify(password, self.password_hash)
+        return PASSWORD_HASHER.verify(password, self.password_hash)
 
 
 class BlogPost(db.Model):
@@ -67,6 +87,8 @@ class HealthTip(db.Model):
     locale = db.Column(db.String(10), default='en')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (db.Index('ix_health_tip_locale_id', 'locale', 'id'),)
+
 
 class FAQ(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -87,8 +109,20 @@ class Reminder(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     vaccine = db.Column(db.String(100), nullable=False)
     due_date = db.Column(db.DateTime, nullable=False)
-    contact = db.Column(db.String(255), nullable=True)  # email or push token
+    contact = db.Column(db.String(255), nullable=True)  # phone, whatsapp:<phone>, email or push:<token>
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Delivery state, maintained by reminder_dispatch.py
+    status = db.Column(db.String(10), nullable=False, default='pending', server_default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    next_attempt_at = db.Column(db.DateTime, nullable=True)  # claim lease / retry backoff
+    sent_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.String(255), nullable=True)
+
+    __table_args__ = (
+        # Due pending reminders are found by an index range scan, however many were already sent
+        db.Index('ix_reminder_status_due', 'status', 'due_date'),
+        db.Index('ix_reminder_user_due', 'user_id', 'due_date'),
+    )
 
 
 class OutbreakAlert(db.Model):
@@ -108,6 +142,9 @@ class HealthProfile(db.Model):
     conditions = db.Column(db.String(300), default='')
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # One profile per user
+    __table_args__ = (db.Index('uq_health_profile_user_id', 'user_id', unique=True),)
+
 
 class HealthDiaryEntry(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -116,12 +153,26 @@ class HealthDiaryEntry(db.Model):
     notes = db.Column(db.Text, default='')
     symptoms = db.Column(db.String(300), default='')
 
+    __table_args__ = (db.Index('ix_health_diary_entry_user_date', 'user_id', 'date'),)
+
 
 class ForumPost(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    is_approved = db.Column(db.Boolean, default=True)
+    # Published once forum_moderation.py approves it
+    is_approved = db.Column(db.Boolean, default=False)
+    moderation_status = db.Column(db.String(10), nullable=False, default='pending', server_default='pending')
+    moderated_at = db.Column(db.DateTime, nullable=True)
+    moderation_reason = db.Column(db.String(120), nullable=True)
+    simhash = db.Column(db.BigInteger, nullable=True)  # near-duplicate fingerprint
+
+    __table_args__ = (
+        # Approved posts newest first, walked by (created_at, id) keyset cursors
+        db.Index('ix_forum_post_approved_created', 'is_approved', 'created_at', 'id'),
+        # Moderation queue, oldest first
+        db.Index('ix_forum_post_moderation', 'moderation_status', 'id'),
+    )
 
 # Simple health knowledge base
 HEALTH_KNOWLEDGE = {
@@ -163,13 +214,19 @@ HEALTH_KNOWLEDGE = {
     }
 }
 
+# Canonical symptom ID -> HEALTH_KNOWLEDGE key ('stomach pain' is 'abdominal pain')
+KNOWLEDGE_KEYS = {NORMALIZER.canonical(key): key for key in HEALTH_KNOWLEDGE}
+
+EMERGENCY_SYMPTOMS = {'chest pain', 'heart attack', 'stroke', 'shortness of breath'}
+
 def analyze_symptoms(message):
     """Analyze user message for symptoms and provide appropriate response"""
     message_lower = message.lower()
+    symptoms = NORMALIZER.symptoms(message)
     
     # Check for emergency keywords
-    emergency_keywords = ['chest pain', 'heart attack', 'stroke', 'severe', 'emergency', 'can\'t breathe']
-    if any(keyword in message_lower for keyword in emergency_keywords):
+    emergency_keywords = ['severe', 'emergency']
+    if EMERGENCY_SYMPTOMS.intersection(symptoms) or any(keyword in message_lower for keyword in emergency_keywords):
         return {
             'response': '🚨 EMERGENCY ALERT: If you are experiencing severe symptoms, please call emergency services (911) immediately or go to the nearest emergency room. This is not a substitute for emergency medical care.',
             'type': 'emergency',
@@ -177,8 +234,9 @@ def analyze_symptoms(message):
         }
     
     # Check for specific symptoms
-    for symptom, info in HEALTH_KNOWLEDGE.items():
-        if symptom in message_lower:
+    for symptom in map(KNOWLEDGE_KEYS.get, symptoms):
+        if symptom:
+            info = HEALTH_KNOWLEDGE[symptom]
             return {
                 'response': f"**{symptom.title()} Information:**\n\n{info['description']}\n\n**Self-care advice:** {info['advice']}\n\n**When to see a doctor:** {info['when_to_see_doctor']}",
                 'type': 'symptom_info',
@@ -301,18 +359,22 @@ def get_suggestions(response_type):
     
     return suggestions.get(response_type, ["How can I help you further?"])
 
+SYMPTOM_LIST = PrecompressedResponse(app.json.dumps({
+    'symptoms': list(HEALTH_KNOWLEDGE.keys()),
+    'count': len(HEALTH_KNOWLEDGE)
+}).encode())
+
+
 @app.route('/api/symptoms', methods=['GET'])
 def get_symptoms():
     """Get list of supported symptoms"""
-    return jsonify({
-        'symptoms': list(HEALTH_KNOWLEDGE.keys()),
-        'count': len(HEALTH_KNOWLEDGE)
-    })
+    return SYMPTOM_LIST.response()
 
 @app.route('/api/symptom/<symptom_name>', methods=['GET'])
 def get_symptom_info(symptom_name):
     """Get detailed information about a specific symptom"""
-    symptom = HEALTH_KNOWLEDGE.get(symptom_name.lower())
+    key = KNOWLEDGE_KEYS.get(NORMALIZER.canonical(symptom_name), symptom_name.lower())
+    symptom = HEALTH_KNOWLEDGE.get(key)
     if not symptom:
         return jsonify({
             'error': 'Symptom not found'
@@ -326,6 +388,57 @@ def get_symptom_info(symptom_name):
 
 
 # ---------- Auth ----------
+def insert_on_conflict(table):
+    """INSERT that supports ON CONFLICT clauses on SQLite or PostgreSQL; None on other databases"""
+    dialect = {'sqlite': sqlite, 'postgresql': postgresql}.get(db.engine.dialect.name)
+    return dialect.insert(table) if dialect else None
+
+
+def insert_user(email, password_hash):
+    """The new user's id, or None if the email is taken"""
+    statement = insert_on_conflict(User)
+    if statement is not None:
+        # One round trip: the unique email decides, no check-then-insert race
+        user_id = db.session.execute(
+            statement.values(email=email, password_hash=password_hash)
+            .on_conflict_do_nothing(index_elements=['email'])
+            .returning(User.id)
+        ).scalar()
+        db.session.commit()
+        return user_id
+    if db.session.execute(select(User.id).where(User.email == email)).first():
+        return None
+    try:
+        result = db.session.execute(insert(User.__table__).values(email=email, password_hash=password_hash))
+        db.session.commit()
+    except IntegrityError:  # a concurrent signup took the email
+        db.session.rollback()
+        return None
+    return result.inserted_primary_key[0]
+
+
+AUTH_IP_ATTEMPTS = TokenBucket(AUTH_IP_BURST, AUTH_IP_PER_MINUTE)
+AUTH_EMAIL_ATTEMPTS = TokenBucket(AUTH_EMAIL_BURST, AUTH_EMAIL_PER_MINUTE)
+
+
+def auth_throttled(email=None):
+    """429 response if this client (or account) is out of auth attempts, else None"""
+    wait = AUTH_IP_ATTEMPTS.take(request.remote_addr or '')
+    if not wait and email:
+        wait = AUTH_EMAIL_ATTEMPTS.take(email)
+    if not wait:
+        return None
+    response = jsonify({'error': 'too many attempts, try again later'})
+    response.headers['Retry-After'] = str(math.ceil(min(wait, 3600)))
+    return response, 429
+
+
+def hasher_busy():
+    response = jsonify({'error': 'server busy, try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+
 @app.post('/api/auth/signup')
 def signup():
     data = request.get_json() or {}
@@ -333,13 +446,17 @@ def signup():
     password = (data.get('password') or '').strip()
     if not email or not password:
         return jsonify({'error': 'email and password required'}), 400
-    if User.query.filter_by(email=email).first():
+    throttled = auth_throttled()
+    if throttled:
+        return throttled
+    try:
+        password_hash = PASSWORD_HASHER.hash(password)
+    except HasherBusy:
+        return hasher_busy()
+    user_id = insert_user(email, password_hash)
+    if user_id is None:
         return jsonify({'error': 'email already registered'}), 409
-    user = User(email=email)
-    user.set_password(password)
-    db.session.add(user)
-    db.session.commit()
-    token = create_access_token(identity=str(user.id))
+    token = create_access_token(identity=str(user_id))
     return jsonify({'accessToken': token})
 
 
@@ -348,9 +465,22 @@ def login():
     data = request.get_json() or {}
     email = (data.get('email') or '').strip().lower()
     password = (data.get('password') or '').strip()
+    throttled = auth_throttled(email)
+    if throttled:
+        return throttled
     user = User.query.filter_by(email=email).first()
-    if not user or not user.check_password(password):
-        return jsonify({'error': 'invalid credentials'}), 401
+    # Don't hold a DB connection while bcrypt runs (the loaded user stays usable)
+    db.session.close()
+    try:
+        if not user or not user.check_password(password):
+            return jsonify({'error': 'invalid credentials'}), 401
+        if PASSWORD_HASHER.needs_update(user.password_hash):
+            # BCRYPT_ROUNDS changed since this hash was made
+            user.set_password(password)
+            db.session.add(user)
+            db.session.commit()
+    except HasherBusy:
+        return hasher_busy()
     token = create_access_token(identity=str(user.id))
     return jsonify({'accessToken': token})
 
@@ -424,33 +554,115 @@ def delete_post(post_id: int):
     return jsonify({'status': 'deleted'})
 
 
-# ---------- Symptom Checker (rule + simple mapping) ----------
-DISEASE_RULES = {
-    'flu': {'symptoms': {'fever', 'cough', 'sore throat', 'fatigue'}},
-    'dengue': {'symptoms': {'fever', 'rash', 'joint pain', 'headache'}},
-    'malaria': {'symptoms': {'fever', 'chills', 'sweats', 'headache'}},
-}
+# ---------- Symptom Checker (weighted condition index) ----------
+SYMPTOM_INDEX = SymptomIndex.from_json()
+
+
+def checker_symptoms(names):
+    """
+    Symptom names as index symptoms: 'bukhar' -> 'fever'; unmatched names are kept as given
+
+    Names already in the index are used as they are, so the normalizer can't
+    coarsen specific ones ('watery diarrhea' stays, not 'diarrhea').
+    """
+    symptoms = []
+    for name in names:
+        if name.strip().lower() in SYMPTOM_INDEX.symptom_ids:
+            symptoms.append(name)
+            continue
+        known = [s for s in NORMALIZER.symptoms(name) if s in SYMPTOM_INDEX.symptom_ids]
+        symptoms.extend(known or [name])
+    return symptoms
 
 
 @app.post('/api/symptom-checker')
 def symptom_checker():
     data = request.get_json() or {}
-    input_symptoms = {s.strip().lower() for s in (data.get('symptoms') or []) if s.strip()}
+    input_symptoms = data.get('symptoms') or []
+    if not isinstance(input_symptoms, list) or not all(isinstance(s, str) for s in input_symptoms):
+        return jsonify({'error': 'symptoms must be an array of strings'}), 400
+    input_symptoms = [s for s in input_symptoms if s.strip()]
     if not input_symptoms:
         return jsonify({'error': 'symptoms array required'}), 400
-    matches = []
-    for disease, conf in DISEASE_RULES.items():
-        overlap = input_symptoms & conf['symptoms']
-        if overlap:
-            score = round(len(overlap) / len(conf['symptoms']), 2)
-            matches.append({'condition': disease, 'score': score})
-    matches.sort(key=lambda m: m['score'], reverse=True)
+    try:
+        top_k = max(1, min(int(data.get('top_k', 5)), 50))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'top_k must be an integer'}), 400
+    matches, unknown = SYMPTOM_INDEX.top_k(checker_symptoms(input_symptoms), top_k)
     return jsonify({
         'possible_conditions': matches,
+        'unrecognized_symptoms': unknown,
         'disclaimer': DISCLAIMER
     })
 
 
+# ---------- Signed-in user ----------
+# Profile changes saved by other processes show up here within this time
+USER_CACHE_TTL = 60
+
+PROFILE_FIELDS = ('age', 'gender', 'weight_kg', 'conditions')
+
+
+class UserCache:
+    """
+    Per-process cache of signed-in users and their health profiles, keyed by
+    user id. A miss loads both in one query. Profile saves in this process
+    update the entry; other processes see them once it expires.
+    """
+
+    MAX_USERS = 10_000
+
+    def __init__(self, ttl=USER_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        """{'id', 'email', 'profile'} for the user (read-only), or None if there is no such user"""
+        entry = self._entries.get(user_id)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        row = db.session.execute(
+            select(User.id, User.email, HealthProfile.id.label('profile_id'),
+                   *(getattr(HealthProfile, name) for name in PROFILE_FIELDS))
+            .outerjoin(HealthProfile, HealthProfile.user_id == User.id)
+            .where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+        profile = {name: getattr(row, name) for name in PROFILE_FIELDS} if row.profile_id else {}
+        user = {'id': row.id, 'email': row.email, 'profile': profile}
+        self._store(user_id, user)
+        return user
+
+    def set_profile(self, user_id, profile):
+        entry = self._entries.get(user_id)
+        if entry:
+            self._store(user_id, {**entry[1], 'profile': profile})
+
+    def _store(self, user_id, user):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.MAX_USERS:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                if len(self._entries) >= self.MAX_USERS:
+                    self._entries = {}
+            self._entries[user_id] = (now + self.ttl, user)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+
+USER_CACHE = UserCache()
+
+
+@jwt.user_lookup_loader
+def load_current_user(_jwt_header, jwt_data):
+    # Tokens of users that no longer exist are rejected with 401
+    return USER_CACHE.get(int(jwt_data['sub']))
+
+
 # ---------- Vaccination Reminders ----------
 @app.get('/api/reminders')
 @jwt_required()
@@ -459,7 +671,8 @@ def list_reminders():
     reminders = Reminder.query.filter_by(user_id=user_id).order_by(Reminder.due_date.asc()).all()
     return jsonify([
         {
-            'id': r.id, 'vaccine': r.vaccine, 'due_date': r.due_date.isoformat(), 'contact': r.contact
+            'id': r.id, 'vaccine': r.vaccine, 'due_date': r.due_date.isoformat(), 'contact': r.contact,
+            'status': r.status
         } for r in reminders
     ])
 
@@ -475,7 +688,7 @@ def create_reminder():
     r = Reminder(user_id=user_id, vaccine=data['vaccine'], due_date=due, contact=data.get('contact'))
     db.session.add(r)
     db.session.commit()
-    # Stub: send email/push via Firebase/SES, etc.
+    # Delivered by the reminder dispatcher (python reminder_dispatch.py) once due
     return jsonify({'id': r.id}), 201
 
 
@@ -508,6 +721,12 @@ def get_alerts():
 
 
 # ---------- Hospitals Finder (Google Places proxy) ----------
+DEMO_HOSPITALS = PrecompressedResponse(app.json.dumps({'hospitals': [
+    {'name': 'City Care Hospital', 'address': 'Sector 21, Delhi', 'location': {'lat': 28.6, 'lng': 77.2}},
+    {'name': 'Metro Health Clinic', 'address': 'Noida Phase 2', 'location': {'lat': 28.5, 'lng': 77.3}},
+]}).encode())
+
+
 @app.get('/api/hospitals')
 def hospitals():
     # Accept lat,lng; for demo, return static list if API key missing
@@ -532,10 +751,7 @@ def hospitals():
         except Exception as e:
             pass
     # Fallback demo data
-    return jsonify({'hospitals': [
-        {'name': 'City Care Hospital', 'address': 'Sector 21, Delhi', 'location': {'lat': 28.6, 'lng': 77.2}},
-        {'name': 'Metro Health Clinic', 'address': 'Noida Phase 2', 'location': {'lat': 28.5, 'lng': 77.3}},
-    ]})
+    return DEMO_HOSPITALS.response()
 
 
 # ---------- FAQ / Tips / Myths ----------
@@ -545,13 +761,76 @@ def list_faq():
     return jsonify([{'id': i.id, 'question': i.question, 'answer': i.answer} for i in items])
 
 
+class DailyTips:
+    """
+    Tip of the day per locale, picked by a stable hash of (date, locale) over
+    the locale's tips in id order; each pick is read from the DB once per day
+    per process, so every worker shows the same tip
+
+    Locales without tips are served the 'en' tip and share its cache entry, so
+    only locales that have tips are ever cached and junk ?locale= values cost nothing.
+    """
+
+    DEFAULT = {'tip': 'Stay hydrated and take a 10-minute walk today.'}
+
+    def __init__(self):
+        # (day, locales with tips, picks by locale), replaced whole on a new day
+        self._today = None
+        self._lock = threading.Lock()
+
+    def get(self, locale='en', day=None):
+        day = day or datetime.utcnow().date()
+        today = self._today
+        if today is None or today[0] != day:
+            with self._lock:
+                today = self._today
+                if today is None or today[0] != day:
+                    today = self._today = (day, frozenset(self.locales()), {})
+        _, locales, picks = today
+        if locale not in locales:
+            locale = 'en'
+        tip = picks.get(locale)
+        if tip is None:
+            tip = self.pick(day, locale) or (locale != 'en' and self.pick(day, 'en')) or self.DEFAULT
+            picks[locale] = tip
+        return tip
+
+    @staticmethod
+    def locales():
+        """Locales that have tips, by a loose index scan: one index seek per locale"""
+        found = []
+        while True:
+            query = select(func.min(HealthTip.locale))
+            if found:
+                query = query.where(HealthTip.locale > found[-1])
+            locale = db.session.execute(query).scalar()
+            if locale is None:
+                return found
+            found.append(locale)
+
+    @staticmethod
+    def pick(day, locale):
+        tips = HealthTip.query.filter_by(locale=locale)
+        count = tips.count()
+        if not count:
+            return None
+        offset = zlib.crc32(f'{day.isoformat()}:{locale}'.encode()) % count
+        tip = tips.order_by(HealthTip.id).offset(offset).first()
+        return {'tip': tip.text, 'locale': tip.locale}
+
+    def clear(self):
+        with self._lock:
+            self._today = None
+
+
+DAILY_TIPS = DailyTips()
+
+
 @app.get('/api/tips/daily')
 def daily_tip():
-    # Pick one random tip deterministically by date
-    tip = HealthTip.query.order_by(func.random()).first()
-    if not tip:
-        return jsonify({'tip': 'Stay hydrated and take a 10-minute walk today.'})
-    return jsonify({'tip': tip.text, 'locale': tip.locale})
+    # Pick one tip deterministically by date (and locale)
+    locale = (request.args.get('locale') or 'en').strip().lower()[:10]
+    return jsonify(DAILY_TIPS.get(locale))
 
 
 @app.get('/api/myths/check')
@@ -566,30 +845,50 @@ def check_myth():
 
 
 # ---------- Profiles / Diary ----------
+def save_profile(user_id, fields):
+    """Update the user's profile with `fields`, creating it on the first save; returns the saved row"""
+    t = HealthProfile.__table__
+    saved_fields = [t.c[name] for name in PROFILE_FIELDS]
+    changed = update(t).where(t.c.user_id == user_id).values(updated_at=datetime.utcnow(), **fields)
+    statement = insert_on_conflict(t)
+    if statement is None:
+        # No ON CONFLICT (or RETURNING) here: update, else insert, then read the row back
+        if not db.session.execute(changed).rowcount:
+            try:
+                db.session.execute(insert(t).values(user_id=user_id, updated_at=datetime.utcnow(), **fields))
+                db.session.commit()
+            except IntegrityError:  # a concurrent first save got there first
+                db.session.rollback()
+                db.session.execute(changed)
+        saved = db.session.execute(select(*saved_fields).where(t.c.user_id == user_id)).one()
+        db.session.commit()
+        return saved
+    saved = db.session.execute(changed.returning(*saved_fields)).first()
+    if saved is None:
+        # First save; the unique user_id settles a race with a concurrent first save
+        saved = db.session.execute(
+            statement.values(user_id=user_id, **fields)
+            .on_conflict_do_update(index_elements=['user_id'], set_={**fields, 'updated_at': datetime.utcnow()})
+            .returning(*saved_fields)
+        ).one()
+    db.session.commit()
+    return saved
+
+
 @app.get('/api/profile')
 @jwt_required()
 def get_profile():
-    user_id = int(get_jwt_identity())
-    p = HealthProfile.query.filter_by(user_id=user_id).first()
-    if not p:
-        return jsonify({})
-    return jsonify({'age': p.age, 'gender': p.gender, 'weight_kg': p.weight_kg, 'conditions': p.conditions})
+    return jsonify(current_user['profile'])
 
 
 @app.post('/api/profile')
 @jwt_required()
 def upsert_profile():
-    user_id = int(get_jwt_identity())
+    user_id = current_user['id']
     data = request.get_json() or {}
-    p = HealthProfile.query.filter_by(user_id=user_id).first()
-    if not p:
-        p = HealthProfile(user_id=user_id)
-        db.session.add(p)
-    p.age = data.get('age', p.age)
-    p.gender = data.get('gender', p.gender)
-    p.weight_kg = data.get('weight_kg', p.weight_kg)
-    p.conditions = data.get('conditions', p.conditions)
-    db.session.commit()
+    fields = {name: data[name] for name in PROFILE_FIELDS if name in data}
+    saved = save_profile(user_id, fields)
+    USER_CACHE.set_profile(user_id, dict(saved._mapping))
     return jsonify({'status': 'saved'})
 
 
@@ -617,13 +916,71 @@ def add_diary():
 
 
 # ---------- Forum (anonymous) ----------
+FORUM_PAGE_SIZE = 50
+
+# Posts published by the moderation workers show up on cached first pages within this time
+FORUM_FIRST_PAGE_TTL = 30
+
+
+def forum_cursor(post):
+    return f'{post.created_at.isoformat()}_{post.id}'
+
+
+def parse_forum_cursor(cursor):
+    """(created_at, id) of the last post on the previous page; ValueError if malformed"""
+    created_at, _, post_id = cursor.rpartition('_')
+    return datetime.fromisoformat(created_at), int(post_id)
+
+
+def forum_page(before=None, limit=FORUM_PAGE_SIZE):
+    """Approved posts older than the before cursor, newest first"""
+    query = ForumPost.query.filter_by(is_approved=True)
+    if before:
+        # Row-value comparison, so the index range starts at the cursor
+        query = query.filter(tuple_(ForumPost.created_at, ForumPost.id) < tuple_(*before))
+    posts = query.order_by(ForumPost.created_at.desc(), ForumPost.id.desc()).limit(limit + 1).all()
+    return {
+        'posts': [
+            {'id': p.id, 'content': p.content, 'created_at': p.created_at.isoformat()}
+            for p in posts[:limit]
+        ],
+        'next_cursor': forum_cursor(posts[limit - 1]) if len(posts) > limit else None,
+    }
+
+
+class ForumFirstPage:
+    """The default first forum page, rebuilt once the TTL passes or on invalidate()"""
+
+    def __init__(self, ttl=FORUM_FIRST_PAGE_TTL):
+        self.ttl = ttl
+        self._page = None
+        self._expires = 0.0
+
+    def get(self):
+        page = self._page
+        if page is None or time.monotonic() >= self._expires:
+            page = forum_page()
+            self._page, self._expires = page, time.monotonic() + self.ttl
+        return page
+
+    def invalidate(self):
+        self._page = None
+
+
+FORUM_FIRST_PAGE = ForumFirstPage()
+
+
 @app.get('/api/forum')
 def list_forum():
-    posts = ForumPost.query.order_by(ForumPost.created_at.desc()).limit(50).all()
-    return jsonify([
-        {'id': p.id, 'content': p.content, 'created_at': p.created_at.isoformat()}
-        for p in posts if p.is_approved
-    ])
+    limit = max(1, min(request.args.get('limit', FORUM_PAGE_SIZE, type=int), 100))
+    before = request.args.get('before')
+    if not before and limit == FORUM_PAGE_SIZE:
+        return jsonify(FORUM_FIRST_PAGE.get())
+    try:
+        cursor = parse_forum_cursor(before) if before else None
+    except ValueError:
+        return jsonify({'error': 'invalid cursor'}), 400
+    return jsonify(forum_page(cursor, limit))
 
 
 @app.post('/api/forum')
@@ -631,10 +988,11 @@ def create_forum():
     data = request.get_json() or {}
     if not data.get('content'):
         return jsonify({'error': 'content required'}), 400
+    # Queued for forum_moderation.py, which publishes it if it passes
     p = ForumPost(content=data['content'][:1000])
     db.session.add(p)
     db.session.commit()
-    return jsonify({'id': p.id}), 201
+    return jsonify({'id': p.id, 'status': 'pending'}), 202
 
 if __name__ == '__main__':
     print("🏥 FalconCare Backend Starting...")
@@ -646,7 +1004,7 @@ if __name__ == '__main__':
     print("Auth: http://localhost:5001/api/auth/signup | /login")
     print("=" * 40)
     with app.app_context():
-        db.create_all()
+        upgrade_database(db.engine, db.metadata)
         # Seed minimal data if empty
         if not FAQ.query.first():
             faqs = [
@@ -0,0 +1,115 @@
+"""
+FalconCare response compression
+
+Rural clients are often on 2G/3G, where bytes on the wire dominate response
+time. Text responses larger than COMPRESS_MIN_SIZE are compressed with brotli
+or gzip, whichever the client's Accept-Encoding prefers (brotli on ties, when
+the brotli package is installed). Smaller bodies would gain less than the
+gzip/brotli framing and the CPU cost.
+
+Responses that never change are compressed once, at the highest levels,
+by PrecompressedResponse.
+"""
+
+import gzip
+import hashlib
+import os
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only
+    brotli = None
+
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '512'))
+GZIP_LEVEL = int(os.getenv('COMPRESS_GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', '4'))
+
+COMPRESSIBLE_TYPES = {'application/json', 'application/javascript', 'image/svg+xml'}
+
+ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+
+def negotiate(accept_encoding, available=ENCODINGS):
+    """The content coding to use from `available` for an Accept-Encoding header, or None"""
+    weights = {}
+    for part in accept_encoding.lower().split(','):
+        coding, _, params = part.partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding.strip():
+            weights[coding.strip()] = q
+    best, best_q = None, 0.0
+    for coding in available:  # in order of preference
+        q = weights.get(coding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body, coding, gzip_level=GZIP_LEVEL, brotli_quality=BROTLI_QUALITY):
+    if coding == 'br':
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def compressible(response):
+    mimetype = response.mimetype or ''
+    return (
+        200 <= response.status_code < 300 and response.status_code != 204
+        and not response.direct_passthrough and not response.is_streamed
+        and 'Content-Encoding' not in response.headers
+        and (mimetype.startswith('text/') or mimetype in COMPRESSIBLE_TYPES)
+    )
+
+
+class ResponseCompression:
+    """after_request hook compressing the app's text responses"""
+
+    def __init__(self, app, min_size=COMPRESS_MIN_SIZE):
+        self.min_size = min_size
+        app.after_request(self.compress)
+
+    def compress(self, response):
+        if not compressible(response):
+            return response
+        response.vary.add('Accept-Encoding')
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return response
+        coding = negotiate(request.headers.get('Accept-Encoding', ''))
+        if coding:
+            response.set_data(compress(body, coding))
+            response.headers['Content-Encoding'] = coding
+        return response
+
+
+class PrecompressedResponse:
+    """
+    A fixed body, compressed once per content coding at the highest level
+    and served with an ETag, so clients that have it get a bodiless 304
+    """
+
+    def __init__(self, body, mimetype='application/json'):
+        self.mimetype = mimetype
+        self.etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        self.bodies = {None: body}
+        if len(body) >= COMPRESS_MIN_SIZE:
+            for coding in ENCODINGS:
+                self.bodies[coding] = compress(body, coding, gzip_level=9, brotli_quality=11)
+
+    def response(self):
+        coding = negotiate(request.headers.get('Accept-Encoding', ''), [c for c in self.bodies if c])
+        response = current_app.response_class(self.bodies[coding], mimetype=self.mimetype)
+        response.vary.add('Accept-Encoding')
+        response.set_etag(f'{self.etag}-{coding}' if coding else self.etag)
+        if coding:
+            response.headers['Content-Encoding'] = coding
+        return response.make_conditional(request)
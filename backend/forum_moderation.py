@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+FalconCare forum moderation
+Background workers that publish queued forum posts once they pass moderation
+
+create_forum only inserts the post as 'pending'. Workers claim pending posts
+in batches through the (moderation_status, id) index. On PostgreSQL the
+claim uses FOR UPDATE SKIP LOCKED; on SQLite the claiming UPDATE runs under
+the write lock. Each batch then goes through three checks:
+
+- profanity is rejected, and phone numbers, emails and Aadhaar numbers are
+  redacted (the forum is anonymous)
+- near-duplicates of recent posts are rejected as spam; the check compares
+  64-bit SimHash fingerprints banded for lookup
+- posts repeating a known myth are held as 'flagged' for human review
+
+Everything else is approved and published. Any number of worker processes
+can run without moderating a post twice. They share only the database, so on
+SQLite they take turns on its write lock and one worker is as fast as several.
+
+Usage: python forum_moderation.py [workers] [poll_seconds]
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import sqlalchemy as sa
+
+from app import app, db, ForumPost, Myth
+from migrate import upgrade_database
+from symptom_normalizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv('FORUM_MODERATION_BATCH_SIZE', '200'))
+WORKERS = int(os.getenv('FORUM_MODERATION_WORKERS', '2'))
+# Claimed posts not recorded within this time (worker died) go back to the queue
+LEASE_SECONDS = 300
+# How many recent posts each post is compared with for near-duplicates
+RECENT_POSTS = 10_000
+# SimHash bits that may differ between near-duplicates (at most 3: one of 4 bands must match)
+MAX_DISTANCE = 3
+# Posts shorter than this ("thank you", "same here") are never treated as spam
+MIN_DEDUP_TOKENS = 5
+
+PROFANITY = frozenset([
+    'fuck', 'fucking', 'shit', 'bitch', 'bastard', 'asshole', 'dick', 'cunt',
+    'chutiya', 'madarchod', 'behenchod', 'bhenchod', 'bhosdike', 'harami', 'gandu', 'randi',
+    'चूतिया', 'मादरचोद', 'बहनचोद', 'हरामी', 'गांडू', 'रंडी',
+])
+
+PII_PATTERNS = [
+    ('phone', re.compile(r'(?<!\d)(?:\+?91[\s-]?)?[6-9]\d{4}[\s-]?\d{5}(?!\d)')),
+    ('email', re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')),
+    ('aadhaar', re.compile(r'(?<!\d)\d{4}[\s-]?\d{4}[\s-]?\d{4}(?!\d)')),
+]
+
+
+def redact_pii(text):
+    """(text with personal details replaced, kinds of details found)"""
+    found = []
+    for kind, pattern in PII_PATTERNS:
+        text, n = pattern.subn(f'[{kind} removed]', text)
+        if n:
+            found.append(kind)
+    return text, found
+
+
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little')
+
+
+_BIT = np.uint64(1) << np.arange(64, dtype=np.uint64)
+
+
+def simhash(tokens):
+    """64-bit SimHash over word unigrams and bigrams, as a signed int for the BIGINT column"""
+    features = tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+    if not features:
+        return 0
+    hashes = np.fromiter(map(_token_hash, features), dtype=np.uint64, count=len(features))
+    bits = (hashes[:, None] & _BIT) != 0
+    votes = bits.sum(axis=0) * 2 > len(features)
+    value = int((votes.astype(np.uint64) * _BIT).sum())
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+_MASK = (1 << 64) - 1
+
+
+def hamming(a, b):
+    return ((a ^ b) & _MASK).bit_count()
+
+
+class SimHashIndex:
+    """
+    Near-duplicate lookup: fingerprints within MAX_DISTANCE bits share at least
+    one of four 16-bit bands exactly, so only same-band entries are compared
+
+    Fingerprints are indexed with their post id, so a post retried after its
+    outcome failed to save is not a duplicate of itself.
+    """
+
+    BANDS = 4
+
+    def __init__(self, fingerprints=()):
+        self.bands = [{} for _ in range(self.BANDS)]
+        for fingerprint in fingerprints:
+            self.add(fingerprint)
+
+    def add(self, fingerprint, post_id=None):
+        fingerprint &= _MASK
+        for i, band in enumerate(self.bands):
+            band.setdefault((fingerprint >> (16 * i)) & 0xFFFF, []).append((fingerprint, post_id))
+
+    def near(self, fingerprint, max_distance=MAX_DISTANCE, post_id=None):
+        """
+        Whether a fingerprint within max_distance (at most MAX_DISTANCE) bits
+        is indexed for a post other than post_id
+        """
+        fingerprint &= _MASK
+        for i, band in enumerate(self.bands):
+            for other, other_id in band.get((fingerprint >> (16 * i)) & 0xFFFF, ()):
+                if (fingerprint ^ other).bit_count() <= max_distance and (post_id is None or other_id != post_id):
+                    return True
+        return False
+
+
+class MythDetector:
+    """Known myth claims, matched as one alternation in a single pass per post"""
+
+    def __init__(self, claims):
+        claims = sorted({c.strip().lower() for c in claims if c.strip()}, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(map(re.escape, claims))) if claims else None
+
+    def match(self, text):
+        found = self.pattern.search(text.lower()) if self.pattern else None
+        return found.group(0) if found else None
+
+
+def moderate(posts, myths, recent):
+    """
+    Outcome dicts for a batch of (id, content) posts
+
+    recent is the SimHashIndex of recent posts; this batch's fingerprints are
+    added to it, so duplicates within the batch are caught too. Posts too
+    short to dedup get no fingerprint.
+    """
+    outcomes = []
+    for post_id, content in posts:
+        tokens = tokenize(content)
+        fingerprint = simhash(tokens) if len(tokens) >= MIN_DEDUP_TOKENS else None
+        outcome = {'pid': post_id, 'content': content, 'simhash': fingerprint, 'approved': False, 'reason': None}
+        if PROFANITY.intersection(tokens):
+            outcome.update(status='rejected', reason='profanity')
+        elif fingerprint is not None and recent.near(fingerprint, post_id=post_id):
+            outcome.update(status='rejected', reason='duplicate')
+        else:
+            content, pii = redact_pii(content)
+            myth = myths.match(content)
+            if myth:
+                outcome.update(status='flagged', reason=f'myth: {myth}'[:120])
+            else:
+                outcome.update(status='approved', approved=True, reason=f"redacted: {', '.join(pii)}" if pii else None)
+            outcome['content'] = content
+        if fingerprint is not None:
+            recent.add(fingerprint, post_id)
+        outcomes.append(outcome)
+    return outcomes
+
+
+class ForumModerator:
+    def __init__(self, engine, batch_size=BATCH_SIZE, lease_seconds=LEASE_SECONDS, recent_posts=RECENT_POSTS):
+        self.engine = engine
+        self.table = ForumPost.__table__
+        self.batch_size = batch_size
+        self.lease = timedelta(seconds=lease_seconds)
+        self.recent_posts = recent_posts
+        self.recent = None
+        self.indexed = set()
+        # Posts below this id are moderated and already in self.recent
+        self.indexed_below = None
+        self.stats = {'approved': 0, 'rejected': 0, 'flagged': 0}
+
+    def claim(self, connection, now):
+        t = self.table
+        queued = (
+            sa.select(t.c.id)
+            .where(t.c.moderation_status == 'pending')
+            .order_by(t.c.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return connection.execute(
+            sa.update(t)
+            .where(t.c.id.in_(queued.scalar_subquery()))
+            .values(moderation_status='reviewing', moderated_at=now)
+            .returning(t.c.id, t.c.content)
+        ).all()
+
+    def release_stale(self, connection, now):
+        """Return claims of workers that died mid-batch to the queue"""
+        t = self.table
+        connection.execute(
+            sa.update(t)
+            .where(t.c.moderation_status == 'reviewing', t.c.moderated_at < now - self.lease)
+            .values(moderation_status='pending')
+        )
+
+    def load_context(self, connection):
+        """
+        Myth detector and the SimHash index of recent posts
+
+        The index is kept across batches. Each batch only loads fingerprints
+        from the lowest id still queued or under review (other workers may
+        have finished posts below this worker's last batch since) onwards,
+        and it is rebuilt from the latest recent_posts once it holds twice that.
+        """
+        myths = MythDetector(connection.execute(sa.select(Myth.__table__.c.claim)).scalars())
+        t = self.table
+        fingerprinted = sa.select(t.c.id, t.c.simhash).where(t.c.simhash.is_not(None))
+        if self.recent is None or len(self.indexed) > 2 * self.recent_posts:
+            self.recent, self.indexed = SimHashIndex(), set()
+            rows = connection.execute(fingerprinted.order_by(t.c.id.desc()).limit(self.recent_posts))
+        else:
+            rows = connection.execute(fingerprinted.where(t.c.id >= self.indexed_below))
+        for post_id, fingerprint in rows:
+            if post_id not in self.indexed:
+                self.recent.add(fingerprint, post_id)
+                self.indexed.add(post_id)
+
+        unfinished = [
+            connection.execute(sa.select(sa.func.min(t.c.id)).where(t.c.moderation_status == status)).scalar()
+            for status in ('pending', 'reviewing')
+        ]
+        self.indexed_below = min(filter(None, unfinished), default=max(self.indexed, default=0) + 1)
+        return myths, self.recent
+
+    def record(self, connection, outcomes, now):
+        t = self.table
+        connection.execute(
+            sa.update(t).where(t.c.id == sa.bindparam('pid')).values(
+                content=sa.bindparam('content'), simhash=sa.bindparam('simhash'),
+                is_approved=sa.bindparam('approved'), moderation_status=sa.bindparam('status'),
+                moderation_reason=sa.bindparam('reason'), moderated_at=now,
+            ),
+            outcomes,
+        )
+        for outcome in outcomes:
+            self.stats[outcome['status']] += 1
+
+    def run_batch(self, now=None):
+        """Moderate one batch; returns the number of posts moderated"""
+        now = now or datetime.utcnow()
+        with self.engine.begin() as connection:
+            self.release_stale(connection, now)
+            posts = self.claim(connection, now)
+        if not posts:
+            return 0
+        with self.engine.connect() as connection:
+            myths, recent = self.load_context(connection)
+        outcomes = moderate(posts, myths, recent)
+        with self.engine.begin() as connection:
+            self.record(connection, outcomes, now)
+        self.indexed.update(outcome['pid'] for outcome in outcomes)
+        return len(posts)
+
+    def run_until_empty(self):
+        moderated = 0
+        while True:
+            n = self.run_batch()
+            if not n:
+                return moderated
+            moderated += n
+
+
+def run_worker(poll_seconds=5):
+    """Entry point of one moderation worker process"""
+    logging.basicConfig(level=logging.INFO)
+    with app.app_context():
+        engine = db.engine
+    moderator = ForumModerator(engine)
+    while True:
+        try:
+            if moderator.run_until_empty():
+                logger.info(f'Forum moderation ({os.getpid()}): {moderator.stats}')
+        except sa.exc.OperationalError as e:
+            # SQLite busy with another worker's write, or the database restarting
+            logger.warning(f'Forum moderation batch failed, retrying: {e}')
+        time.sleep(poll_seconds)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else WORKERS
+    poll_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with app.app_context():
+        upgrade_database(db.engine, db.metadata)
+
+    logger.info(f'🛡️ Starting {workers} forum moderation workers')
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=run_worker, args=(poll_seconds,), daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
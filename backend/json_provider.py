@@ -0,0 +1,51 @@
+"""
+FalconCare JSON provider
+
+Flask's JSON provider, with encoding and decoding done by orjson when
+JSON_PROVIDER=orjson (the default, if orjson is installed). JSON_PROVIDER=stdlib
+keeps Flask's own json-based provider.
+
+Output matches the stdlib provider apart from whitespace and escaping:
+orjson writes compact UTF-8 where Flask writes ASCII with \\u escapes,
+which is a third of the size for Devanagari text. Dates, decimals, UUIDs
+and dataclasses still go through Flask's default() so they serialize as before.
+"""
+
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib provider
+    orjson = None
+
+JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'orjson')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    def _options(self, **kwargs):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if kwargs.get('sort_keys', self.sort_keys):
+            options |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent') or (self.compact is False or (self.compact is None and self._app.debug)):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options(**kwargs)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def json_provider(app, name=JSON_PROVIDER):
+    """The JSON provider called `name` for the app; the stdlib one if orjson is missing"""
+    if name == 'orjson' and orjson is not None:
+        return OrjsonProvider(app)
+    return DefaultJSONProvider(app)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+FalconCare database migrations
+Brings a database up to the current schema with the Alembic revisions in
+migrations/versions
+
+An empty database is created from the models and stamped as current. A
+database created before migrations existed (no alembic_version table) is
+upgraded from the first revision; revisions skip changes that are already
+present.
+
+Usage: python migrate.py
+"""
+
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).parent / 'alembic.ini'
+
+
+def alembic_config(connection=None, metadata=None):
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option('script_location', str(Path(__file__).parent / 'migrations'))
+    config.attributes['connection'] = connection
+    config.attributes['target_metadata'] = metadata
+    config.attributes['configure_logger'] = False
+    return config
+
+
+def upgrade_database(engine, metadata):
+    """Create or upgrade the database behind engine to the models in metadata"""
+    with engine.begin() as connection:
+        config = alembic_config(connection, metadata)
+        tables = set(sa.inspect(connection).get_table_names())
+        if not tables:
+            metadata.create_all(connection)
+            command.stamp(config, 'head')
+            return
+        command.upgrade(config, 'head')
+        # Tables added to the models since the database was created
+        metadata.create_all(connection)
+
+
+if __name__ == '__main__':
+    from app import app, db
+
+    with app.app_context():
+        upgrade_database(db.engine, db.metadata)
+    print('✅ Database schema is up to date')
@@ -0,0 +1,36 @@
+"""
+Alembic environment for the FalconCare backend
+
+migrate.upgrade_database() passes its open connection in
+config.attributes['connection']; the alembic CLI connects to the app's
+configured database instead.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def app_metadata_and_engine():
+    from app import app, db
+    with app.app_context():
+        return db.metadata, db.engine
+
+
+def run_migrations(connection, target_metadata):
+    context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+connection = config.attributes.get('connection')
+if connection is not None:
+    run_migrations(connection, config.attributes.get('target_metadata'))
+else:
+    target_metadata, engine = app_metadata_and_engine()
+    with engine.connect() as connection:
+        run_migrations(connection, target_metadata)
@@ -0,0 +1,40 @@
+"""Reminder delivery state for the reminder dispatcher
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    sa.Column('status', sa.String(10), nullable=False, server_default='pending'),
+    sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+    sa.Column('next_attempt_at', sa.DateTime, nullable=True),
+    sa.Column('sent_at', sa.DateTime, nullable=True),
+    sa.Column('last_error', sa.String(255), nullable=True),
+]
+
+
+def upgrade():
+    # Databases created by db.create_all() may already have some of these
+    inspector = sa.inspect(op.get_bind())
+    existing = {c['name'] for c in inspector.get_columns('reminder')}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column('reminder', column)
+    if 'ix_reminder_status_due' not in {i['name'] for i in inspector.get_indexes('reminder')}:
+        op.create_index('ix_reminder_status_due', 'reminder', ['status', 'due_date'])
+
+
+def downgrade():
+    op.drop_index('ix_reminder_status_due', table_name='reminder')
+    with op.batch_alter_table('reminder') as batch:
+        for column in reversed(COLUMNS):
+            batch.drop_column(column.name)
@@ -0,0 +1,39 @@
+"""Per-user indexes for reminders and diary, one profile per user
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_reminder_user_due', 'reminder', ['user_id', 'due_date'], False),
+    ('ix_health_diary_entry_user_date', 'health_diary_entry', ['user_id', 'date'], False),
+    ('uq_health_profile_user_id', 'health_profile', ['user_id'], True),
+]
+
+
+def upgrade():
+    # Keep each user's most recent profile row before enforcing uniqueness
+    op.execute("""
+        DELETE FROM health_profile
+        WHERE user_id IS NOT NULL AND id NOT IN (
+            SELECT MAX(id) FROM health_profile WHERE user_id IS NOT NULL GROUP BY user_id
+        )
+    """)
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns, unique in INDEXES:
+        if name not in {i['name'] for i in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=unique)
+
+
+def downgrade():
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,26 @@
+"""Index health tips by locale for the tip of the day
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('health_tip'):
+        return  # created with the index by migrate.upgrade_database()
+    if 'ix_health_tip_locale_id' not in {i['name'] for i in inspector.get_indexes('health_tip')}:
+        op.create_index('ix_health_tip_locale_id', 'health_tip', ['locale', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_health_tip_locale_id', table_name='health_tip')
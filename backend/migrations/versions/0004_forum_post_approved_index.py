@@ -0,0 +1,26 @@
+"""Index approved forum posts by recency for keyset pagination
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('forum_post'):
+        return  # created with the index by migrate.upgrade_database()
+    if 'ix_forum_post_approved_created' not in {i['name'] for i in inspector.get_indexes('forum_post')}:
+        op.create_index('ix_forum_post_approved_created', 'forum_post', ['is_approved', 'created_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_forum_post_approved_created', table_name='forum_post')
@@ -0,0 +1,46 @@
+"""Forum moderation queue state
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    sa.Column('moderation_status', sa.String(10), nullable=False, server_default='pending'),
+    sa.Column('moderated_at', sa.DateTime, nullable=True),
+    sa.Column('moderation_reason', sa.String(120), nullable=True),
+    sa.Column('simhash', sa.BigInteger, nullable=True),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('forum_post'):
+        return  # created with the columns by migrate.upgrade_database()
+    existing = {c['name'] for c in inspector.get_columns('forum_post')}
+    added = [column for column in COLUMNS if column.name not in existing]
+    for column in added:
+        op.add_column('forum_post', column)
+    if any(column.name == 'moderation_status' for column in added):
+        # Posts from before the queue were published directly
+        op.execute("""
+            UPDATE forum_post SET moderation_status =
+                CASE WHEN is_approved THEN 'approved' ELSE 'rejected' END
+        """)
+    if 'ix_forum_post_moderation' not in {i['name'] for i in inspector.get_indexes('forum_post')}:
+        op.create_index('ix_forum_post_moderation', 'forum_post', ['moderation_status', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_forum_post_moderation', table_name='forum_post')
+    with op.batch_alter_table('forum_post') as batch:
+        for column in reversed(COLUMNS):
+            batch.drop_column(column.name)
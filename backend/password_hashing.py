@@ -0,0 +1,110 @@
+"""
+FalconCare password hashing and auth throttling
+
+bcrypt is deliberately CPU-bound, so hashes run on a small dedicated thread
+pool (bcrypt releases the GIL) instead of on the request thread. The pool
+admits at most workers + queue_depth hashes at once; beyond that, auth
+requests are refused right away. A burst of logins therefore occupies at
+most `workers` cores and never queues up behind itself, and chat and the
+other endpoints keep the remaining CPU.
+
+Token buckets per client IP and per account email cap how many attempts
+reach the hasher, so credential stuffing is turned away before it costs
+any CPU.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.hash import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+HASH_QUEUE_DEPTH = int(os.getenv('PASSWORD_HASH_QUEUE', '16'))
+
+# Auth attempts: burst size and sustained rate per minute
+AUTH_IP_BURST = int(os.getenv('AUTH_IP_BURST', '20'))
+AUTH_IP_PER_MINUTE = float(os.getenv('AUTH_IP_PER_MINUTE', '10'))
+AUTH_EMAIL_BURST = int(os.getenv('AUTH_EMAIL_BURST', '5'))
+AUTH_EMAIL_PER_MINUTE = float(os.getenv('AUTH_EMAIL_PER_MINUTE', '2'))
+
+
+class HasherBusy(Exception):
+    """The hashing pool and its queue are full"""
+
+
+class PasswordHasher:
+    def __init__(self, rounds=BCRYPT_ROUNDS, workers=HASH_WORKERS, queue_depth=HASH_QUEUE_DEPTH):
+        self.scheme = bcrypt.using(rounds=rounds)
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password):
+        return self._run(self.scheme.hash, password)
+
+    def verify(self, password, password_hash):
+        return self._run(self.scheme.verify, password, password_hash)
+
+    def needs_update(self, password_hash):
+        """Whether a stored hash was made with a different cost than configured"""
+        return self.scheme.needs_update(password_hash)
+
+
+class TokenBucket:
+    """
+    Per-key token buckets: each key holds up to `burst` attempts and regains
+    `per_minute` of them a minute. Buckets are kept in least recently used
+    order; once more than max_keys are tracked, the least recently used are
+    forgotten (full ones first), so a flood of distinct keys costs O(1) a take.
+    """
+
+    def __init__(self, burst, per_minute, max_keys=100_000, clock=time.monotonic):
+        self.burst = burst
+        self.rate = per_minute / 60
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _level(self, tokens, updated, now):
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def take(self, key):
+        """Spend one attempt; 0 if allowed, else seconds until the next one is"""
+        now = self.clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = self._level(tokens, updated, now)
+            allowed = tokens >= 1
+            self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._evict(now)
+        if not allowed:
+            return math.inf if not self.rate else (1 - tokens) / self.rate
+        return 0
+
+    def _evict(self, now):
+        """Drop least recently used buckets: all full ones at that end, then any over max_keys"""
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if len(self._buckets) <= self.max_keys and self._level(*oldest, now) < self.burst:
+                return
+            self._buckets.popitem(last=False)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+FalconCare reminder dispatcher
+Delivers due vaccination reminders over SMS, WhatsApp, email or push
+
+Due reminders are claimed in batches through the (status, due_date) index.
+A claim sets a lease (next_attempt_at) in the same UPDATE that selects the
+rows. On PostgreSQL the selection uses FOR UPDATE SKIP LOCKED, so several
+dispatchers can share the table. SQLite runs the UPDATE under its
+database-wide write lock, which makes the claim atomic there too. A
+dispatcher that dies mid-batch leaves its claims to expire and be re-claimed.
+
+Sends fan out through a bounded pool of concurrent deliveries. Failed sends
+are rescheduled with exponential backoff until max_attempts, then marked
+'failed'.
+
+Usage: python reminder_dispatch.py [poll_seconds]
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import sqlalchemy as sa
+
+from app import app, db, Reminder
+from migrate import upgrade_database
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv('REMINDER_BATCH_SIZE', '500'))
+CONCURRENCY = int(os.getenv('REMINDER_CONCURRENCY', '64'))
+MAX_ATTEMPTS = int(os.getenv('REMINDER_MAX_ATTEMPTS', '5'))
+LEASE_SECONDS = 300
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 6 * 3600
+
+
+# Error recorded for contacts no channel can reach; these aren't retried
+NO_CHANNEL = 'no deliverable contact'
+
+
+class DeliveryError(Exception):
+    pass
+
+
+class StandInChannel:
+    """
+    Logs the message instead of calling a provider (Twilio/SES are wired in
+    integrations/); latency and failure_rate simulate one
+    """
+
+    def __init__(self, name, latency=0.0, failure_rate=0.0):
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent = 0
+
+    async def send(self, contact, message):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise DeliveryError(f'{self.name} provider unavailable')
+        self.sent += 1
+        logger.debug(f'[{self.name}] {contact}: {message}')
+
+
+def default_channels():
+    return {name: StandInChannel(name) for name in ('sms', 'whatsapp', 'email', 'push')}
+
+
+def channel_for(contact):
+    """Channel name for a reminder contact, or None if it isn't one we can reach"""
+    contact = (contact or '').strip()
+    if contact.startswith('whatsapp:'):
+        return 'whatsapp'
+    if contact.startswith('push:'):
+        return 'push'
+    if '@' in contact:
+        return 'email'
+    if contact.lstrip('+').isdigit():
+        return 'sms'
+    return None
+
+
+def reminder_message(vaccine, due_date):
+    return f"💉 FalconCare: {vaccine} vaccine due {due_date:%d %b %Y}. Visit your nearest health centre or Anganwadi."
+
+
+def backoff_seconds(attempts):
+    """Exponential backoff with jitter: ~1, 2, 4, ... minutes, capped"""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class ReminderDispatcher:
+    def __init__(self, engine, channels=None, batch_size=BATCH_SIZE, concurrency=CONCURRENCY,
+                 max_attempts=MAX_ATTEMPTS, lease_seconds=LEASE_SECONDS):
+        self.engine = engine
+        self.table = Reminder.__table__
+        self.channels = channels or default_channels()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.lease = timedelta(seconds=lease_seconds)
+        self._slots = asyncio.Semaphore(concurrency)
+        self.stats = {'claimed': 0, 'sent': 0, 'retried': 0, 'failed': 0}
+
+    def claim_statement(self, now):
+        t = self.table
+        due = (
+            sa.select(t.c.id)
+            .where(t.c.status == 'pending', t.c.due_date <= now)
+            .where(sa.or_(t.c.next_attempt_at.is_(None), t.c.next_attempt_at <= now))
+            .order_by(t.c.due_date)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            sa.update(t)
+            .where(t.c.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=now + self.lease, attempts=t.c.attempts + 1)
+            .returning(t.c.id, t.c.vaccine, t.c.due_date, t.c.contact, t.c.attempts)
+        )
+
+    def claim(self, now=None):
+        """Lease the next batch of due reminders to this dispatcher"""
+        with self.engine.begin() as connection:
+            rows = connection.execute(self.claim_statement(now or datetime.utcnow())).all()
+        self.stats['claimed'] += len(rows)
+        return rows
+
+    async def deliver(self, reminder):
+        """None on success, else the error message"""
+        channel = self.channels.get(channel_for(reminder.contact))
+        if channel is None:
+            return NO_CHANNEL
+        async with self._slots:
+            try:
+                await channel.send(reminder.contact, reminder_message(reminder.vaccine, reminder.due_date))
+            except Exception as e:
+                return str(e)[:255] or type(e).__name__
+        return None
+
+    def record(self, batch, errors, now=None):
+        """Write a batch's outcomes back: sent, rescheduled with backoff, or failed"""
+        now = now or datetime.utcnow()
+        t = self.table
+        sent = [r.id for r, error in zip(batch, errors) if error is None]
+        retries, failures = [], []
+        for reminder, error in zip(batch, errors):
+            if error is None:
+                continue
+            if reminder.attempts >= self.max_attempts or error == NO_CHANNEL:
+                failures.append({'rid': reminder.id, 'error': error})
+            else:
+                retries.append({
+                    'rid': reminder.id, 'error': error,
+                    'retry_at': now + timedelta(seconds=backoff_seconds(reminder.attempts)),
+                })
+
+        with self.engine.begin() as connection:
+            if sent:
+                connection.execute(
+                    sa.update(t).where(t.c.id.in_(sent)).values(status='sent', sent_at=now, last_error=None)
+                )
+            if retries:
+                connection.execute(
+                    sa.update(t).where(t.c.id == sa.bindparam('rid'))
+                    .values(next_attempt_at=sa.bindparam('retry_at'), last_error=sa.bindparam('error')),
+                    retries,
+                )
+            if failures:
+                connection.execute(
+                    sa.update(t).where(t.c.id == sa.bindparam('rid'))
+                    .values(status='failed', last_error=sa.bindparam('error')),
+                    failures,
+                )
+        self.stats['sent'] += len(sent)
+        self.stats['retried'] += len(retries)
+        self.stats['failed'] += len(failures)
+
+    async def dispatch_due(self, now=None):
+        """Deliver everything due now; returns the number of reminders claimed"""
+        claimed = 0
+        batch = await asyncio.to_thread(self.claim, now)
+        while batch:
+            claimed += len(batch)
+            # Claim the next batch while this one is being sent
+            sending = asyncio.gather(*(self.deliver(r) for r in batch))
+            next_batch = asyncio.create_task(asyncio.to_thread(self.claim, now))
+            errors = await sending
+            await asyncio.to_thread(self.record, batch, errors)
+            batch = await next_batch
+        return claimed
+
+    async def run_forever(self, poll_seconds=30):
+        while True:
+            try:
+                claimed = await self.dispatch_due()
+                if claimed:
+                    logger.info(f'Reminder dispatch: {self.stats}')
+            except sa.exc.SQLAlchemyError as e:
+                logger.error(f'Reminder dispatch failed: {e}')
+            await asyncio.sleep(poll_seconds)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    poll_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    with app.app_context():
+        upgrade_database(db.engine, db.metadata)
+        dispatcher = ReminderDispatcher(db.engine)
+    logger.info(f'💉 Dispatching due reminders every {poll_seconds:g}s')
+    asyncio.run(dispatcher.run_forever(poll_seconds))
@@ -0,0 +1,87 @@
+"""
+FalconCare symptom checker index
+
+Symptoms are interned to integer IDs and the condition database is stored
+column-wise (CSC: symptom -> conditions with weights), so scoring a query is
+one sparse mat-vec over just the postings of the queried symptoms, followed
+by an argpartition top-k.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CONDITIONS_PATH = os.getenv(
+    'SYMPTOM_CONDITIONS_PATH', str(Path(__file__).parent / 'data' / 'conditions.json')
+)
+
+
+class SymptomIndex:
+    """Immutable weighted condition x symptom matrix; safe to share across threads"""
+
+    def __init__(self, conditions):
+        """conditions: {condition: {symptom: weight}}"""
+        self.conditions = list(conditions)
+        self.symptom_ids = {}
+        rows, cols, weights = [], [], []
+        for c, symptoms in enumerate(conditions.values()):
+            for symptom, weight in symptoms.items():
+                s = self.symptom_ids.setdefault(symptom.strip().lower(), len(self.symptom_ids))
+                rows.append(c)
+                cols.append(s)
+                weights.append(float(weight))
+        self.symptoms = list(self.symptom_ids)
+
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+        weights = np.asarray(weights, dtype=np.float32)
+
+        # CSC layout: postings of symptom s are [indptr[s], indptr[s + 1])
+        order = np.argsort(cols, kind='stable')
+        self.posting_conditions = rows[order]
+        self.posting_weights = weights[order]
+        self.indptr = np.zeros(len(self.symptoms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(self.symptoms)), out=self.indptr[1:])
+
+        self.condition_weight = np.bincount(rows, weights=weights, minlength=len(self.conditions))
+
+    @classmethod
+    def from_json(cls, path=DEFAULT_CONDITIONS_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f)['conditions'])
+
+    def intern(self, symptoms):
+        """(known symptom IDs, unknown names) for a list of symptom names"""
+        known, unknown = [], []
+        for name in symptoms:
+            s = self.symptom_ids.get(name.strip().lower())
+            if s is None:
+                unknown.append(name)
+            elif s not in known:
+                known.append(s)
+        return known, unknown
+
+    def scores(self, symptom_ids):
+        """Weighted fraction of each condition's symptom profile that is matched"""
+        if not symptom_ids:
+            return np.zeros(len(self.conditions))
+        slices = [slice(self.indptr[s], self.indptr[s + 1]) for s in symptom_ids]
+        conditions = np.concatenate([self.posting_conditions[sl] for sl in slices])
+        weights = np.concatenate([self.posting_weights[sl] for sl in slices])
+        matched = np.bincount(conditions, weights=weights, minlength=len(self.conditions))
+        return matched / self.condition_weight
+
+    def top_k(self, symptoms, k=5):
+        """Best-matching conditions for a list of symptom names"""
+        symptom_ids, unknown = self.intern(symptoms)
+        scores = self.scores(symptom_ids)
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        best = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [
+            {'condition': self.conditions[c], 'score': round(float(scores[c]), 2)}
+            for c in best
+        ], unknown
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - auth tests
+Password hashing runs on the bounded pool and attempts are throttled
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+
+import app as app_module
+from app import app, db, User
+from migrate import upgrade_database
+from password_hashing import HasherBusy, PasswordHasher, TokenBucket
+
+
+@pytest.fixture
+def client(monkeypatch):
+    with app.app_context():
+        db.drop_all()
+        upgrade_database(db.engine, db.metadata)
+    monkeypatch.setattr(app_module, 'PASSWORD_HASHER', PasswordHasher(rounds=4, workers=1, queue_depth=1))
+    monkeypatch.setattr(app_module, 'AUTH_IP_ATTEMPTS', TokenBucket(burst=20, per_minute=10))
+    monkeypatch.setattr(app_module, 'AUTH_EMAIL_ATTEMPTS', TokenBucket(burst=3, per_minute=2))
+    yield app.test_client()
+
+
+def login(client, email, password):
+    return client.post('/api/auth/login', json={'email': email, 'password': password})
+
+
+def test_token_bucket_refills():
+    now = [0.0]
+    bucket = TokenBucket(burst=3, per_minute=60, max_keys=2, clock=lambda: now[0])
+    assert [bucket.take('a') for _ in range(4)] == [0, 0, 0, 1.0]
+    assert bucket.take('b') == 0
+    now[0] += 1
+    assert bucket.take('a') == 0 and bucket.take('a') > 0
+    # Full buckets are forgotten once too many keys are tracked
+    now[0] += 60
+    bucket.take('c')
+    assert set(bucket._buckets) == {'c'}
+
+
+def test_token_bucket_forgets_least_recently_used_keys():
+    now = [0.0]
+    bucket = TokenBucket(burst=3, per_minute=2, max_keys=1000, clock=lambda: now[0])
+    bucket.take('victim@example.org')
+    # Credential stuffing: many distinct emails, none refilled yet
+    for i in range(5000):
+        now[0] += 0.001
+        bucket.take(f'user{i}@example.org')
+        if i % 100 == 0:
+            bucket.take('victim@example.org')
+    assert len(bucket._buckets) == 1000
+    assert 'victim@example.org' in bucket._buckets and 'user0@example.org' not in bucket._buckets
+
+
+def test_hasher_refuses_beyond_queue_depth():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_depth=0)
+    started, release = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait()
+
+    holder = threading.Thread(target=hasher._run, args=(hold,))
+    holder.start()
+    started.wait()
+    with pytest.raises(HasherBusy):
+        hasher.hash('secret')
+    release.set()
+    holder.join()
+    assert hasher.verify('secret', hasher.hash('secret'))
+
+
+def test_signup_and_login(client):
+    assert 'accessToken' in client.post('/api/auth/signup', json={'email': 'Asha@Example.org', 'password': 'pw'}).get_json()
+    assert client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'}).status_code == 409
+    assert 'accessToken' in login(client, 'asha@example.org', 'pw').get_json()
+    assert login(client, 'asha@example.org', 'wrong').status_code == 401
+
+
+def test_login_attempts_are_throttled_per_email(client):
+    client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'})
+    client.post('/api/auth/signup', json={'email': 'ravi@example.org', 'password': 'pw'})
+    assert [login(client, 'asha@example.org', 'guess').status_code for _ in range(3)] == [401] * 3
+    throttled = login(client, 'asha@example.org', 'pw')
+    assert throttled.status_code == 429 and int(throttled.headers['Retry-After']) == 30
+    assert login(client, 'ravi@example.org', 'pw').status_code == 200
+
+
+def test_login_attempts_are_throttled_per_ip(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'AUTH_IP_ATTEMPTS', TokenBucket(burst=2, per_minute=10))
+    assert [login(client, f'user{i}@example.org', 'pw').status_code for i in range(3)] == [401, 401, 429]
+
+
+def test_busy_hasher_answers_503(client, monkeypatch):
+    hasher = PasswordHasher(rounds=4, workers=1, queue_depth=0)
+    hasher._slots.acquire()  # a hash in flight
+    monkeypatch.setattr(app_module, 'PASSWORD_HASHER', hasher)
+    response = client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'})
+    assert response.status_code == 503 and response.headers['Retry-After'] == '1'
+
+
+def test_login_rehashes_when_cost_changes(client, monkeypatch):
+    client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'})
+    monkeypatch.setattr(app_module, 'PASSWORD_HASHER', PasswordHasher(rounds=5, workers=1))
+    assert login(client, 'asha@example.org', 'pw').status_code == 200
+    with app.app_context():
+        assert User.query.filter_by(email='asha@example.org').one().password_hash.startswith('$2b$05$')
+
+
+def test_signup_and_profile_without_on_conflict(client, monkeypatch):
+    # Databases other than SQLite and PostgreSQL check, then insert
+    monkeypatch.setattr(app_module, 'insert_on_conflict', lambda table: None)
+    token = client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'}).get_json()['accessToken']
+    assert client.post('/api/auth/signup', json={'email': 'asha@example.org', 'password': 'pw'}).status_code == 409
+    headers = {'Authorization': f'Bearer {token}'}
+    assert client.post('/api/profile', json={'age': 30, 'gender': 'f'}, headers=headers).status_code == 200
+    assert client.post('/api/profile', json={'age': 31}, headers=headers).status_code == 200
+    assert client.get('/api/profile', headers=headers).get_json() == {
+        'age': 31, 'gender': 'f', 'weight_kg': None, 'conditions': '',
+    }
+    with app.app_context():
+        assert app_module.insert_user('asha@example.org', 'x') is None
+        # A concurrent signup took the email after the check: the unique index still decides
+        select = app_module.select
+        monkeypatch.setattr(app_module, 'select', lambda *columns: select(*columns).where(False))
+        assert app_module.insert_user('asha@example.org', 'x') is None
+        assert User.query.filter_by(email='asha@example.org').count() == 1
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - JSON provider and response compression tests
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from app import app
+from compression import ENCODINGS, negotiate
+from json_provider import OrjsonProvider, orjson
+
+CHAT = {'message': 'I have had a fever since yesterday'}
+
+
+@pytest.fixture
+def client():
+    yield app.test_client()
+
+
+def decode(response):
+    body = response.get_data()
+    coding = response.headers.get('Content-Encoding')
+    if coding == 'br':
+        import brotli
+        body = brotli.decompress(body)
+    elif coding == 'gzip':
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+@pytest.mark.parametrize('header,available,expected', [
+    ('gzip, deflate, br', ('br', 'gzip'), 'br'),
+    ('gzip, deflate, br', ('gzip',), 'gzip'),
+    ('br;q=0, gzip;q=0.5', ('br', 'gzip'), 'gzip'),
+    ('gzip;q=0.4, br;q=0.8', ('gzip',), 'gzip'),
+    ('*', ('br', 'gzip'), 'br'),
+    ('*, gzip;q=0', ('gzip',), None),
+    ('identity', ('br', 'gzip'), None),
+    ('', ('br', 'gzip'), None),
+])
+def test_negotiate(header, available, expected):
+    assert negotiate(header, available) == expected
+
+
+def test_compresses_large_responses(client):
+    plain = client.post('/api/chat', json=CHAT)
+    assert 'Content-Encoding' not in plain.headers and 'Accept-Encoding' in plain.headers['Vary']
+    for coding in ENCODINGS:
+        response = client.post('/api/chat', json=CHAT, headers={'Accept-Encoding': coding})
+        assert response.headers['Content-Encoding'] == coding
+        assert len(response.get_data()) < len(plain.get_data())
+        assert {**decode(response), 'timestamp': None} == {**plain.get_json(), 'timestamp': None}
+
+
+def test_small_responses_stay_plain(client):
+    response = client.get('/api/health', headers={'Accept-Encoding': 'gzip, br'})
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_static_responses_are_precomputed(client):
+    response = client.get('/api/hospitals', headers={'Accept-Encoding': 'gzip'})
+    assert decode(response)['hospitals'][0]['name'] == 'City Care Hospital'
+    again = client.get('/api/hospitals', headers={'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304 and not again.get_data()
+
+    symptoms = client.get('/api/symptoms', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in symptoms.headers  # too small to be worth it
+    assert symptoms.get_json()['count'] == len(symptoms.get_json()['symptoms'])
+
+
+@pytest.mark.skipif(orjson is None, reason='orjson not installed')
+def test_orjson_provider_matches_stdlib():
+    stdlib, fast = DefaultJSONProvider(app), OrjsonProvider(app)
+    value = {'when': datetime(2026, 1, 2, 3, 4, 5), 'text': 'बुखार 🤒', 'n': 1.5, 'by_day': {2: None, 1: 3}, 'z': [1, 'a']}
+    assert json.loads(fast.dumps(value)) == json.loads(stdlib.dumps(value))
+    assert 'बुखार' in fast.dumps(value)  # UTF-8, not \u escapes
+    assert fast.loads(fast.dumps(value))['when'] == 'Fri, 02 Jan 2026 03:04:05 GMT'
+    with app.test_request_context():
+        assert fast.response(value).get_data().endswith(b'\n')
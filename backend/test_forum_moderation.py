@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - forum moderation tests
+Queued posts are published only after the moderation workers pass them
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+import sqlalchemy as sa
+
+from app import app, db, FORUM_FIRST_PAGE, ForumPost, Myth
+from forum_moderation import ForumModerator, MythDetector, SimHashIndex, hamming, moderate, redact_pii, simhash
+from migrate import upgrade_database
+from symptom_normalizer import tokenize
+
+POST = 'Mere bete ko teen din se tez bukhar hai aur body pain bhi, kya dengue test karwana chahiye?'
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.drop_all()
+        upgrade_database(db.engine, db.metadata)
+        db.session.add(Myth(claim='Alcohol cures COVID', fact='No.'))
+        db.session.commit()
+    FORUM_FIRST_PAGE.invalidate()
+    yield app.test_client()
+
+
+def listed(client):
+    FORUM_FIRST_PAGE.invalidate()
+    return [post['content'] for post in client.get('/api/forum').get_json()['posts']]
+
+
+def test_redacts_personal_details():
+    text, found = redact_pii('Call me on +91 98765 43210 or mail ravi.k@example.com, Aadhaar 1234 5678 9012')
+    assert found == ['phone', 'email', 'aadhaar']
+    assert text == 'Call me on [phone removed] or mail [email removed], Aadhaar [aadhaar removed]'
+    assert redact_pii('Fever for 3 days, 102 degrees') == ('Fever for 3 days, 102 degrees', [])
+
+
+def test_simhash_finds_near_duplicates_only():
+    index = SimHashIndex([simhash(tokenize(POST))])
+    assert index.near(simhash(tokenize(POST + '!!')))
+    edited = hamming(simhash(tokenize(POST.replace('teen', '3'))), simhash(tokenize(POST)))
+    unrelated = hamming(simhash(tokenize('Where can I get the polio vaccine for my daughter?')), simhash(tokenize(POST)))
+    assert edited < unrelated
+    assert not index.near(simhash(tokenize('Where can I get the polio vaccine for my daughter in Raipur district?')))
+
+
+def test_moderate_batch():
+    myths = MythDetector(['Alcohol cures COVID'])
+    outcomes = moderate([
+        (1, POST),
+        (2, POST),
+        (3, 'This doctor is a bastard'),
+        (4, 'My uncle says alcohol cures covid, is that true?'),
+        (5, 'Contact me at 9876543210 for free medicines'),
+        (6, 'thanks'),
+        (7, 'thanks'),
+    ], myths, SimHashIndex())
+    assert [(o['status'], o['reason']) for o in outcomes] == [
+        ('approved', None),
+        ('rejected', 'duplicate'),
+        ('rejected', 'profanity'),
+        ('flagged', 'myth: alcohol cures covid'),
+        ('approved', 'redacted: phone'),
+        ('approved', None),
+        ('approved', None),
+    ]
+    assert outcomes[4]['content'] == 'Contact me at [phone removed] for free medicines'
+
+
+def test_retried_post_is_not_its_own_duplicate():
+    # The outcome failed to save (SQLite busy) and the post was claimed again
+    myths, recent = MythDetector([]), SimHashIndex()
+    assert moderate([(7, POST)], myths, recent)[0]['status'] == 'approved'
+    assert moderate([(7, POST)], myths, recent)[0]['status'] == 'approved'
+    assert moderate([(8, POST)], myths, recent)[0]['reason'] == 'duplicate'
+
+
+def test_posts_published_after_moderation(client):
+    response = client.post('/api/forum', json={'content': POST})
+    assert response.status_code == 202 and response.get_json()['status'] == 'pending'
+    client.post('/api/forum', json={'content': POST + ' ??'})
+    client.post('/api/forum', json={'content': 'Alcohol cures COVID, share with everyone'})
+    assert listed(client) == []
+
+    with app.app_context():
+        moderator = ForumModerator(db.engine, batch_size=2)
+        assert moderator.run_until_empty() == 3
+        assert moderator.stats == {'approved': 1, 'rejected': 1, 'flagged': 1}
+        statuses = [p.moderation_status for p in ForumPost.query.order_by(ForumPost.id)]
+    assert statuses == ['approved', 'rejected', 'flagged']
+    assert listed(client) == [POST]
+
+    # Duplicates of already-published posts are caught across batches
+    client.post('/api/forum', json={'content': POST})
+    with app.app_context():
+        ForumModerator(db.engine).run_until_empty()
+    assert listed(client) == [POST]
+
+
+def test_stale_claims_return_to_queue(client):
+    client.post('/api/forum', json={'content': POST})
+    with app.app_context():
+        moderator = ForumModerator(db.engine, lease_seconds=0)
+        with db.engine.begin() as connection:
+            assert len(moderator.claim(connection, now=ForumPost.query.first().created_at)) == 1
+        assert moderator.run_until_empty() == 1
+    assert listed(client) == [POST]
+
+
+def test_batch_retried_after_failed_save(client, monkeypatch):
+    client.post('/api/forum', json={'content': POST})
+    with app.app_context():
+        moderator = ForumModerator(db.engine, lease_seconds=0)
+        record = moderator.record
+
+        def busy(connection, outcomes, now):
+            monkeypatch.setattr(moderator, 'record', record)
+            raise sa.exc.OperationalError('UPDATE forum_post', {}, Exception('database is locked'))
+
+        monkeypatch.setattr(moderator, 'record', busy)
+        with pytest.raises(sa.exc.OperationalError):
+            moderator.run_batch()
+        assert moderator.run_until_empty() == 1
+        assert moderator.stats == {'approved': 1, 'rejected': 0, 'flagged': 0}
+    assert listed(client) == [POST]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - query plan regression tests
+Every query the per-user, tip and forum endpoints run must be served by an
+index, never by a full table scan; migrations bring old databases to the
+same indexes.
+"""
+
+import os
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+import sqlalchemy as sa
+from flask_jwt_extended import create_access_token
+
+from app import (
+    app, db, DAILY_TIPS, FORUM_FIRST_PAGE, USER_CACHE, ForumPost, HealthDiaryEntry, HealthProfile, HealthTip, Reminder, User,
+)
+from migrate import upgrade_database
+
+INDEXED_TABLES = ('reminder', 'health_profile', 'health_diary_entry', 'health_tip', 'forum_post')
+
+
+@pytest.fixture(scope='module')
+def client():
+    with app.app_context():
+        db.drop_all()
+        upgrade_database(db.engine, db.metadata)
+        users = [User(email=f'user{i}@example.org', password_hash='x') for i in range(20)]
+        db.session.add_all(users)
+        db.session.flush()
+        now = datetime.utcnow()
+        for user in users:
+            db.session.add(HealthProfile(user_id=user.id, age=30))
+            for day in range(10):
+                db.session.add(Reminder(user_id=user.id, vaccine='BCG', due_date=now + timedelta(days=day)))
+                db.session.add(HealthDiaryEntry(user_id=user.id, date=(now - timedelta(days=day)).date()))
+        db.session.commit()
+        token = create_access_token(identity=str(users[0].id))
+    yield app.test_client(), {'Authorization': f'Bearer {token}'}
+
+
+@pytest.fixture
+def statements():
+    """SQL statements executed while the test runs"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    with app.app_context():
+        engine = db.engine
+    sa.event.listen(engine, 'before_cursor_execute', capture)
+    yield captured
+    sa.event.remove(engine, 'before_cursor_execute', capture)
+
+
+def plan_steps(statements):
+    with app.app_context(), db.engine.connect() as connection:
+        return [
+            step[-1]
+            for statement, parameters in statements
+            for step in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+        ]
+
+
+def full_scans(statements):
+    """Plan steps that scan an indexed table, for each captured statement"""
+    scans = []
+    with app.app_context(), db.engine.connect() as connection:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE')):
+                continue
+            plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+            scans += [
+                (statement, step[-1]) for step in plan
+                if any(step[-1].startswith(f'SCAN {table}') for table in INDEXED_TABLES)
+            ]
+    return scans
+
+
+@pytest.mark.parametrize('method,path,body', [
+    ('get', '/api/reminders', None),
+    ('get', '/api/profile', None),
+    ('post', '/api/profile', {'age': 31}),
+    ('get', '/api/diary', None),
+])
+def test_per_user_endpoints_use_indexes(client, statements, method, path, body):
+    test_client, headers = client
+    USER_CACHE.clear()  # plan the signed-in user lookup too
+    response = getattr(test_client, method)(path, json=body, headers=headers)
+    assert response.status_code == 200
+    assert statements, 'endpoint ran no queries'
+    assert full_scans(statements) == []
+
+
+def test_signed_in_user_is_cached(client, statements):
+    test_client, headers = client
+    USER_CACHE.clear()
+    test_client.get('/api/profile', headers=headers)
+    assert len(statements) == 1  # user and profile in one query
+    statements.clear()
+    assert test_client.get('/api/profile', headers=headers).get_json()['age'] in (30, 31)
+    assert statements == []
+
+    test_client.post('/api/profile', json={'age': 44, 'gender': 'f'}, headers=headers)
+    assert len(statements) == 1 and statements[0][0].startswith('UPDATE')
+    statements.clear()
+    assert test_client.get('/api/profile', headers=headers).get_json() == {
+        'age': 44, 'gender': 'f', 'weight_kg': None, 'conditions': '',
+    }
+    assert statements == []
+
+    with app.app_context():
+        stranger = create_access_token(identity='999999')
+    assert test_client.get('/api/profile', headers={'Authorization': f'Bearer {stranger}'}).status_code == 401
+
+
+def test_daily_tip_reads_db_once_per_day(client, statements):
+    test_client, _ = client
+    with app.app_context():
+        db.session.add_all([HealthTip(text=f'Tip {i}', locale='hi') for i in range(50)])
+        db.session.commit()
+    DAILY_TIPS.clear()
+    statements.clear()
+
+    first = test_client.get('/api/tips/daily?locale=hi').get_json()
+    assert first['locale'] == 'hi'
+    assert full_scans(statements) == [] and statements
+    statements.clear()
+    assert test_client.get('/api/tips/daily?locale=HI').get_json() == first
+    assert statements == []
+
+    # Locales without tips share the 'en' pick; they never crowd out real ones
+    english = test_client.get('/api/tips/daily?locale=en').get_json()
+    statements.clear()
+    for i in range(300):
+        assert test_client.get(f'/api/tips/daily?locale=x{i}').get_json() == english
+    for _ in range(5):
+        assert test_client.get('/api/tips/daily?locale=hi').get_json() == first
+    assert statements == []
+
+
+def test_forum_pages_by_keyset_over_approved_posts(client, statements):
+    test_client, _ = client
+    with app.app_context():
+        start = datetime(2026, 1, 1)
+        db.session.add_all([
+            ForumPost(content=f'Post {i}', is_approved=i % 3 != 0, created_at=start + timedelta(minutes=i // 2))
+            for i in range(120)
+        ])
+        db.session.commit()
+    FORUM_FIRST_PAGE.invalidate()
+
+    seen, cursor = [], None
+    while True:
+        page = test_client.get('/api/forum', query_string={'before': cursor} if cursor else {}).get_json()
+        assert len(page['posts']) == 50 or page['next_cursor'] is None
+        seen += [post['content'] for post in page['posts']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert seen == [f'Post {i}' for i in reversed(range(120)) if i % 3 != 0]
+    # Later pages start their index range at the cursor instead of walking from the newest post
+    keyset = [(sql, parameters) for sql, parameters in statements if '(forum_post.created_at, forum_post.id) <' in sql]
+    assert keyset and all('created_at<' in step for step in plan_steps(keyset))
+    assert full_scans(statements) == []
+
+    statements.clear()
+    test_client.get('/api/forum')
+    assert statements == []
+    assert test_client.get('/api/forum?before=garbage').status_code == 400
+
+
+def test_profile_is_unique_per_user(client):
+    with app.app_context():
+        user_id = HealthProfile.query.first().user_id
+        db.session.add(HealthProfile(user_id=user_id))
+        with pytest.raises(sa.exc.IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+
+def test_migrates_pre_migration_database(tmp_path):
+    path = tmp_path / 'old.db'
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE user (id INTEGER PRIMARY KEY, email VARCHAR(255) NOT NULL UNIQUE,
+                           password_hash VARCHAR(255) NOT NULL, created_at DATETIME);
+        CREATE TABLE reminder (id INTEGER PRIMARY KEY, user_id INTEGER, vaccine VARCHAR(100) NOT NULL,
+                               due_date DATETIME NOT NULL, contact VARCHAR(255), created_at DATETIME);
+        CREATE TABLE health_profile (id INTEGER PRIMARY KEY, user_id INTEGER, age INTEGER, gender VARCHAR(20),
+                                     weight_kg FLOAT, conditions VARCHAR(300), updated_at DATETIME);
+        CREATE TABLE health_diary_entry (id INTEGER PRIMARY KEY, user_id INTEGER, date DATE,
+                                         notes TEXT, symptoms VARCHAR(300));
+        INSERT INTO reminder (user_id, vaccine, due_date) VALUES (1, 'BCG', '2026-01-01 00:00:00');
+        INSERT INTO health_profile (user_id, age) VALUES (1, 30), (1, 31), (2, 40);
+    """)
+    connection.close()
+
+    engine = sa.create_engine(f'sqlite:///{path}')
+    upgrade_database(engine, db.metadata)
+    upgrade_database(engine, db.metadata)  # already current: no-op
+
+    inspector = sa.inspect(engine)
+    assert {'ix_reminder_status_due', 'ix_reminder_user_due'} <= {i['name'] for i in inspector.get_indexes('reminder')}
+    assert [i['unique'] for i in inspector.get_indexes('health_profile')] in ([1], [True])
+    assert inspector.has_table('forum_post')
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql('SELECT status, attempts FROM reminder').all() == [('pending', 0)]
+        assert connection.exec_driver_sql('SELECT user_id, age FROM health_profile ORDER BY user_id').all() == [
+            (1, 31), (2, 40)
+        ]
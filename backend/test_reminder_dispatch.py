@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - reminder dispatch tests
+Due reminders are claimed once, sent, retried with backoff and given up on
+after max_attempts
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+
+from app import app, db, Reminder
+from migrate import upgrade_database
+from reminder_dispatch import NO_CHANNEL, ReminderDispatcher, StandInChannel, channel_for
+
+NOW = datetime(2026, 3, 1, 9, 0)
+
+
+@pytest.fixture
+def engine():
+    with app.app_context():
+        db.drop_all()
+        upgrade_database(db.engine, db.metadata)
+        yield db.engine
+
+
+def add_reminder(contact='+919876543210', due=NOW - timedelta(hours=1)):
+    reminder = Reminder(vaccine='Polio', due_date=due, contact=contact)
+    db.session.add(reminder)
+    db.session.commit()
+    return reminder.id
+
+
+def stored(rid):
+    db.session.expire_all()
+    return db.session.get(Reminder, rid)
+
+
+def dispatcher_with(channel, **kwargs):
+    return ReminderDispatcher(db.engine, channels={channel.name: channel}, **kwargs)
+
+
+@pytest.mark.parametrize('contact,expected', [
+    ('+919876543210', 'sms'),
+    ('whatsapp:+919876543210', 'whatsapp'),
+    ('asha@example.org', 'email'),
+    ('push:ExponentPushToken[xxxxxxxxxxxxxxxxxxxxxx]', 'push'),
+    ('ExponentPushToken[xxxxxxxxxxxxxxxxxxxxxx]', None),
+    ('', None),
+])
+def test_channel_for(contact, expected):
+    assert channel_for(contact) == expected
+
+
+def test_sends_due_reminders(engine):
+    due, later = add_reminder(), add_reminder(due=NOW + timedelta(days=7))
+    sms = StandInChannel('sms')
+    assert asyncio.run(dispatcher_with(sms).dispatch_due(NOW)) == 1
+    assert sms.sent == 1
+    assert stored(due).status == 'sent' and stored(due).sent_at is not None and stored(due).attempts == 1
+    assert stored(later).status == 'pending' and stored(later).attempts == 0
+
+
+def test_push_contacts_are_delivered(engine):
+    rid = add_reminder(contact='push:ExponentPushToken[xxxxxxxxxxxxxxxxxxxxxx]')
+    dispatcher = ReminderDispatcher(engine)
+    asyncio.run(dispatcher.dispatch_due(NOW))
+    assert dispatcher.channels['push'].sent == 1 and stored(rid).status == 'sent'
+
+
+def test_transient_failure_is_rescheduled(engine):
+    rid = add_reminder()
+    sms = StandInChannel('sms', failure_rate=1.0)
+    dispatcher = dispatcher_with(sms)
+    asyncio.run(dispatcher.dispatch_due(NOW))
+    reminder = stored(rid)
+    assert reminder.status == 'pending' and reminder.attempts == 1
+    assert reminder.last_error == 'sms provider unavailable'
+    assert reminder.next_attempt_at > datetime.utcnow()
+
+    sms.failure_rate = 0.0
+    assert asyncio.run(dispatcher.dispatch_due(NOW)) == 0  # still backing off
+    assert asyncio.run(dispatcher.dispatch_due(reminder.next_attempt_at)) == 1
+    reminder = stored(rid)
+    assert reminder.status == 'sent' and reminder.attempts == 2 and reminder.last_error is None
+
+
+def test_gives_up_after_max_attempts(engine):
+    rid = add_reminder()
+    dispatcher = dispatcher_with(StandInChannel('sms', failure_rate=1.0), max_attempts=2)
+    asyncio.run(dispatcher.dispatch_due(NOW))
+    assert stored(rid).status == 'pending'
+    asyncio.run(dispatcher.dispatch_due(stored(rid).next_attempt_at))
+    reminder = stored(rid)
+    assert reminder.status == 'failed' and reminder.attempts == 2
+    assert dispatcher.stats == {'claimed': 2, 'sent': 0, 'retried': 1, 'failed': 1}
+
+
+def test_unreachable_contacts_fail_without_retry(engine):
+    rid = add_reminder(contact='not a contact')
+    asyncio.run(ReminderDispatcher(engine).dispatch_due(NOW))
+    reminder = stored(rid)
+    assert reminder.status == 'failed' and reminder.last_error == NO_CHANNEL and reminder.attempts == 1
+
+
+def test_leased_reminders_are_claimed_once(engine):
+    rid = add_reminder()
+    first, second = ReminderDispatcher(engine, lease_seconds=300), ReminderDispatcher(engine, lease_seconds=300)
+    assert [r.id for r in first.claim(NOW)] == [rid]
+    assert second.claim(NOW) == []
+    assert second.claim(NOW + timedelta(seconds=299)) == []
+    # The first dispatcher died without recording anything; its lease runs out
+    assert [(r.id, r.attempts) for r in second.claim(NOW + timedelta(seconds=301))] == [(rid, 2)]
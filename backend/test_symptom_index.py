@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+FalconCare backend - symptom checker tests
+Conditions are ranked by the weighted share of their symptoms that match
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{Path(tempfile.mkdtemp()) / 'falconcare.db'}")
+
+import pytest
+
+from app import app
+from symptom_index import SymptomIndex
+
+CONDITIONS = {
+    'flu': {'fever': 3, 'cough': 2, 'body ache': 2, 'headache': 1},
+    'common cold': {'runny nose': 3, 'sneezing': 3, 'cough': 2},
+    'migraine': {'headache': 4, 'nausea': 2},
+}
+
+
+@pytest.fixture
+def index():
+    return SymptomIndex(CONDITIONS)
+
+
+@pytest.fixture
+def client():
+    yield app.test_client()
+
+
+def test_ranks_by_weighted_match(index):
+    matches, unknown = index.top_k(['Fever', 'headache', 'cough'])
+    assert [m['condition'] for m in matches] == ['flu', 'migraine', 'common cold']
+    assert [m['score'] for m in matches] == [0.75, 0.67, 0.25]
+    assert unknown == []
+
+
+def test_top_k_keeps_the_best(index):
+    matches, _ = index.top_k(['fever', 'headache', 'cough'], k=1)
+    assert [m['condition'] for m in matches] == ['flu']
+
+
+def test_unrecognized_symptoms_are_reported(index):
+    matches, unknown = index.top_k(['sneezing', 'purple spots', 'sneezing'])
+    assert [m['condition'] for m in matches] == ['common cold']
+    assert unknown == ['purple spots']
+    assert index.top_k(['purple spots']) == ([], ['purple spots'])
+
+
+def test_checker_endpoint(client):
+    response = client.post('/api/symptom-checker', json={'symptoms': ['bukhar', 'made up symptom'], 'top_k': 3})
+    body = response.get_json()
+    assert response.status_code == 200
+    assert 0 < len(body['possible_conditions']) <= 3
+    assert body['unrecognized_symptoms'] == ['made up symptom']
+
+
+@pytest.mark.parametrize('top_k', ['abc', None, [3]])
+def test_checker_rejects_bad_top_k(client, top_k):
+    response = client.post('/api/symptom-checker', json={'symptoms': ['fever'], 'top_k': top_k})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'top_k must be an integer'
+
+
+def test_checker_keeps_index_symptoms_verbatim(client):
+    # The normalizer would coarsen 'watery diarrhea' to 'diarrhea'
+    body = client.post('/api/symptom-checker', json={'symptoms': ['watery diarrhea'], 'top_k': 1}).get_json()
+    assert [m['condition'] for m in body['possible_conditions']] == ['cholera']
+    assert body['unrecognized_symptoms'] == []
+
+
+@pytest.mark.parametrize('symptoms', ['fever', ['fever', 3], [None], {'fever': 1}])
+def test_checker_rejects_bad_symptoms(client, symptoms):
+    response = client.post('/api/symptom-checker', json={'symptoms': symptoms})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'symptoms must be an array of strings'
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+FalconCare ASHA Analytics Benchmark
+Streams activity events into the ASHA aggregates and leaderboards
+
+Usage: python benchmarks/bench_asha_analytics.py [workers] [events]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dashboard.asha_analytics import AshaAnalytics
+from dashboard.data_store import DashboardDataStore, DashboardFilters
+from dashboard.synthetic_data import SyntheticDataGenerator
+
+
+def main():
+    n_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_events = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    print("👩‍⚕️ FalconCare ASHA Analytics Benchmark")
+    print("=" * 40)
+
+    generator = SyntheticDataGenerator(seed=42)
+    workers = generator.asha_data(n_workers)
+    events = generator.asha_activity(workers, n_events)
+
+    asha = AshaAnalytics()
+    t0 = time.perf_counter()
+    asha.load_workers(workers)
+    load = time.perf_counter() - t0
+
+    timings = np.empty(n_events)
+    for j, (asha_id, activity, count, timestamp) in enumerate(zip(
+        events["ASHA_ID"], events["Activity"], events["Count"], events["Timestamp"]
+    )):
+        t0 = time.perf_counter()
+        asha.record(asha_id, activity, int(count), timestamp)
+        timings[j] = time.perf_counter() - t0
+    timings *= 1e6
+
+    filters = DashboardFilters(districts=asha.districts[:3])
+    t0 = time.perf_counter()
+    for _ in range(100):
+        asha.summary()
+        asha.top(10)
+        asha.top(10, filters)
+        asha.by_district()
+    query = (time.perf_counter() - t0) / 100
+
+    # The same panels rescanned from the worker table in DuckDB
+    store = DashboardDataStore(data_dir="")
+    store.register_frame("asha_performance", asha.workers_frame())
+    columns = ["Name", "District", "Performance_Score"]
+    t0 = time.perf_counter()
+    for _ in range(10):
+        store.asha_summary(None)
+        store.asha_top(None, 10, columns)
+        store.asha_top(filters, 10, columns)
+        store.asha_by_district(None)
+    rescan = (time.perf_counter() - t0) / 10
+
+    print(f"Workers: {n_workers:,} across {len(asha.districts)} districts")
+    print(f"Initial load: {load * 1000:.1f}ms")
+    print(f"Per event ({n_events:,} events): p50={np.percentile(timings, 50):.1f}µs "
+          f"p99={np.percentile(timings, 99):.1f}µs max={timings.max():.1f}µs")
+    print(f"Dashboard queries (summary + top-10 x2 + by district): {query * 1000:.2f}ms "
+          f"(DuckDB rescan: {rescan * 1000:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
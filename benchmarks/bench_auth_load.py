@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+FalconCare Auth Load Benchmark
+/api/chat latency while a credential-stuffing burst hammers /api/auth/login
+at a fixed rate, with bcrypt unbounded (as when it ran on the request
+thread), on the bounded hashing pool, and on the pool with attempt throttling
+
+Each scenario runs the backend as a threaded server in its own process, and
+the attacker in another.
+
+Usage: python benchmarks/bench_auth_load.py [seconds] [logins_per_sec] [chat_rps] [port]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import requests
+
+BACKEND = Path(__file__).parent.parent / "backend"
+USERS = 1000
+CHAT_MESSAGES = ["I have fever and headache", "mujhe khansi hai", "chest pain since morning", "hello"]
+
+UNTHROTTLED = {"AUTH_IP_BURST": "1000000000", "AUTH_EMAIL_BURST": "1000000000"}
+SCENARIOS = [
+    ("chat only", {}, False),
+    ("bcrypt unbounded (inline)", {"PASSWORD_HASH_WORKERS": "64", "PASSWORD_HASH_QUEUE": "100000", **UNTHROTTLED}, True),
+    ("bcrypt pool, no throttling", {"PASSWORD_HASH_WORKERS": "1", "PASSWORD_HASH_QUEUE": "4", **UNTHROTTLED}, True),
+    ("bcrypt pool + throttling", {"PASSWORD_HASH_WORKERS": "1", "PASSWORD_HASH_QUEUE": "4"}, True),
+]
+
+
+def serve(port):
+    """Server process: seed users, then serve the app with a thread per request"""
+    sys.path.append(str(BACKEND))
+    from werkzeug.serving import make_server
+
+    from app import app, db, PASSWORD_HASHER, User
+    from migrate import upgrade_database
+
+    with app.app_context():
+        upgrade_database(db.engine, db.metadata)
+        if not User.query.first():
+            password_hash = PASSWORD_HASHER.hash("correct horse")
+            db.session.add_all([User(email=f"user{i}@example.org", password_hash=password_hash) for i in range(USERS)])
+            db.session.commit()
+    make_server("127.0.0.1", port, app, threaded=True).serve_forever()
+
+
+def wait_ready(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def attack(port, seconds, rate):
+    """Attacker process: open-loop login attempts with wrong passwords at a fixed rate"""
+    base = f"http://127.0.0.1:{port}"
+    statuses = Counter()
+
+    def attempt(i):
+        try:
+            response = requests.post(f"{base}/api/auth/login", timeout=60,
+                                     json={"email": f"user{i % USERS}@example.org", "password": f"guess{i}"})
+            statuses[response.status_code] += 1
+        except requests.RequestException:
+            statuses["error"] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=512) as pool:
+        for i in range(int(seconds * rate)):
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(attempt, i)
+    print(json.dumps(statuses))
+
+
+def chat(base, seconds, rps):
+    session = requests.Session()
+    latencies = []
+    start = time.perf_counter()
+    for i in range(int(seconds * rps)):
+        # Open loop: each request goes out on schedule however slow the last one was
+        delay = start + i / rps - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        t0 = time.perf_counter()
+        session.post(f"{base}/api/chat", json={"message": CHAT_MESSAGES[i % len(CHAT_MESSAGES)]})
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return np.array(latencies)
+
+
+def run_scenario(env, attacked, seconds, rate, rps, port):
+    database = Path(tempfile.mkdtemp()) / "auth.db"
+    server = subprocess.Popen(
+        [sys.executable, __file__, "serve", str(port)],
+        env={**os.environ, "DATABASE_URL": f"sqlite:///{database}", **env},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        if not wait_ready(f"{base}/api/health"):
+            raise RuntimeError("backend did not start")
+        attacker = None
+        if attacked:
+            attacker = subprocess.Popen([sys.executable, __file__, "attack", str(port), str(seconds + 1), str(rate)],
+                                        stdout=subprocess.PIPE, text=True)
+            time.sleep(1)  # let the burst build up
+        latencies = chat(base, seconds, rps)
+        statuses = json.loads(attacker.communicate()[0]) if attacker else {}
+        return latencies, statuses
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 15
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rps = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+    port = int(sys.argv[4]) if len(sys.argv) > 4 else 5099
+
+    print("🔐 FalconCare Auth Load Benchmark")
+    print("=" * 40)
+    print(f"{rate:g} login attempts/s, /api/chat at {rps:g} req/s for {seconds:g}s, "
+          f"BCRYPT_ROUNDS={os.getenv('BCRYPT_ROUNDS', '12')}, {os.cpu_count()} CPU(s)")
+    results = {}
+    for name, env, attacked in SCENARIOS:
+        latencies, statuses = run_scenario(env, attacked, seconds, rate, rps, port)
+        p50, p99 = np.percentile(latencies, [50, 99])
+        results[name] = p99
+        logins = ", ".join(f"{status}: {n:,}" for status, n in sorted(statuses.items(), key=str))
+        print(f"{name:28s} chat p50 {p50:7.1f}ms  p99 {p99:7.1f}ms  {'logins ' + logins if logins else ''}")
+
+    protected = results["bcrypt pool + throttling"]
+    status = "✅" if protected < 2 * results["chat only"] + 50 else "❌"
+    print(f"{status} chat p99 under login burst: {protected:.1f}ms "
+          f"(unbounded bcrypt: {results['bcrypt unbounded (inline)']:.1f}ms)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "serve":
+        serve(int(sys.argv[2]))
+    elif len(sys.argv) > 4 and sys.argv[1] == "attack":
+        attack(int(sys.argv[2]), float(sys.argv[3]), float(sys.argv[4]))
+    else:
+        main()
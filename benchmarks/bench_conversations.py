@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+FalconCare Conversation Load Benchmark
+Many concurrent simulated users running the FalconCareTester scenarios
+(symptom, emergency, vaccination, myth, multilingual) against the REST
+channel, the WhatsApp webhook and the USSD endpoint
+
+Per-turn latency histograms and throughput are written as JSON tagged with
+the git commit, so runs can be compared across commits.
+
+Servers (override with env):
+    FALCONCARE_REST_URL      http://localhost:5005   (python run.py rest)
+    FALCONCARE_WHATSAPP_URL  http://localhost:5005   (rasa run with the whatsapp channel)
+    FALCONCARE_USSD_URL      http://localhost:5002   (python integrations/sms_ussd_channel.py)
+
+Usage: python benchmarks/bench_conversations.py [users] [seconds] [channels]
+       python benchmarks/bench_conversations.py --compare OLD.json NEW.json
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import aiohttp
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+from conversation_scenarios import (
+    CONVERSATION_FLOW, EMERGENCY_CASES, GREETING_CASES, MULTILINGUAL_CASES,
+    MYTH_CASES, SYMPTOM_CASES, VACCINATION_CASES
+)
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+REST_URL = os.getenv("FALCONCARE_REST_URL", "http://localhost:5005")
+WHATSAPP_URL = os.getenv("FALCONCARE_WHATSAPP_URL", "http://localhost:5005")
+USSD_URL = os.getenv("FALCONCARE_USSD_URL", "http://localhost:5002")
+
+# Each scenario is one conversation: the text turns a user sends, and the
+# USSD menu path a feature-phone user would take for the same need
+SCENARIOS = {
+    "symptom": {
+        "turns": [GREETING_CASES[0]["input"]] + [text for text, _ in CONVERSATION_FLOW]
+                 + [case["input"] for case in SYMPTOM_CASES],
+        "ussd": ["", "1", "2"],
+    },
+    "emergency": {
+        "turns": [case["input"] for case in EMERGENCY_CASES],
+        "ussd": ["", "4"],
+    },
+    "vaccination": {
+        "turns": [case["input"] for case in VACCINATION_CASES],
+        "ussd": ["", "2", "3"],
+    },
+    "myth": {
+        "turns": [case["input"] for case in MYTH_CASES],
+        "ussd": ["", "0"],
+    },
+    "multilingual": {
+        "turns": [case["input"] for case in MULTILINGUAL_CASES],
+        "ussd": ["", "3", "2"],
+    },
+}
+
+CHANNELS = ("rest", "whatsapp", "ussd")
+
+# Histogram bucket upper bounds in milliseconds
+HISTOGRAM_BOUNDS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")]
+
+
+async def send_turn(session, channel, user, conversation, text):
+    """One user turn; returns True on success"""
+    if channel == "rest":
+        payload = {"sender": f"bench-{user}", "message": text}
+        async with session.post(f"{REST_URL}/webhooks/rest/webhook", json=payload) as response:
+            await response.read()
+            return response.status == 200
+    if channel == "whatsapp":
+        # Twilio posts form data; the webhook acknowledges before the bot replies
+        form = {"From": f"whatsapp:+91{9000000000 + user}", "Body": text}
+        async with session.post(f"{WHATSAPP_URL}/webhooks/whatsapp/webhook", data=form) as response:
+            await response.read()
+            return response.status == 200
+    payload = {"input": text, "session_id": f"bench-{user}-{conversation}", "phone": f"+91{9000000000 + user}"}
+    async with session.post(f"{USSD_URL}/ussd", json=payload) as response:
+        await response.json()
+        return response.status == 200
+
+
+async def simulated_user(session, channel, user, deadline, samples, errors):
+    names = list(SCENARIOS)
+    conversation = 0
+    while time.monotonic() < deadline:
+        scenario = names[(user + conversation) % len(names)]
+        turns = SCENARIOS[scenario]["ussd" if channel == "ussd" else "turns"]
+        for text in turns:
+            if time.monotonic() >= deadline:
+                return
+            t0 = time.perf_counter()
+            try:
+                ok = await send_turn(session, channel, user, conversation, text)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                ok = False
+            samples.setdefault(scenario, []).append(time.perf_counter() - t0)
+            if not ok:
+                errors[scenario] = errors.get(scenario, 0) + 1
+        conversation += 1
+
+
+def latency_stats(seconds):
+    ms = np.array(seconds) * 1000
+    counts, _ = np.histogram(ms, bins=[0] + HISTOGRAM_BOUNDS_MS)
+    return {
+        "turns": int(len(ms)),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "histogram": {
+            ("inf" if bound == float("inf") else f"{bound}"): int(count)
+            for bound, count in zip(HISTOGRAM_BOUNDS_MS, counts)
+        },
+    }
+
+
+async def run_channel(channel, users, seconds):
+    samples, errors = {}, {}
+    timeout = aiohttp.ClientTimeout(total=30)
+    connector = aiohttp.TCPConnector(limit=users)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        deadline = time.monotonic() + seconds
+        t0 = time.perf_counter()
+        await asyncio.gather(*(
+            simulated_user(session, channel, user, deadline, samples, errors)
+            for user in range(users)
+        ))
+        elapsed = time.perf_counter() - t0
+
+    all_samples = [s for values in samples.values() for s in values]
+    if not all_samples:
+        return {"turns": 0, "errors": 0}
+    result = latency_stats(all_samples)
+    result["turns_per_sec"] = len(all_samples) / elapsed
+    result["errors"] = sum(errors.values())
+    result["scenarios"] = {
+        scenario: dict(latency_stats(values), errors=errors.get(scenario, 0))
+        for scenario, values in samples.items()
+    }
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old_path, new_path):
+    old, new = json.loads(Path(old_path).read_text()), json.loads(Path(new_path).read_text())
+    print(f"Comparing {old['commit']} → {new['commit']}")
+    for channel in new["channels"]:
+        if channel not in old["channels"] or not new["channels"][channel].get("turns"):
+            continue
+        a, b = old["channels"][channel], new["channels"][channel]
+        print(f"{channel:>9}: " + "  ".join(
+            f"{key} {a[key]:.1f} → {b[key]:.1f} ({(b[key] - a[key]) / a[key]:+.0%})"
+            for key in ("p50_ms", "p99_ms", "turns_per_sec") if a.get(key)
+        ))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--compare":
+        compare(sys.argv[2], sys.argv[3])
+        return
+
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 30
+    channels = sys.argv[3].split(",") if len(sys.argv) > 3 else list(CHANNELS)
+
+    print("📈 FalconCare Conversation Load Benchmark")
+    print("=" * 40)
+    print(f"{users} concurrent users x {seconds:g}s per channel")
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "users": users,
+        "seconds": seconds,
+        "channels": {},
+    }
+    for channel in channels:
+        result = asyncio.run(run_channel(channel, users, seconds))
+        results["channels"][channel] = result
+        if result["turns"]:
+            print(f"{channel:>9}: {result['turns_per_sec']:8.1f} turns/sec  p50={result['p50_ms']:.0f}ms "
+                  f"p99={result['p99_ms']:.0f}ms  errors={result['errors']}/{result['turns']}")
+        else:
+            print(f"{channel:>9}: no turns completed")
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = RESULTS_DIR / f"conversations-{results['commit']}-{datetime.now():%Y%m%d_%H%M%S}.json"
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    print(f"📁 Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+FalconCare Daily Tip Benchmark
+/api/tips/daily against a large tip table: the previous ORDER BY random()
+pick, the first (uncached) deterministic pick of the day, and cached requests
+
+Usage: python benchmarks/bench_daily_tip.py [tips] [requests]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "tips.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import func
+
+from app import app, db, DAILY_TIPS, HealthTip
+
+LOCALES = ("en", "hi", "bn", "ta", "te", "mr")
+
+
+def seed(n):
+    table = HealthTip.__table__
+    now = datetime.utcnow()
+    with db.engine.begin() as connection:
+        for start in range(0, n, 100_000):
+            connection.execute(table.insert(), [
+                {"text": f"Health tip #{i}: drink clean water and wash hands before meals.",
+                 "locale": LOCALES[i % len(LOCALES)], "created_at": now}
+                for i in range(start, min(start + 100_000, n))
+            ])
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    print("💡 FalconCare Daily Tip Benchmark")
+    print("=" * 40)
+    with app.app_context():
+        db.create_all()
+        t0 = time.perf_counter()
+        seed(n)
+        print(f"Seeded {n:,} tips in {len(LOCALES)} locales in {time.perf_counter() - t0:.1f}s")
+
+        random_pick = timed(lambda: HealthTip.query.order_by(func.random()).first(), 5)
+        print(f"ORDER BY random():        {random_pick * 1000:9.2f} ms/request")
+
+        first_pick = timed(lambda: (DAILY_TIPS.clear(), DAILY_TIPS.get("hi")), 5)
+        print(f"first pick of the day:    {first_pick * 1000:9.2f} ms (count + offset, once per locale/day)")
+
+    client = app.test_client()
+    client.get("/api/tips/daily?locale=hi")
+    cached = timed(lambda: client.get("/api/tips/daily?locale=hi"), requests)
+    print(f"cached /api/tips/daily:   {cached * 1000:9.3f} ms/request ({1 / cached:,.0f} req/s through Flask)")
+    print(f"✅ {random_pick / cached:,.0f}x faster than ORDER BY random() per request")
+
+
+if __name__ == "__main__":
+    main()
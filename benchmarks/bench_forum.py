@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+FalconCare Forum Listing Benchmark
+/api/forum over a large post table with a share of unapproved posts: the
+previous fetch-50-then-filter listing, the cached first page, keyset pages
+deep into the feed, and the OFFSET query keyset pagination replaces
+
+Usage: python benchmarks/bench_forum.py [posts] [unapproved_fraction]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "forum.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from app import app, db, FORUM_FIRST_PAGE, ForumPost
+
+
+def seed(n, unapproved, rng):
+    table = ForumPost.__table__
+    start = datetime(2024, 1, 1)
+    with db.engine.begin() as connection:
+        for offset in range(0, n, 200_000):
+            connection.execute(table.insert(), [
+                {"content": f"Post {i}: has anyone had dengue symptoms this week?",
+                 "created_at": start + timedelta(seconds=i * 3), "is_approved": rng.random() >= unapproved}
+                for i in range(offset, min(offset + 200_000, n))
+            ])
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) / repeat, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    unapproved = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+
+    print("💬 FalconCare Forum Listing Benchmark")
+    print("=" * 40)
+    with app.app_context():
+        db.create_all()
+        t0 = time.perf_counter()
+        seed(n, unapproved, random.Random(7))
+        print(f"Seeded {n:,} posts ({unapproved:.0%} unapproved) in {time.perf_counter() - t0:.1f}s")
+
+        def old_listing():
+            posts = ForumPost.query.order_by(ForumPost.created_at.desc()).limit(50).all()
+            return [p for p in posts if p.is_approved]
+
+        elapsed, posts = timed(old_listing, 20)
+        print(f"old fetch-50-then-filter:  {elapsed * 1000:8.2f} ms, {len(posts)} posts per page")
+
+        def offset_page(page):
+            return (ForumPost.query.filter_by(is_approved=True)
+                    .order_by(ForumPost.created_at.desc(), ForumPost.id.desc())
+                    .offset(page * 50).limit(50).all())
+
+    client = app.test_client()
+    FORUM_FIRST_PAGE.invalidate()
+    elapsed, response = timed(lambda: (FORUM_FIRST_PAGE.invalidate(), client.get("/api/forum"))[1], 20)
+    print(f"first page, uncached:      {elapsed * 1000:8.2f} ms, {len(response.get_json()['posts'])} posts per page")
+    elapsed, _ = timed(lambda: client.get("/api/forum"), 2000)
+    print(f"first page, cached:        {elapsed * 1000:8.2f} ms")
+
+    cursor, pages = None, 1000
+    t0 = time.perf_counter()
+    for _ in range(pages):
+        page = client.get("/api/forum", query_string={"before": cursor} if cursor else {}).get_json()
+        cursor = page["next_cursor"]
+    print(f"keyset pages 1-{pages}:       {(time.perf_counter() - t0) / pages * 1000:8.2f} ms/page")
+
+    with app.app_context():
+        elapsed, _ = timed(lambda: offset_page(pages), 5)
+    print(f"OFFSET page {pages}:           {elapsed * 1000:8.2f} ms (what keyset avoids)")
+
+
+if __name__ == "__main__":
+    main()
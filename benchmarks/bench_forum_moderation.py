@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+FalconCare Forum Moderation Benchmark
+Latency of the queued POST /api/forum write, then a backlog of pending posts
+(with duplicates, profanity, phone numbers and myths mixed in) moderated by
+1, 2 and 4 worker processes
+
+Usage: python benchmarks/bench_forum_moderation.py [posts] [batch_size]
+"""
+
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Worker processes inherit the database of the parent
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(tempfile.mkdtemp()) / 'forum_moderation.db'}")
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+import sqlalchemy as sa
+
+from app import app, db, Myth
+from forum_moderation import ForumModerator
+
+TOPICS = ("bukhar", "khansi", "dast", "ulti", "sir dard", "pet dard", "chakkar", "kamzori")
+PLACES = ("Raipur", "Bilaspur", "Durg", "Korba", "Jagdalpur", "Ambikapur")
+
+
+def sample_post(i):
+    kind = i % 20
+    if kind == 0:
+        return "Mere bete ko teen din se tez bukhar hai, kya dengue test karwana chahiye?"
+    if kind == 1:
+        return f"Free medicines, call 98765{i % 100000:05d} now"
+    if kind == 2:
+        return "Yeh doctor chutiya hai, kuch nahi jaanta"
+    if kind == 3:
+        return "Mera padosi keh raha tha alcohol cures covid, kya yeh sach hai?"
+    return (f"{PLACES[i % 6]} se post {i}: {i % 9 + 1} din se {TOPICS[i % 8]} aur {TOPICS[(i // 8) % 8]} hai, "
+            f"umar {i % 70 + 1} saal, PHC {i % 37} mein dikhaya, ab kya karein?")
+
+
+def seed(engine, table, posts):
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [
+            {"content": sample_post(i), "created_at": now, "is_approved": False, "moderation_status": "pending"}
+            for i in range(posts)
+        ])
+
+
+def work(batch_size, results):
+    with app.app_context():
+        engine = db.engine
+    moderator = ForumModerator(engine, batch_size=batch_size)
+    while True:
+        try:
+            if not moderator.run_until_empty():
+                break
+        except sa.exc.OperationalError:
+            time.sleep(0.01)  # another worker holds the SQLite write lock
+    results.put(moderator.stats)
+
+
+def run_workers(workers, batch_size):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [context.Process(target=work, args=(batch_size, results)) for _ in range(workers)]
+    t0 = time.perf_counter()
+    for process in processes:
+        process.start()
+    stats = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - t0
+    totals = {key: sum(s[key] for s in stats) for key in stats[0]}
+    return elapsed, totals
+
+
+def main():
+    posts = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print("🛡️ FalconCare Forum Moderation Benchmark")
+    print("=" * 40)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Myth(claim="Alcohol cures COVID", fact="Alcohol does not cure or prevent COVID-19."))
+        db.session.commit()
+        engine = db.engine
+    table = db.metadata.tables["forum_post"]
+
+    client = app.test_client()
+    latencies = []
+    for i in range(1000):
+        t0 = time.perf_counter()
+        client.post("/api/forum", json={"content": sample_post(i)})
+        latencies.append((time.perf_counter() - t0) * 1000)
+    latencies.sort()
+    print(f"POST /api/forum (queue insert): median {statistics.median(latencies):.2f}ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.2f}ms")
+
+    print(f"Host CPUs: {os.cpu_count()}")
+    for workers in (1, 2, 4):
+        # Redaction rewrites posts, so every run starts from a fresh queue
+        with engine.begin() as connection:
+            connection.execute(table.delete())
+        seed(engine, table, posts)
+        elapsed, totals = run_workers(workers, batch_size)
+        moderated = sum(totals.values())
+        status = "✅" if moderated == posts else "❌"
+        print(f"{status} {workers} worker(s): {moderated:,} posts in {elapsed:.1f}s "
+              f"({moderated / elapsed:,.0f} posts/sec) {totals}")
+
+
+if __name__ == "__main__":
+    main()
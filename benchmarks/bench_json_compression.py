@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+FalconCare JSON and Compression Benchmark
+Serialization CPU of the stdlib and orjson JSON providers, and bytes on the
+wire (with compression CPU) for identity, gzip and brotli, over chat replies,
+a forum page of Hinglish/Devanagari posts, symptom checker results and the
+precompressed static responses; transfer times on 2G and 3G links
+
+Usage: python benchmarks/bench_json_compression.py [repeat]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'json.db'}"
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from flask.json.provider import DefaultJSONProvider
+
+from app import app, db, FORUM_FIRST_PAGE, ForumPost
+from compression import ENCODINGS
+from json_provider import json_provider
+
+LINKS = {"2G (50 kbit/s)": 50_000, "3G (384 kbit/s)": 384_000}
+
+POSTS = [
+    "Mere bete ko teen din se tez bukhar hai aur body pain bhi, kya dengue test karwana chahiye?",
+    "मेरी माँ को दो दिन से खांसी और बुखार है, क्या करें? पास का PHC बंद है।",
+    "Where can I get the polio vaccine for my daughter in Raipur district?",
+    "बच्चे को दस्त और उल्टी हो रही है, ORS कितना देना चाहिए?",
+]
+
+REQUESTS = [
+    ("POST /api/chat (symptom)", "post", "/api/chat", {"json": {"message": "I have a fever since yesterday"}}),
+    ("POST /api/chat (greeting)", "post", "/api/chat", {"json": {"message": "hello"}}),
+    ("POST /api/chat (vaccines)", "post", "/api/chat", {"json": {"message": "vaccination for my baby"}}),
+    ("POST /api/symptom-checker", "post", "/api/symptom-checker",
+     {"json": {"symptoms": ["bukhar", "sir dard", "body pain", "ulti"], "top_k": 10}}),
+    ("GET /api/forum", "get", "/api/forum", {}),
+    ("GET /api/hospitals (static)", "get", "/api/hospitals", {}),
+    ("GET /api/symptoms (static)", "get", "/api/symptoms", {}),
+]
+
+
+def per_call_us(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print("📦 FalconCare JSON and Compression Benchmark")
+    print("=" * 40)
+    with app.app_context():
+        db.create_all()
+        start = datetime(2026, 1, 1)
+        db.session.add_all([
+            ForumPost(content=POSTS[i % len(POSTS)], is_approved=True, moderation_status="approved",
+                      created_at=start + timedelta(minutes=i))
+            for i in range(200)
+        ])
+        db.session.commit()
+    FORUM_FIRST_PAGE.invalidate()
+    client = app.test_client()
+    stdlib, fast = DefaultJSONProvider(app), json_provider(app)
+
+    print(f"Serialization ({type(fast).__name__} vs stdlib DefaultJSONProvider, {repeat} runs)")
+    for name, method, path, kwargs in REQUESTS:
+        payload = getattr(client, method)(path, **kwargs).get_json()
+        slow_us = per_call_us(lambda: stdlib.dumps(payload), repeat)
+        fast_us = per_call_us(lambda: fast.dumps(payload), repeat)
+        slow_size, fast_size = len(stdlib.dumps(payload).encode()), len(fast.dumps(payload).encode())
+        print(f"   {name:30s} {slow_us:7.1f}µs -> {fast_us:6.1f}µs ({slow_us / fast_us:4.1f}x)  "
+              f"{slow_size:6,} -> {fast_size:6,} bytes")
+
+    codings = ["identity", *ENCODINGS]
+    print(f"\nBytes on the wire per response ({', '.join(codings)}) and time per request")
+    totals = dict.fromkeys(codings, 0)
+    for name, method, path, kwargs in REQUESTS:
+        cells = []
+        for coding in codings:
+            headers = {"Accept-Encoding": coding}
+            response = getattr(client, method)(path, headers=headers, **kwargs)
+            size = len(response.get_data())
+            us = per_call_us(lambda: getattr(client, method)(path, headers=headers, **kwargs), max(1, repeat // 10))
+            totals[coding] += size
+            cells.append(f"{coding} {size:6,}B {us / 1000:5.2f}ms")
+        print(f"   {name:30s} " + "  ".join(cells))
+
+    print("\nAll of the above once:")
+    for coding in codings:
+        times = ", ".join(f"{link} {totals[coding] * 8 / bps:5.2f}s" for link, bps in LINKS.items())
+        print(f"   {coding:9s} {totals[coding]:7,} bytes  ({times})")
+    best = min(totals[c] for c in ENCODINGS)
+    print(f"✅ {1 - best / totals['identity']:.0%} fewer bytes than uncompressed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+FalconCare NLU Batch Benchmark
+Messages/sec for one-by-one parsing vs batched and micro-batched parsing
+
+Needs a trained model in models/. Messages come from tests/test_nlu.yml.
+
+Usage: python benchmarks/bench_nlu_batch.py [messages] [batch_size]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+from run import FalconCareBot, parse_messages
+
+
+def test_messages(path=ROOT / "tests" / "test_nlu.yml"):
+    with open(path, encoding="utf-8") as f:
+        nlu = yaml.safe_load(f)["nlu"]
+    return [
+        line.strip()[2:].strip()
+        for item in nlu
+        for line in item.get("examples", "").splitlines()
+        if line.strip().startswith("- ")
+    ]
+
+
+async def run(n_messages, batch_size):
+    bot = FalconCareBot(model_path=str(ROOT / "models"), endpoints_file=str(ROOT / "endpoints.yml"))
+    if not await bot.load_agent():
+        sys.exit(1)
+    # Measure the NLU graph, not parse cache hits on repeated examples
+    bot.parse_cache.maxsize = 0
+    bot.parse_cache.clear()
+    loop = asyncio.get_running_loop()
+
+    examples = test_messages()
+    texts = (examples * (n_messages // len(examples) + 1))[:n_messages]
+
+    t0 = time.perf_counter()
+    for text in texts:
+        await loop.run_in_executor(None, parse_messages, bot.agent, [text])
+    one_by_one = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    await bot.parse_batch(texts, batch_size=batch_size)
+    batched = time.perf_counter() - t0
+
+    # Concurrent messages through the agent, as the channels send them
+    bot.batcher.batch_size = batch_size
+    t0 = time.perf_counter()
+    await asyncio.gather(*(bot.agent.parse_message(text) for text in texts))
+    micro_batched = time.perf_counter() - t0
+    bot.batcher.close()
+
+    print(f"Messages: {n_messages:,} ({len(examples)} distinct from test_nlu.yml), batch size {batch_size}")
+    print(f"One-by-one:    {n_messages / one_by_one:8.1f} msgs/sec")
+    print(f"Batched:       {n_messages / batched:8.1f} msgs/sec ({one_by_one / batched:.1f}x)")
+    print(f"Micro-batched: {n_messages / micro_batched:8.1f} msgs/sec ({one_by_one / micro_batched:.1f}x)")
+
+
+def main():
+    n_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    print("🧠 FalconCare NLU Batch Benchmark")
+    print("=" * 40)
+    asyncio.run(run(n_messages, batch_size))
+
+
+if __name__ == "__main__":
+    main()
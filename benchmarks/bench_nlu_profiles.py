@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+FalconCare NLU Profile Benchmark
+Compares the default (config.yml) and fast (config_fast.yml) pipelines on
+tests/test_nlu.yml: parse latency, resident memory and intent accuracy
+
+Each profile is trained NLU-only into models/profiles/ (once) and measured
+in its own process so memory numbers don't bleed into each other.
+
+Usage: python benchmarks/bench_nlu_profiles.py [repeats]
+"""
+
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+ROOT = Path(__file__).parent.parent
+PROFILES = {
+    "default": ROOT / "config.yml",
+    "fast": ROOT / "config_fast.yml",
+}
+PROFILE_DIR = ROOT / "models" / "profiles"
+
+
+def labelled_examples(path=ROOT / "tests" / "test_nlu.yml"):
+    """(text, intent) pairs from a Rasa NLU test file"""
+    with open(path, encoding="utf-8") as f:
+        nlu = yaml.safe_load(f)["nlu"]
+    return [
+        (line.strip()[2:].strip(), item["intent"])
+        for item in nlu if "intent" in item
+        for line in item.get("examples", "").splitlines()
+        if line.strip().startswith("- ")
+    ]
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def train(profile):
+    model = PROFILE_DIR / f"nlu-{profile}.tar.gz"
+    if not model.exists():
+        print(f"🧠 Training {profile} profile ({PROFILES[profile].name})...")
+        subprocess.run(
+            ["rasa", "train", "nlu", "--config", str(PROFILES[profile]),
+             "--nlu", str(ROOT / "data" / "nlu.yml"), "--out", str(PROFILE_DIR),
+             "--fixed-model-name", f"nlu-{profile}"],
+            cwd=ROOT, check=True
+        )
+    return model
+
+
+async def measure(model, repeats):
+    from rasa.core.agent import Agent
+
+    baseline = rss_mb()
+    t0 = time.perf_counter()
+    agent = Agent.load(model_path=str(model))
+    load = time.perf_counter() - t0
+    loaded = rss_mb()
+
+    examples = labelled_examples()
+    latencies, correct = [], 0
+    for _ in range(repeats):
+        for text, intent in examples:
+            t0 = time.perf_counter()
+            result = await agent.parse_message(text)
+            latencies.append(time.perf_counter() - t0)
+            correct += result["intent"]["name"] == intent
+
+    latencies = np.array(latencies) * 1000
+    return {
+        "load_seconds": load,
+        "model_mb": model.stat().st_size / 1e6,
+        "rss_mb": rss_mb(),
+        "rss_model_mb": loaded - baseline,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "msgs_per_sec": len(latencies) / (latencies.sum() / 1000),
+        "intent_accuracy": correct / len(latencies),
+    }
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--measure":
+        print(json.dumps(asyncio.run(measure(Path(sys.argv[2]), int(sys.argv[3])))))
+        return
+
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("🏎️ FalconCare NLU Profile Benchmark")
+    print("=" * 40)
+
+    results = {}
+    for profile in PROFILES:
+        model = train(profile)
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", str(model), str(repeats)],
+            cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout
+        results[profile] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"Test set: {len(labelled_examples())} examples x {repeats} repeats")
+    print(f"{'':<18}" + "".join(f"{profile:>12}" for profile in results))
+    for key, fmt in [
+        ("load_seconds", "{:>12.1f}"), ("model_mb", "{:>12.1f}"), ("rss_mb", "{:>12.0f}"),
+        ("rss_model_mb", "{:>12.0f}"), ("p50_ms", "{:>12.1f}"), ("p99_ms", "{:>12.1f}"),
+        ("msgs_per_sec", "{:>12.1f}"), ("intent_accuracy", "{:>12.1%}"),
+    ]:
+        print(f"{key:<18}" + "".join(fmt.format(r[key]) for r in results.values()))
+
+
+if __name__ == "__main__":
+    main()
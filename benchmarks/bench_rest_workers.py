@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+FalconCare REST Worker Benchmark
+Throughput of the REST channel at 1, 2, 4 and 8 worker processes
+
+Needs a trained model in models/. More than one worker also needs a shared
+tracker_store and a redis lock_store in endpoints.yml (uncomment its lock_store
+section and point it at a running redis, e.g. docker run -p 6379:6379 redis);
+without them only the 1-worker run is measured.
+
+Usage: python benchmarks/bench_rest_workers.py [requests] [concurrency] [port]
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import numpy as np
+from rasa.core.utils import read_endpoint_config
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+from dashboard.synthetic_data import SyntheticDataGenerator
+
+
+def workers_configured():
+    """Whether endpoints.yml has what run.py needs for more than one worker"""
+    endpoints = str(ROOT / "endpoints.yml")
+    lock_store = read_endpoint_config(endpoints, "lock_store")
+    return (read_endpoint_config(endpoints, "tracker_store") is not None
+            and lock_store is not None and lock_store.type == "redis")
+
+
+async def wait_ready(url, timeout=300):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return True
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(1)
+    return False
+
+
+async def load(url, messages, concurrency):
+    latencies, failures = [], 0
+    queue = asyncio.Queue()
+    for i in range(len(messages)):
+        queue.put_nowait(i)
+
+    async def user(session):
+        nonlocal failures
+        while not queue.empty():
+            i = queue.get_nowait()
+            payload = {"sender": f"bench-{i % 1000}", "message": messages[i]}
+            t0 = time.perf_counter()
+            try:
+                async with session.post(url, json=payload) as response:
+                    await response.read()
+                    if response.status != 200:
+                        failures += 1
+            except aiohttp.ClientError:
+                failures += 1
+            latencies.append(time.perf_counter() - t0)
+
+    async with aiohttp.ClientSession() as session:
+        t0 = time.perf_counter()
+        await asyncio.gather(*(user(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    return elapsed, np.array(latencies) * 1000, failures
+
+
+def main():
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else 5099
+    base = f"http://127.0.0.1:{port}/webhooks/rest"
+
+    print("⚡ FalconCare REST Worker Benchmark")
+    print("=" * 40)
+
+    # Same skewed mix of Hindi, romanized and English inputs for every run
+    messages = SyntheticDataGenerator().chat_messages(n_requests)
+    configured = workers_configured()
+    for workers in (1, 2, 4, 8):
+        if workers > 1 and not configured:
+            print(f"⏭️  {workers} workers: skipped, endpoints.yml needs a shared tracker_store and a redis lock_store")
+            continue
+        server = subprocess.Popen(
+            [sys.executable, "run.py", "rest", "127.0.0.1", str(port), str(workers)],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            if not asyncio.run(wait_ready(f"{base}/")):
+                print(f"❌ {workers} workers: server did not come up")
+                continue
+            elapsed, latencies, failures = asyncio.run(load(f"{base}/webhook", messages, concurrency))
+            print(f"{workers} workers: {n_requests / elapsed:8.1f} msgs/sec  "
+                  f"p50={np.percentile(latencies, 50):.0f}ms p99={np.percentile(latencies, 99):.0f}ms  "
+                  f"failures={failures}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+FalconCare Rollup Benchmark
+Measures the cost of folding new interaction events into the dashboard rollups
+
+Usage: python benchmarks/bench_rollups.py [batches] [batch_size]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dashboard.data_store import DashboardDataStore
+from dashboard.rollups import InteractionRollups
+from dashboard.synthetic_data import SyntheticDataGenerator
+
+
+def main():
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    print("📊 FalconCare Rollup Benchmark")
+    print("=" * 40)
+
+    generator = SyntheticDataGenerator(seed=42)
+    rollups = InteractionRollups(DashboardDataStore(data_dir="/nonexistent"))
+    start = pd.Timestamp.now().floor("h") - pd.Timedelta(hours=batches)
+
+    timings = []
+    for i in range(batches):
+        hour = start + pd.Timedelta(hours=i)
+        events = generator.user_interactions(batch_size, start=hour, end=hour + pd.Timedelta(hours=1))
+        t0 = time.perf_counter()
+        rollups.apply(events)
+        timings.append(time.perf_counter() - t0)
+
+    per_10k = np.array(timings) * (10_000 / batch_size) * 1000
+    rows = rollups.con.execute("SELECT COUNT(*) FROM interactions_hourly").fetchone()[0]
+
+    print(f"Batches: {batches} x {batch_size:,} events")
+    print(f"Hourly rollup rows: {rows:,}")
+    print(f"Update cost per 10k events: p50={np.percentile(per_10k, 50):.1f}ms "
+          f"p95={np.percentile(per_10k, 95):.1f}ms max={per_10k.max():.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+FalconCare Symptom Checker Benchmark
+Top-k differential scoring over a synthetic condition database under
+concurrent load, against the previous per-condition set-overlap loop
+
+Usage: python benchmarks/bench_symptom_checker.py [conditions] [symptoms] [threads] [queries]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from symptom_index import SymptomIndex
+
+
+def synthetic_conditions(n_conditions, n_symptoms, rng):
+    # Zipf-like symptom popularity: fever/cough-style symptoms appear everywhere
+    popularity = 1.0 / np.arange(1, n_symptoms + 1) ** 0.8
+    popularity /= popularity.sum()
+    conditions = {}
+    for c in range(n_conditions):
+        size = rng.integers(5, 16)
+        symptoms = rng.choice(n_symptoms, size=size, replace=False, p=popularity)
+        conditions[f"condition_{c}"] = {f"symptom_{s}": int(rng.integers(1, 4)) for s in symptoms}
+    return conditions
+
+
+def naive_top_k(conditions, query, k):
+    """The original /api/symptom-checker loop, generalized to weights"""
+    matches = []
+    for name, symptoms in conditions.items():
+        overlap = query & symptoms.keys()
+        if overlap:
+            matches.append((sum(symptoms[s] for s in overlap) / sum(symptoms.values()), name))
+    matches.sort(reverse=True)
+    return matches[:k]
+
+
+def main():
+    n_conditions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_symptoms = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    n_queries = int(sys.argv[4]) if len(sys.argv) > 4 else 20000
+
+    print("🩺 FalconCare Symptom Checker Benchmark")
+    print("=" * 40)
+
+    rng = np.random.default_rng(11)
+    conditions = synthetic_conditions(n_conditions, n_symptoms, rng)
+    t0 = time.perf_counter()
+    index = SymptomIndex(conditions)
+    build = time.perf_counter() - t0
+
+    queries = [
+        [f"symptom_{s}" for s in rng.choice(n_symptoms, size=rng.integers(2, 7), replace=False)]
+        for _ in range(n_queries)
+    ]
+
+    def timed(query):
+        t0 = time.perf_counter()
+        index.top_k(query, 5)
+        return time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = np.array(list(pool.map(timed, queries))) * 1000
+    elapsed = time.perf_counter() - t0
+
+    sample = queries[:200]
+    t0 = time.perf_counter()
+    for query in sample:
+        naive_top_k(conditions, set(query), 5)
+    naive = (time.perf_counter() - t0) / len(sample) * 1000
+
+    print(f"Database: {n_conditions:,} conditions x {len(index.symptoms):,} symptoms "
+          f"({len(index.posting_conditions):,} weighted links), built in {build * 1000:.0f}ms")
+    print(f"{threads} threads, {n_queries:,} queries: {n_queries / elapsed:,.0f} queries/sec  "
+          f"p50={np.percentile(latencies, 50):.3f}ms p99={np.percentile(latencies, 99):.3f}ms")
+    print(f"Set-overlap loop: {naive:.2f}ms per query")
+
+
+if __name__ == "__main__":
+    main()
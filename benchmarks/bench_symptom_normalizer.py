@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+FalconCare Symptom Normalizer Benchmark
+Single-core normalization throughput over a mix of English, Devanagari and
+romanized Hindi messages (target: 100k messages/sec), against the previous
+per-keyword substring scans
+
+Usage: python benchmarks/bench_symptom_normalizer.py [messages]
+"""
+
+import random
+import sys
+import time
+
+from symptom_normalizer import NORMALIZER, SYMPTOM_LEXICON
+
+TEMPLATES = [
+    "I have {} since 2 days",
+    "मुझे {} है",
+    "{} hai kya karu",
+    "mere bachche ko {} aur {} hai",
+    "{} ho raha hai doctor kab dikhau",
+    "hello, what should I do about {}?",
+    "namaste ji",
+    "टीका कब लगेगा",
+]
+
+TARGET_PER_SEC = 100_000
+
+
+def synthetic_messages(n, seed=42):
+    rng = random.Random(seed)
+    variants = [v for forms in SYMPTOM_LEXICON.values() for v in forms]
+    messages = []
+    for _ in range(n):
+        template = rng.choice(TEMPLATES)
+        messages.append(template.format(*(rng.choice(variants) for _ in range(template.count("{}")))))
+    return messages
+
+
+def substring_symptoms(text):
+    """The previous approach: scan every surface form as a substring"""
+    text = text.lower()
+    return [symptom for symptom, forms in SYMPTOM_LEXICON.items() if any(form in text for form in forms)]
+
+
+def bench(fn, messages):
+    t0 = time.perf_counter()
+    for message in messages:
+        fn(message)
+    return len(messages) / (time.perf_counter() - t0)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print("🔤 FalconCare Symptom Normalizer Benchmark")
+    print("=" * 40)
+    messages = synthetic_messages(n)
+    surface_forms = sum(len(forms) for forms in SYMPTOM_LEXICON.values())
+    print(f"{n:,} messages, {len(SYMPTOM_LEXICON)} symptoms, {surface_forms} surface forms")
+
+    bench(NORMALIZER.symptoms, messages[:10_000])  # warm up
+    trie_rate = bench(NORMALIZER.symptoms, messages)
+    scan_rate = bench(substring_symptoms, messages[:max(1, n // 20)])
+
+    print(f"   token trie: {trie_rate:12,.0f} msgs/sec")
+    print(f"   substrings: {scan_rate:12,.0f} msgs/sec  (trie {trie_rate / scan_rate:.1f}x faster)")
+    status = "✅" if trie_rate >= TARGET_PER_SEC else "❌"
+    print(f"{status} target {TARGET_PER_SEC:,} msgs/sec on one core")
+
+
+if __name__ == "__main__":
+    main()
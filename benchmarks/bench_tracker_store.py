@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+FalconCare Tracker Store Benchmark
+Process memory with many simulated senders: in-memory vs bounded SQLite store,
+plus history compaction for one long-lived WhatsApp user
+
+Each store runs in its own process so peak RSS is attributable.
+
+Usage: python benchmarks/bench_tracker_store.py [senders] [turns_per_sender]
+"""
+
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def conversation(sender_id, turns, start=0.0):
+    from rasa.shared.core.events import ActionExecuted, BotUttered, SessionStarted, UserUttered
+
+    events = [ActionExecuted("action_session_start", timestamp=start),
+              SessionStarted(timestamp=start),
+              ActionExecuted("action_listen", timestamp=start)]
+    for turn in range(turns):
+        t = start + turn + 1
+        events += [
+            UserUttered("mujhe bukhar hai", {"name": "symptom_query", "confidence": 0.93}, timestamp=t),
+            ActionExecuted("action_triage_symptoms", timestamp=t),
+            BotUttered("Aapko kitne din se bukhar hai?", timestamp=t),
+            ActionExecuted("action_listen", timestamp=t),
+        ]
+    return events
+
+
+def make_store(kind, db_path):
+    from rasa.core.tracker_store import InMemoryTrackerStore
+    from bounded_tracker_store import BoundedSQLTrackerStore
+
+    if kind == "memory":
+        return InMemoryTrackerStore(None)
+    return BoundedSQLTrackerStore(dialect="sqlite", db=str(db_path), max_events=200, keep_events=100)
+
+
+async def measure(kind, senders, turns):
+    from rasa.shared.core.trackers import DialogueStateTracker
+
+    db_path = Path(tempfile.mkdtemp()) / "trackers.db"
+    store = make_store(kind, db_path)
+    baseline = rss_mb()
+
+    t0 = time.perf_counter()
+    for i in range(senders):
+        sender_id = f"whatsapp:+91{9000000000 + i}"
+        await store.save(DialogueStateTracker.from_events(sender_id, conversation(sender_id, turns)))
+    elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(0, senders, max(senders // 1000, 1)):
+        await store.retrieve(f"whatsapp:+91{9000000000 + i}")
+    retrieve = (time.perf_counter() - t0) / min(senders, 1000)
+
+    result = {
+        "store": kind,
+        "senders": senders,
+        "rss_growth_mb": rss_mb() - baseline,
+        "saves_per_sec": senders / elapsed,
+        "retrieve_ms": retrieve * 1000,
+    }
+    if kind == "sqlite":
+        result["db_mb"] = db_path.stat().st_size / 1e6
+
+        # One user chatting every day for years
+        sender_id = "whatsapp:+919999999999"
+        tracker = DialogueStateTracker.from_events(sender_id, conversation(sender_id, 1))
+        for turn in range(2000):
+            tracker.update_with_events(conversation(sender_id, 1, start=turn * 10)[3:], None)
+            await store.save(tracker)
+            tracker = await store.retrieve(sender_id)
+        result["long_lived_rows_after_2000_turns"] = store.stored_events(sender_id)
+    return result
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        print(json.dumps(asyncio.run(measure(sys.argv[2], int(sys.argv[3]), int(sys.argv[4])))))
+        return
+
+    senders = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print("💾 FalconCare Tracker Store Benchmark")
+    print("=" * 40)
+    print(f"Senders: {senders:,}, {turns} turns each")
+
+    for kind in ("memory", "sqlite"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", kind, str(senders), str(turns)],
+            cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{kind:>7}: RSS +{r['rss_growth_mb']:,.0f}MB "
+              f"({r['rss_growth_mb'] * 1024 * 1024 / senders:,.0f} bytes/sender), "
+              f"{r['saves_per_sec']:,.0f} saves/sec, retrieve {r['retrieve_ms']:.2f}ms")
+        if kind == "sqlite":
+            print(f"         DB size {r['db_mb']:,.0f}MB; long-lived sender stored rows after "
+                  f"2000 turns: {r['long_lived_rows_after_2000_turns']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+FalconCare User Cache Benchmark
+DB round trips and latency per request for signed-in users: each user signs
+up, opens their profile, saves it, reads it, their reminders and diary a few
+times, and edits the profile; duplicate signups are attempted too
+
+Usage: python benchmarks/bench_user_cache.py [users] [reads_per_user]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'users.db'}"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# All signups come from one test client address
+os.environ.setdefault("AUTH_IP_BURST", "1000000000")
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+import sqlalchemy as sa
+
+from app import app, db
+from migrate import upgrade_database
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    reads = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print("👤 FalconCare User Cache Benchmark")
+    print("=" * 40)
+    with app.app_context():
+        upgrade_database(db.engine, db.metadata)
+        engine = db.engine
+    client = app.test_client()
+
+    statements = [0]
+    sa.event.listen(engine, "before_cursor_execute", lambda *args: statements.__setitem__(0, statements[0] + 1))
+    trips, elapsed, calls = defaultdict(int), defaultdict(float), defaultdict(int)
+
+    def call(name, method, path, **kwargs):
+        before, t0 = statements[0], time.perf_counter()
+        response = getattr(client, method)(path, **kwargs)
+        elapsed[name] += time.perf_counter() - t0
+        trips[name] += statements[0] - before
+        calls[name] += 1
+        return response
+
+    for i in range(users):
+        credentials = {"email": f"user{i}@example.org", "password": "correct horse"}
+        token = call("POST /api/auth/signup", "post", "/api/auth/signup", json=credentials).get_json()["accessToken"]
+        call("POST /api/auth/signup (taken)", "post", "/api/auth/signup", json=credentials)
+        headers = {"Authorization": f"Bearer {token}"}
+        call("GET /api/profile", "get", "/api/profile", headers=headers)
+        call("POST /api/profile", "post", "/api/profile", headers=headers, json={"age": 30 + i % 40, "gender": "f"})
+        for _ in range(reads):
+            call("GET /api/profile", "get", "/api/profile", headers=headers)
+            call("GET /api/reminders", "get", "/api/reminders", headers=headers)
+            call("GET /api/diary", "get", "/api/diary", headers=headers)
+        call("POST /api/profile (edit)", "post", "/api/profile", headers=headers, json={"weight_kg": 55.5})
+
+    print(f"{users} users, {reads} reads each")
+    for name in calls:
+        print(f"{name:32s} {trips[name] / calls[name]:5.2f} statements/request  "
+              f"{elapsed[name] / calls[name] * 1000:6.2f}ms")
+    total = sum(calls.values())
+    print(f"{'all requests':32s} {sum(trips.values()) / total:5.2f} statements/request  "
+          f"{sum(elapsed.values()) / total * 1000:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
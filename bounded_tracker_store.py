@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+FalconCare Tracker Store
+SQL tracker store (SQLite or PostgreSQL) with bounded per-sender event history
+and a retention job for idle conversations
+
+Configured in endpoints.yml:
+
+    tracker_store:
+      type: bounded_tracker_store.BoundedSQLTrackerStore
+      dialect: sqlite
+      db: trackers.db
+      max_events: 200
+      keep_events: 100
+      count_every: 50
+
+Retention (e.g. from cron): python bounded_tracker_store.py expire [days]
+"""
+
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+import sqlalchemy as sa
+from rasa.core.tracker_store import SQLTrackerStore, TrackerStore
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
+from rasa.shared.core.events import ActionExecuted, SessionStarted, SlotSet, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+
+logger = logging.getLogger(__name__)
+
+# Days without a message after which a conversation is deleted
+DEFAULT_RETENTION_DAYS = 30
+
+
+def compact_events(events, sender_id, slots, keep_events):
+    """
+    Current session of a conversation, shortened to its last keep_events events
+
+    Earlier sessions are dropped (slots are carried into each new session by
+    the domain's session_config). Within the session, the dropped prefix is
+    replaced by a session start that re-sets the slot values it produced, and
+    the kept tail starts at a user turn so policies featurize whole turns.
+    """
+    events = list(events)
+    starts = [
+        i for i, event in enumerate(events)
+        if isinstance(event, ActionExecuted) and event.action_name == ACTION_SESSION_START_NAME
+    ]
+    session = events[starts[-1]:] if starts else events
+    if len(session) <= keep_events:
+        return session
+
+    cut = len(session) - keep_events
+    while cut < len(session) and not isinstance(session[cut], UserUttered):
+        cut += 1
+    if cut >= len(session):
+        return session
+
+    prefix = DialogueStateTracker.from_events(sender_id, session[:cut], slots=slots)
+    timestamp = session[cut - 1].timestamp
+    header = [
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=timestamp),
+        SessionStarted(timestamp=timestamp),
+    ]
+    header += [
+        SlotSet(name, value, timestamp=timestamp)
+        for name, value in prefix.current_slot_values().items()
+        if value is not None
+    ]
+    header.append(ActionExecuted(ACTION_LISTEN_NAME, timestamp=timestamp))
+    return header + session[cut:]
+
+
+class BoundedSQLTrackerStore(SQLTrackerStore):
+    """
+    SQLTrackerStore that compacts a sender's stored history once it exceeds
+    max_events rows, so long-lived WhatsApp users don't grow without bound
+
+    Saves don't count rows: the loaded session is a lower bound on what is
+    stored, so a long session triggers compaction for free. Rows left by
+    earlier sessions are only counted on every count_every-th save.
+    """
+
+    def __init__(self, domain=None, max_events=200, keep_events=100, count_every=50, **kwargs):
+        super().__init__(domain=domain, **kwargs)
+        self.max_events = int(max_events)
+        self.keep_events = int(keep_events)
+        self.count_every = max(int(count_every), 1)
+        self.saves = 0
+        with self.engine.begin() as connection:
+            connection.execute(sa.text(
+                "CREATE INDEX IF NOT EXISTS ix_events_sender_timestamp "
+                "ON events (sender_id, timestamp)"
+            ))
+
+    def _event_row(self, sender_id, event):
+        data = event.as_dict()
+        return self.SQLEvent(
+            sender_id=sender_id,
+            type_name=event.type_name,
+            timestamp=data.get("timestamp"),
+            intent_name=data.get("parse_data", {}).get("intent", {}).get("name"),
+            action_name=data.get("name"),
+            data=json.dumps(data),
+        )
+
+    def stored_events(self, sender_id):
+        with self.session_scope() as session:
+            return session.query(self.SQLEvent).filter(self.SQLEvent.sender_id == sender_id).count()
+
+    async def save(self, tracker):
+        await super().save(tracker)
+        self.saves += 1
+        if len(tracker.events) > self.max_events or (
+            self.saves % self.count_every == 0
+            and self.stored_events(tracker.sender_id) > self.max_events
+        ):
+            self.compact(tracker)
+
+    def compact(self, tracker):
+        """Rewrite a sender's rows as the compacted current session"""
+        slots = self.domain.slots if self.domain else []
+        events = compact_events(tracker.events, tracker.sender_id, slots, self.keep_events)
+        with self.session_scope() as session:
+            session.query(self.SQLEvent).filter(self.SQLEvent.sender_id == tracker.sender_id).delete()
+            session.add_all([self._event_row(tracker.sender_id, event) for event in events])
+            session.commit()
+        logger.debug(f"Compacted tracker {tracker.sender_id} to {len(events)} events")
+
+    def expire_idle(self, max_idle_days=DEFAULT_RETENTION_DAYS):
+        """Delete every conversation whose last event is older than max_idle_days"""
+        cutoff = time.time() - max_idle_days * 86400
+        with self.session_scope() as session:
+            result = session.execute(sa.text("""
+                DELETE FROM events WHERE sender_id IN (
+                    SELECT sender_id FROM events
+                    GROUP BY sender_id
+                    HAVING MAX(timestamp) < :cutoff
+                )
+            """), {"cutoff": cutoff})
+            session.commit()
+            return result.rowcount
+
+
+if __name__ == "__main__":
+    from rasa.core.utils import read_endpoint_config
+
+    # Usage: python bounded_tracker_store.py expire [days] [endpoints.yml]
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) < 2 or sys.argv[1] != "expire":
+        print("Usage: python bounded_tracker_store.py expire [days] [endpoints.yml]")
+        sys.exit(1)
+
+    days = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RETENTION_DAYS
+    endpoints = sys.argv[3] if len(sys.argv) > 3 else str(Path(__file__).parent / "endpoints.yml")
+    store = TrackerStore.create(read_endpoint_config(endpoints, "tracker_store"))
+    if not isinstance(store, BoundedSQLTrackerStore):
+        print("❌ endpoints.yml tracker_store is not a BoundedSQLTrackerStore")
+        sys.exit(1)
+
+    deleted = store.expire_idle(days)
+    print(f"✅ Deleted {deleted} events from conversations idle for more than {days:g} days")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+FalconCare - Conversation Scenarios
+Sample user messages with their expected intents, shared by the test suite
+(test_health_guardian.py) and the load benchmark (benchmarks/bench_conversations.py)
+"""
+
+GREETING_CASES = [
+    {
+        "input": "नमस्ते",
+        "expected_intent": "greet",
+        "description": "Hindi greeting"
+    },
+    {
+        "input": "Hello",
+        "expected_intent": "greet", 
+        "description": "English greeting"
+    },
+    {
+        "input": "आप कौन हैं?",
+        "expected_intent": "bot_challenge",
+        "description": "Bot identity question in Hindi"
+    },
+    {
+        "input": "What can you do?",
+        "expected_intent": "bot_capabilities",
+        "description": "Capabilities inquiry"
+    }
+]
+
+SYMPTOM_CASES = [
+    {
+        "input": "मुझे बुखार है",
+        "expected_intent": "symptom_fever",
+        "expected_entities": ["symptom"],
+        "description": "Fever in Hindi"
+    },
+    {
+        "input": "I have a cough since 3 days",
+        "expected_intent": "symptom_cough", 
+        "expected_entities": ["symptom", "duration"],
+        "description": "Cough with duration"
+    },
+    {
+        "input": "पेट में दर्द हो रहा है",
+        "expected_intent": "symptom_stomachache",
+        "expected_entities": ["symptom"],
+        "description": "Stomach pain in Hindi"
+    },
+    {
+        "input": "सिरदर्द बहुत तेज है",
+        "expected_intent": "symptom_headache",
+        "expected_entities": ["symptom", "severity"],
+        "description": "Severe headache"
+    }
+]
+
+EMERGENCY_CASES = [
+    {
+        "input": "सीने में तेज दर्द है",
+        "expected_intent": "emergency_severe",
+        "triage_level": "RED",
+        "description": "Chest pain emergency"
+    },
+    {
+        "input": "सांस नहीं आ रही",
+        "expected_intent": "symptom_breathing",
+        "triage_level": "RED", 
+        "description": "Breathing difficulty"
+    },
+    {
+        "input": "accident happened, bleeding heavily",
+        "expected_intent": "emergency_severe",
+        "triage_level": "RED",
+        "description": "Accident with bleeding"
+    },
+    {
+        "input": "3 दिन से तेज बुखार है",
+        "expected_intent": "symptom_fever",
+        "triage_level": "YELLOW",
+        "description": "Persistent high fever"
+    }
+]
+
+VACCINATION_CASES = [
+    {
+        "input": "बच्चे का टीका कब लगवाएं",
+        "expected_intent": "vaccination_child",
+        "description": "Child vaccination inquiry"
+    },
+    {
+        "input": "कोविड वैक्सीन कहां मिलेगी",
+        "expected_intent": "vaccination_covid",
+        "description": "COVID vaccine location"
+    },
+    {
+        "input": "vaccination schedule for 6 months baby",
+        "expected_intent": "vaccination_schedule",
+        "description": "Vaccination schedule"
+    }
+]
+
+MYTH_CASES = [
+    {
+        "input": "हल्दी से कैंसर ठीक हो जाता है",
+        "expected_intent": "myth_home_remedies",
+        "description": "Turmeric cancer cure myth"
+    },
+    {
+        "input": "TB छूने से फैलता है",
+        "expected_intent": "myth_false_cures", 
+        "description": "TB transmission myth"
+    },
+    {
+        "input": "गौमूत्र से कोविड ठीक होता है",
+        "expected_intent": "myth_false_cures",
+        "description": "COVID cure myth"
+    }
+]
+
+MULTILINGUAL_CASES = [
+    {
+        "input": "नमस्ते डॉक्टर",
+        "language": "Hindi (Devanagari)",
+        "expected_intent": "greet"
+    },
+    {
+        "input": "namaste doctor",
+        "language": "Hindi (Roman)",
+        "expected_intent": "greet"
+    },
+    {
+        "input": "bukhar hai",
+        "language": "Hindi (Roman)",
+        "expected_intent": "symptom_fever"
+    },
+    {
+        "input": "pet dard",
+        "language": "Hindi (Roman)",
+        "expected_intent": "symptom_stomachache"
+    }
+]
+
+CONVERSATION_FLOW = [
+    ("मुझे बुखार है", "symptom_fever"),
+    ("3 दिन से", "inform_duration"), 
+    ("बहुत तेज", "inform_severity"),
+    ("सिरदर्द भी है", "inform_symptom")
+]
@@ -0,0 +1,277 @@
+# FalconCare - ASHA Performance Analytics
+# Incrementally maintained per-district aggregates and top-k leaderboards
+# fed by a stream of ASHA worker activity events
+
+import heapq
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+# Activity type -> (counter column, leaderboard points)
+ACTIVITIES = {
+    "household_visit": ("Households_Visited", 1),
+    "emergency_response": ("Emergency_Responses", 5),
+    "education_session": ("Health_Education_Sessions", 3),
+    "vaccination_referral": ("Vaccination_Referrals", 2),
+}
+
+COUNTER_COLUMNS = [column for column, _ in ACTIVITIES.values()]
+ACTIVITY_POINTS = np.array([points for _, points in ACTIVITIES.values()], dtype=float)
+
+SCORE_BINS = 20
+
+
+class TopK:
+    """
+    Bounded min-heap of the k highest scores
+
+    Scores only ever increase, so a worker already on the board gets a fresh
+    entry and its old one is invalidated lazily: O(log k) per offer.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+        self.entries = {}
+
+    def _drop_stale(self):
+        while self.heap and not self.heap[0][2]:
+            heapq.heappop(self.heap)
+
+    def _compact(self):
+        self.heap = list(self.entries.values())
+        heapq.heapify(self.heap)
+
+    def offer(self, score, worker):
+        entry = self.entries.get(worker)
+        if entry is not None:
+            entry[2] = False
+            entry = [score, worker, True]
+            self.entries[worker] = entry
+            heapq.heappush(self.heap, entry)
+            if len(self.heap) > 4 * self.k:
+                self._compact()
+            return
+
+        self._drop_stale()
+        if len(self.entries) < self.k:
+            entry = [score, worker, True]
+            self.entries[worker] = entry
+            heapq.heappush(self.heap, entry)
+        elif score > self.heap[0][0]:
+            entry = [score, worker, True]
+            self.entries[worker] = entry
+            evicted = heapq.heapreplace(self.heap, entry)
+            del self.entries[evicted[1]]
+            self._drop_stale()
+
+    def items(self):
+        """(score, worker) pairs, best first"""
+        return sorted(((e[0], e[1]) for e in self.entries.values()), reverse=True)
+
+
+class AshaAnalytics:
+    """
+    ASHA worker registry with streaming activity aggregates
+
+    Performance_Score starts from the worker snapshot's own score and is
+    raised towards 1 by activity logged since: each logged point closes
+    1/score_scale of the remaining gap, so it stays monotone in activity.
+    """
+
+    def __init__(self, store=None, k=10, score_scale=200.0):
+        self.store = store
+        self.k = k
+        self.score_scale = score_scale
+        if store is not None:
+            store.con.execute("""
+                CREATE TABLE IF NOT EXISTS asha_activity (
+                    ASHA_ID VARCHAR,
+                    Activity VARCHAR,
+                    Count INTEGER,
+                    Timestamp TIMESTAMP
+                )
+            """)
+
+    # ---------- Registry ----------
+    def load_workers(self, workers):
+        """
+        Initialize state from a worker snapshot (the asha_performance shape),
+        then replay the activity already logged to the store
+        """
+        self.ids = workers["ASHA_ID"].astype(str).to_numpy()
+        self.names = workers["Name"].astype(str).to_numpy()
+        self.index = {asha_id: i for i, asha_id in enumerate(self.ids)}
+
+        district = pd.Categorical(workers["District"])
+        self.districts = list(district.categories)
+        self.district_of = district.codes.astype(np.int32)
+        self.villages = workers["Villages_Covered"].to_numpy()
+        self.last_active = workers["Last_Active"].to_numpy(dtype="datetime64[us]").copy()
+
+        self.counters = workers[COUNTER_COLUMNS].to_numpy(dtype=np.int64).copy()
+        self.base_scores = workers["Performance_Score"].to_numpy(dtype=float).copy()
+        self.event_points = np.zeros(len(self.ids))
+        self.replayed = self._replay() if self.store is not None else 0
+        self.scores = self._score(self.base_scores, self.event_points)
+
+        n_districts = len(self.districts)
+        self.district_workers = np.bincount(self.district_of, minlength=n_districts)
+        self.district_counters = np.zeros((n_districts, len(COUNTER_COLUMNS)), dtype=np.int64)
+        np.add.at(self.district_counters, self.district_of, self.counters)
+        self.district_score_sum = np.bincount(self.district_of, weights=self.scores, minlength=n_districts)
+        self.score_hist = np.zeros((n_districts, SCORE_BINS), dtype=np.int64)
+        np.add.at(self.score_hist, (self.district_of, self._bin(self.scores)), 1)
+
+        # Seed leaderboards from the k best per district; the global board
+        # is a subset of the union of district boards
+        self.top_global = TopK(self.k)
+        self.top_district = [TopK(self.k) for _ in self.districts]
+        order = np.lexsort((-self.scores, self.district_of))
+        starts = np.searchsorted(self.district_of[order], np.arange(n_districts))
+        for d in range(n_districts):
+            for i in order[starts[d]:starts[d] + self.k]:
+                self.top_district[d].offer(self.scores[i], int(i))
+                self.top_global.offer(self.scores[i], int(i))
+
+    def _replay(self):
+        """Fold the logged asha_activity totals into counters; returns the events replayed"""
+        totals = self.store.query("""
+            SELECT ASHA_ID, Activity, SUM(Count) AS Count, MAX(Timestamp) AS Timestamp, COUNT(*) AS Events
+            FROM asha_activity
+            GROUP BY ASHA_ID, Activity
+        """)
+        rows = totals["ASHA_ID"].map(self.index)
+        columns = totals["Activity"].map({activity: c for c, activity in enumerate(ACTIVITIES)})
+        known = rows.notna() & columns.notna()
+        if not known.any():
+            return 0
+
+        rows = rows[known].to_numpy(dtype=np.int64)
+        columns = columns[known].to_numpy(dtype=np.int64)
+        counts = totals["Count"][known].to_numpy(dtype=np.int64)
+        np.add.at(self.counters, (rows, columns), counts)
+        np.add.at(self.event_points, rows, ACTIVITY_POINTS[columns] * counts)
+        latest = totals["Timestamp"][known].to_numpy(dtype="datetime64[us]")
+        np.maximum.at(self.last_active, rows, latest)
+        return int(totals["Events"][known].sum())
+
+    def _score(self, base, points):
+        """Source score raised towards 1 by activity points, monotone in both"""
+        return 1.0 - (1.0 - base) * np.exp(-np.asarray(points, dtype=float) / self.score_scale)
+
+    def _bin(self, scores):
+        return np.minimum((np.asarray(scores) * SCORE_BINS).astype(np.int64), SCORE_BINS - 1)
+
+    # ---------- Events ----------
+    def record(self, asha_id, activity, count=1, timestamp=None):
+        """Apply one activity event; O(1) aggregates plus O(log k) leaderboards"""
+        i = self.index[asha_id]
+        column = list(ACTIVITIES).index(activity)
+        d = self.district_of[i]
+
+        old_score = self.scores[i]
+        self.counters[i, column] += count
+        self.district_counters[d, column] += count
+        self.event_points[i] += ACTIVITY_POINTS[column] * count
+        new_score = float(self._score(self.base_scores[i], self.event_points[i]))
+        self.scores[i] = new_score
+        self.last_active[i] = max(self.last_active[i], np.datetime64(timestamp or datetime.now(), "us"))
+
+        self.district_score_sum[d] += new_score - old_score
+        self.score_hist[d, self._bin(old_score)] -= 1
+        self.score_hist[d, self._bin(new_score)] += 1
+
+        self.top_district[d].offer(new_score, i)
+        self.top_global.offer(new_score, i)
+
+    def apply_events(self, events):
+        """
+        Apply a batch of ASHA_ID/Activity/Count/Timestamp events and log them;
+        events for unknown workers or activities are skipped, not logged.
+        Returns the number of events applied
+        """
+        known = events["ASHA_ID"].isin(self.index) & events["Activity"].isin(ACTIVITIES)
+        events = events[known.to_numpy()]
+        if self.store is not None and len(events):
+            self.store.con.register("asha_activity_batch", events)
+            self.store.con.execute("""
+                INSERT INTO asha_activity
+                SELECT ASHA_ID, Activity, Count, Timestamp FROM asha_activity_batch
+            """)
+            self.store.con.unregister("asha_activity_batch")
+
+        for asha_id, activity, count, timestamp in zip(
+            events["ASHA_ID"], events["Activity"], events["Count"], events["Timestamp"]
+        ):
+            self.record(asha_id, activity, int(count), timestamp)
+        return len(events)
+
+    # ---------- Queries ----------
+    def _district_ids(self, filters):
+        if filters is None or filters.districts is None:
+            return list(range(len(self.districts)))
+        wanted = set(filters.districts)
+        return [d for d, name in enumerate(self.districts) if name in wanted]
+
+    def summary(self, filters=None):
+        ids = self._district_ids(filters)
+        workers = int(self.district_workers[ids].sum())
+        counters = self.district_counters[ids].sum(axis=0)
+        return {
+            "active": workers,
+            "avg_performance": float(self.district_score_sum[ids].sum() / workers) if workers else 0.0,
+            "households": int(counters[0]),
+            "emergency_responses": int(counters[1]),
+        }
+
+    def by_district(self, filters=None):
+        ids = self._district_ids(filters)
+        workers = np.maximum(self.district_workers[ids], 1)
+        frame = pd.DataFrame(self.district_counters[ids], columns=COUNTER_COLUMNS)
+        frame.insert(0, "District", [self.districts[d] for d in ids])
+        frame.insert(1, "Performance_Score", self.district_score_sum[ids] / workers)
+        return frame
+
+    def score_histogram(self, filters=None):
+        ids = self._district_ids(filters)
+        edges = np.linspace(0.0, 1.0, SCORE_BINS + 1)
+        return pd.DataFrame({
+            "Performance_Score": (edges[:-1] + edges[1:]) / 2,
+            "ASHA_Workers": self.score_hist[ids].sum(axis=0),
+        })
+
+    def top(self, n, filters=None, columns=None):
+        """Top-n workers (n <= k) from the maintained leaderboards"""
+        ids = self._district_ids(filters)
+        if len(ids) == len(self.districts):
+            best = self.top_global.items()[:n]
+        else:
+            best = heapq.nlargest(n, (item for d in ids for item in self.top_district[d].items()))
+
+        rows = [i for _, i in best]
+        frame = pd.DataFrame({
+            "ASHA_ID": self.ids[rows],
+            "Name": self.names[rows],
+            "District": [self.districts[self.district_of[i]] for i in rows],
+            "Performance_Score": self.scores[rows],
+        })
+        for c, column in enumerate(COUNTER_COLUMNS):
+            frame[column] = self.counters[rows, c]
+        return frame[columns] if columns else frame
+
+    def workers_frame(self):
+        """Current per-worker state in the asha_performance table shape"""
+        frame = pd.DataFrame({
+            "ASHA_ID": self.ids,
+            "Name": self.names,
+            "District": pd.Categorical.from_codes(self.district_of, categories=self.districts),
+            "Villages_Covered": self.villages,
+        })
+        for c, column in enumerate(COUNTER_COLUMNS):
+            frame[column] = self.counters[:, c]
+        frame["Performance_Score"] = self.scores
+        frame["Last_Active"] = self.last_active
+        return frame
@@ -0,0 +1,245 @@
+# FalconCare - Dashboard Data Store
+# Columnar query layer: sidebar filters are pushed down into DuckDB so only
+# matching Parquet row groups are read and aggregations run in the engine
+
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+
+# Sidebar time range labels mapped to look-back windows
+TIME_RANGES = {
+    "Last 24 Hours": timedelta(hours=24),
+    "Last 7 Days": timedelta(days=7),
+    "Last 30 Days": timedelta(days=30),
+    "Last 3 Months": timedelta(days=90),
+}
+
+# Tables the dashboard reads; each may be backed by a Parquet dataset
+# (<data_dir>/<table>/*.parquet) or by an in-memory DataFrame
+TABLES = ("health_data", "user_interactions", "outbreak_data", "asha_performance")
+
+# Columns that may be used in value_counts style queries
+CATEGORICAL_COLUMNS = {
+    "user_interactions": {"District", "Intent", "Triage_Level", "Language", "Channel", "Age_Group"},
+}
+
+
+class DashboardFilters:
+    """Sidebar selections applied to every dashboard query"""
+
+    def __init__(self, time_range="Last 7 Days", districts=None, alert_threshold=100, languages=None):
+        self.time_range = time_range
+        self.districts = list(districts) if districts is not None else None
+        self.alert_threshold = alert_threshold
+        self.languages = list(languages) if languages is not None else None
+
+    @property
+    def since(self):
+        """Earliest interaction timestamp covered by the selected time range"""
+        return datetime.now() - TIME_RANGES.get(self.time_range, TIME_RANGES["Last 7 Days"])
+
+
+class DashboardDataStore:
+    """DuckDB-backed store for dashboard tables with filter pushdown"""
+
+    def __init__(self, data_dir=None, database=None):
+        self.data_dir = Path(data_dir or os.getenv("FALCONCARE_DATA_DIR", "dashboard_data"))
+        # A file-backed database keeps rollups and other derived tables across restarts
+        self.con = duckdb.connect(database=database or os.getenv("FALCONCARE_DUCKDB", ":memory:"))
+        self.tables = set()
+        self.frames = {}
+        self._register_parquet_tables()
+
+    def _register_parquet_tables(self):
+        """Expose Parquet datasets as views so DuckDB can prune row groups"""
+        for table in TABLES:
+            table_dir = self.data_dir / table
+            if table_dir.is_dir() and any(table_dir.glob("*.parquet")):
+                pattern = (table_dir / "*.parquet").as_posix()
+                self.con.execute(
+                    f"CREATE OR REPLACE VIEW {table} AS SELECT * FROM read_parquet('{pattern}')"
+                )
+                self.tables.add(table)
+
+    def has_table(self, table):
+        return table in self.tables
+
+    def register_frame(self, table, frame):
+        """Back a table with an in-memory DataFrame unless Parquet data already exists"""
+        if table in self.tables:
+            return
+        self.con.register(table, frame)
+        self.frames[table] = frame
+        self.tables.add(table)
+
+    def cursor(self):
+        """Independent connection for use from another thread"""
+        cursor = self.con.cursor()
+        # Registered DataFrames are connection-local views, so re-register them
+        for table, frame in self.frames.items():
+            cursor.register(table, frame)
+        return cursor
+
+    def query(self, sql, params=None):
+        """Run SQL against the store and return a DataFrame"""
+        return self.con.execute(sql, params or []).df()
+
+    def where_clause(self, filters, time_column=None, filter_languages=False, extra=None, time_grain=None):
+        """
+        Build a parameterized WHERE clause from the sidebar filters
+
+        With a time_grain (for pre-bucketed tables) the bucket containing the
+        start of the time range is kept rather than dropped.
+        """
+        clauses = list(extra or [])
+        params = []
+
+        if filters is not None:
+            if filters.districts is not None:
+                if filters.districts:
+                    placeholders = ", ".join("?" for _ in filters.districts)
+                    clauses.append(f"District IN ({placeholders})")
+                    params.extend(filters.districts)
+                else:
+                    clauses.append("FALSE")
+
+            if time_column:
+                since = f"date_trunc('{time_grain}', ?::TIMESTAMP)" if time_grain else "?"
+                clauses.append(f"{time_column} >= {since}")
+                params.append(filters.since)
+
+            if filter_languages and filters.languages is not None:
+                if filters.languages:
+                    placeholders = ", ".join("?" for _ in filters.languages)
+                    clauses.append(f"Language IN ({placeholders})")
+                    params.extend(filters.languages)
+                else:
+                    clauses.append("FALSE")
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _where(self, table, filters, extra=None):
+        """WHERE clause for one of the raw dashboard tables"""
+        is_interactions = table == "user_interactions"
+        return self.where_clause(
+            filters,
+            time_column="Timestamp" if is_interactions else None,
+            filter_languages=is_interactions,
+            extra=extra
+        )
+
+    # ---------- User interactions ----------
+    def interaction_summary(self, filters):
+        """Total interactions, RED triage count and mean response time"""
+        where, params = self._where("user_interactions", filters)
+        row = self.con.execute(f"""
+            SELECT COUNT(*),
+                   COUNT(*) FILTER (WHERE Triage_Level = 'RED'),
+                   AVG(Response_Time)
+            FROM user_interactions {where}
+        """, params).fetchone()
+        return {
+            "total": int(row[0] or 0),
+            "emergencies": int(row[1] or 0),
+            "avg_response_time": float(row[2] or 0.0),
+        }
+
+    def value_counts(self, column, filters):
+        """Equivalent of Series.value_counts() computed in the engine"""
+        if column not in CATEGORICAL_COLUMNS["user_interactions"]:
+            raise ValueError(f"Unsupported column: {column}")
+        where, params = self._where("user_interactions", filters)
+        frame = self.query(f"""
+            SELECT {column}, COUNT(*) AS count
+            FROM user_interactions {where}
+            GROUP BY {column}
+            ORDER BY count DESC
+        """, params)
+        return pd.Series(frame["count"].values, index=frame[column].values, name="count")
+
+    # ---------- Disease surveillance ----------
+    def disease_by_district(self, filters):
+        where, params = self._where("health_data", filters)
+        return self.query(f"""
+            SELECT Disease, District, SUM(Cases) AS Cases
+            FROM health_data {where}
+            GROUP BY Disease, District
+            ORDER BY Disease, District
+        """, params)
+
+    def cases_by_district(self, filters):
+        where, params = self._where("health_data", filters)
+        return self.query(f"""
+            SELECT District, SUM(Cases) AS Cases
+            FROM health_data {where}
+            GROUP BY District
+            ORDER BY District
+        """, params)
+
+    def surveillance_table(self, filters):
+        """Disease status rows with the alert flag derived from the sidebar threshold"""
+        where, params = self._where("health_data", filters)
+        return self.query(f"""
+            SELECT District, Disease, Cases, Trend,
+                   (Cases > ? AND Trend = 'Increasing') AS Alert
+            FROM health_data {where}
+            ORDER BY District, Disease
+        """, [filters.alert_threshold] + params)
+
+    def outbreak_risk(self, filters, status=None):
+        extra = ["Status = ?"] if status else None
+        where, params = self._where("outbreak_data", filters, extra)
+        return self.query(f"""
+            SELECT District, Disease, Risk_Score, Status, Predicted_Cases, Confidence
+            FROM outbreak_data {where}
+            ORDER BY Risk_Score DESC
+        """, ([status] if status else []) + params)
+
+    # ---------- ASHA performance ----------
+    def asha_workers(self):
+        """Full ASHA worker snapshot, e.g. to seed the streaming aggregates"""
+        return self.query("SELECT * FROM asha_performance")
+
+    def asha_summary(self, filters):
+        where, params = self._where("asha_performance", filters)
+        row = self.con.execute(f"""
+            SELECT COUNT(*), AVG(Performance_Score), SUM(Households_Visited), SUM(Emergency_Responses)
+            FROM asha_performance {where}
+        """, params).fetchone()
+        return {
+            "active": int(row[0] or 0),
+            "avg_performance": float(row[1] or 0.0),
+            "households": int(row[2] or 0),
+            "emergency_responses": int(row[3] or 0),
+        }
+
+    def asha_scores(self, filters):
+        where, params = self._where("asha_performance", filters)
+        return self.query(f"SELECT Performance_Score FROM asha_performance {where}", params)
+
+    def asha_top(self, filters, n, columns):
+        where, params = self._where("asha_performance", filters)
+        return self.query(f"""
+            SELECT {', '.join(columns)}
+            FROM asha_performance {where}
+            ORDER BY Performance_Score DESC
+            LIMIT {int(n)}
+        """, params)
+
+    def asha_by_district(self, filters):
+        where, params = self._where("asha_performance", filters)
+        return self.query(f"""
+            SELECT District,
+                   AVG(Performance_Score) AS Performance_Score,
+                   SUM(Households_Visited) AS Households_Visited,
+                   SUM(Emergency_Responses) AS Emergency_Responses,
+                   SUM(Health_Education_Sessions) AS Health_Education_Sessions
+            FROM asha_performance {where}
+            GROUP BY District
+            ORDER BY District
+        """, params)
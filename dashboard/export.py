@@ -0,0 +1,177 @@
+# FalconCare - Dashboard Data Export
+# Streams filtered dashboard tables to Parquet/CSV/XLSX on a background worker
+# Data is read in Arrow record batches so memory stays bounded for any row count
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+
+EXPORT_FORMATS = ("parquet", "csv", "xlsx")
+
+# Rows fetched from DuckDB per record batch
+EXPORT_CHUNK_SIZE = 100_000
+
+# Excel's hard limit per worksheet (minus the header row)
+XLSX_MAX_ROWS = 1_048_575
+
+# How often the dashboard redraws a running export's progress (seconds)
+EXPORT_POLL_INTERVAL = 0.5
+
+
+def export_queries(store, filters):
+    """(name, sql, params) for every table included in an export"""
+    interactions_where, interactions_params = store.where_clause(
+        filters, time_column="Timestamp", filter_languages=True
+    )
+    health_where, health_params = store.where_clause(filters)
+    asha_where, asha_params = store.where_clause(filters)
+
+    return [
+        (
+            "user_interactions",
+            f"SELECT * FROM user_interactions {interactions_where} ORDER BY Timestamp",
+            interactions_params,
+        ),
+        (
+            "disease_surveillance",
+            f"""SELECT District, Disease, Cases, Trend,
+                       (Cases > ? AND Trend = 'Increasing') AS Alert
+                FROM health_data {health_where}
+                ORDER BY District, Disease""",
+            [filters.alert_threshold] + health_params,
+        ),
+        (
+            "asha_performance",
+            f"SELECT * FROM asha_performance {asha_where} ORDER BY ASHA_ID",
+            asha_params,
+        ),
+    ]
+
+
+class ExportJob:
+    """Progress and result of one export run"""
+
+    def __init__(self, fmt, out_dir):
+        self.fmt = fmt
+        self.out_dir = Path(out_dir)
+        self.status = "queued"
+        self.rows_written = 0
+        self.total_rows = 0
+        self.files = []
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self):
+        if self.status == "done":
+            return 1.0
+        if not self.total_rows:
+            return 0.0
+        return min(self.rows_written / self.total_rows, 1.0)
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def _advance(self, rows):
+        with self._lock:
+            self.rows_written += rows
+
+
+class DashboardExporter:
+    """Runs exports off the Streamlit script thread"""
+
+    def __init__(self, out_dir="exports", max_workers=1, chunk_size=EXPORT_CHUNK_SIZE):
+        self.out_dir = Path(out_dir)
+        self.chunk_size = chunk_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="falconcare-export")
+
+    def start(self, store, filters, fmt="parquet"):
+        """Queue an export and return its job handle immediately"""
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        # Microseconds keep exports started within the same second apart
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        job = ExportJob(fmt, self.out_dir / f"health_data_{stamp}_{fmt}")
+        queries = export_queries(store, filters)
+        # Take the cursor on the caller's thread; the store is rebuilt on every rerun
+        cursor = store.cursor()
+        self.executor.submit(self._run, job, cursor, queries)
+        return job
+
+    def _run(self, job, cursor, queries):
+        job.status = "running"
+        job.started_at = datetime.now()
+        try:
+            job.out_dir.mkdir(parents=True, exist_ok=True)
+            job.total_rows = sum(
+                cursor.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]
+                for _, sql, params in queries
+            )
+
+            if job.fmt == "xlsx":
+                self._write_xlsx(job, cursor, queries)
+            else:
+                for name, sql, params in queries:
+                    reader = cursor.execute(sql, params).fetch_record_batch(self.chunk_size)
+                    path = job.out_dir / f"{name}.{job.fmt}"
+                    self._write_arrow(job, reader, path)
+                    job.files.append(str(path))
+
+            job.status = "done"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.now()
+            cursor.close()
+
+    def _write_arrow(self, job, reader, path):
+        """Write Arrow batches one at a time to Parquet or CSV"""
+        if job.fmt == "parquet":
+            writer = pq.ParquetWriter(path, reader.schema)
+        else:
+            writer = pa_csv.CSVWriter(path, reader.schema)
+        try:
+            for batch in reader:
+                writer.write_batch(batch)
+                job._advance(batch.num_rows)
+        finally:
+            writer.close()
+
+    def _write_xlsx(self, job, cursor, queries):
+        """One worksheet per table (spilling to extra sheets past Excel's row limit)"""
+        path = job.out_dir / "health_data.xlsx"
+        workbook = Workbook(write_only=True)
+
+        for name, sql, params in queries:
+            reader = cursor.execute(sql, params).fetch_record_batch(self.chunk_size)
+            header = reader.schema.names
+            sheet, sheet_rows, part = None, XLSX_MAX_ROWS, 0
+
+            for batch in reader:
+                columns = [column.to_pylist() for column in batch.columns]
+                for row in zip(*columns):
+                    if sheet_rows >= XLSX_MAX_ROWS:
+                        part += 1
+                        sheet = workbook.create_sheet(name[:28] if part == 1 else f"{name[:25]}_{part}")
+                        sheet.append(header)
+                        sheet_rows = 0
+                    sheet.append(row)
+                    sheet_rows += 1
+                job._advance(batch.num_rows)
+
+            if sheet is None:
+                workbook.create_sheet(name[:28]).append(header)
+
+        workbook.save(path)
+        job.files.append(str(path))
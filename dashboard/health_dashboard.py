@@ -10,6 +10,19 @@ import numpy as np
 from datetime import datetime, timedelta
 import json
 import random
+import sys
+import threading
+from pathlib import Path
+
+# Allow `streamlit run dashboard/health_dashboard.py` from the project root
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dashboard.asha_analytics import AshaAnalytics
+from dashboard.data_store import DashboardDataStore, DashboardFilters
+from dashboard.export import EXPORT_FORMATS, EXPORT_POLL_INTERVAL, DashboardExporter
+from dashboard.outbreak_engine import OutbreakDetector
+from dashboard.rollups import InteractionRollups
+from dashboard.synthetic_data import DISTRICTS, SyntheticDataGenerator
 
 # Set page config
 st.set_page_config(
@@ -19,6 +32,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_exporter():
+    """Process-wide export worker, shared across Streamlit reruns"""
+    return DashboardExporter()
+
+@st.cache_resource
+def get_dashboard():
+    """Mock data, query store and rollups, built once and shared across reruns"""
+    return HealthDashboard()
+
+
 class HealthDashboard:
     """Government Health Dashboard for monitoring and analytics"""
     
@@ -28,88 +52,53 @@ class HealthDashboard:
     def initialize_data(self):
         """Initialize mock data for demonstration"""
         # Districts in Chhattisgarh (example state)
-        self.districts = ["Raipur", "Bilaspur", "Durg", "Korba", "Rajnandgaon", "Bastar", "Surguja"]
+        self.districts = list(DISTRICTS)
+        self.generator = SyntheticDataGenerator(districts=self.districts)
         
         # Generate mock health data
+        self.weekly_cases = self.generator.weekly_cases()
+        self.outbreak_detector = OutbreakDetector.from_weekly_cases(self.weekly_cases)
         self.health_data = self.generate_mock_health_data()
         self.user_interactions = self.generate_mock_user_data()
         self.outbreak_data = self.generate_outbreak_data()
         self.asha_performance = self.generate_asha_data()
+
+        # Query layer; Parquet datasets in FALCONCARE_DATA_DIR take precedence
+        self.store = DashboardDataStore()
+        self.store.register_frame("health_data", self.health_data)
+        self.store.register_frame("user_interactions", self.user_interactions)
+        self.store.register_frame("outbreak_data", self.outbreak_data)
+        self.store.register_frame("asha_performance", self.asha_performance)
+
+        # ASHA aggregates and leaderboards are maintained per activity event,
+        # seeded from the store's worker snapshot plus its logged activity
+        self.asha = AshaAnalytics(self.store)
+        self.asha.load_workers(self.store.asha_workers())
+        if "asha_performance" in self.store.frames and not self.asha.replayed:
+            self.asha.apply_events(self.generator.asha_activity(self.asha_performance, 500))
+
+        # Interaction metrics are read from incrementally maintained rollups
+        self.rollups = InteractionRollups(self.store)
+        self.rollups.catch_up()
+
+        # Every session shares one DuckDB connection, so renders take turns
+        self.render_lock = threading.Lock()
     
     def generate_mock_health_data(self):
         """Generate realistic health statistics"""
-        data = []
-        for district in self.districts:
-            for disease in ["Dengue", "Malaria", "Typhoid", "Diarrhea", "COVID-19"]:
-                cases = random.randint(10, 200)
-                trend = random.choice(["Increasing", "Stable", "Decreasing"])
-                alert = cases > 100 and trend == "Increasing"
-                
-                data.append({
-                    "District": district,
-                    "Disease": disease,
-                    "Cases": cases,
-                    "Trend": trend,
-                    "Alert": alert,
-                    "Week": f"Week {random.randint(1, 52)}"
-                })
-        
-        return pd.DataFrame(data)
+        return self.generator.health_data(weekly=self.weekly_cases)
     
-    def generate_mock_user_data(self):
+    def generate_mock_user_data(self, n=1000):
         """Generate user interaction data"""
-        data = []
-        for i in range(1000):
-            data.append({
-                "Timestamp": datetime.now() - timedelta(hours=random.randint(0, 168)),
-                "District": random.choice(self.districts),
-                "Intent": random.choice(["symptom_fever", "vaccination_covid", "find_doctor", "emergency_severe", "myth_detection"]),
-                "Triage_Level": random.choice(["GREEN", "YELLOW", "RED"]),
-                "Language": random.choice(["Hindi", "English", "Mixed"]),
-                "Channel": random.choice(["WhatsApp", "SMS", "USSD", "Web"]),
-                "Age_Group": random.choice(["0-18", "18-35", "35-60", "60+"]),
-                "Response_Time": random.uniform(1.0, 5.0)
-            })
-        
-        return pd.DataFrame(data)
+        return self.generator.user_interactions(n)
     
     def generate_outbreak_data(self):
-        """Generate outbreak detection data"""
-        data = []
-        for district in self.districts:
-            for disease in ["Dengue", "Malaria", "Diarrhea"]:
-                risk_score = random.uniform(0.1, 0.9)
-                status = "High Risk" if risk_score > 0.7 else "Medium Risk" if risk_score > 0.4 else "Low Risk"
-                
-                data.append({
-                    "District": district,
-                    "Disease": disease,
-                    "Risk_Score": risk_score,
-                    "Status": status,
-                    "Predicted_Cases": int(risk_score * 100),
-                    "Confidence": random.uniform(0.7, 0.95)
-                })
-        
-        return pd.DataFrame(data)
+        """Outbreak risk from the EWMA/CUSUM detector over weekly counts"""
+        return self.outbreak_detector.snapshot()
     
-    def generate_asha_data(self):
+    def generate_asha_data(self, n=50):
         """Generate ASHA worker performance data"""
-        data = []
-        for i in range(50):
-            data.append({
-                "ASHA_ID": f"ASHA_{i+1:03d}",
-                "Name": f"ASHA Worker {i+1}",
-                "District": random.choice(self.districts),
-                "Villages_Covered": random.randint(3, 8),
-                "Households_Visited": random.randint(50, 200),
-                "Emergency_Responses": random.randint(0, 15),
-                "Health_Education_Sessions": random.randint(5, 30),
-                "Vaccination_Referrals": random.randint(10, 50),
-                "Performance_Score": random.uniform(0.6, 1.0),
-                "Last_Active": datetime.now() - timedelta(hours=random.randint(0, 72))
-            })
-        
-        return pd.DataFrame(data)
+        return self.generator.asha_data(n)
     
     def render_dashboard(self):
         """Render the complete dashboard"""
@@ -126,7 +115,7 @@ class HealthDashboard:
         """, unsafe_allow_html=True)
         
         # Sidebar
-        self.render_sidebar()
+        filters = self.render_sidebar()
         
         # Main content
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -138,19 +127,19 @@ class HealthDashboard:
         ])
         
         with tab1:
-            self.render_overview()
+            self.render_overview(filters)
         
         with tab2:
-            self.render_disease_surveillance()
+            self.render_disease_surveillance(filters)
         
         with tab3:
-            self.render_ai_analytics()
+            self.render_ai_analytics(filters)
         
         with tab4:
-            self.render_asha_performance()
+            self.render_asha_performance(filters)
         
         with tab5:
-            self.render_user_engagement()
+            self.render_user_engagement(filters)
     
     def render_sidebar(self):
         """Render sidebar with filters and controls"""
@@ -185,6 +174,13 @@ class HealthDashboard:
             default=["Hindi", "English", "Mixed"]
         )
         
+        filters = DashboardFilters(
+            time_range=time_range,
+            districts=selected_districts,
+            alert_threshold=alert_threshold,
+            languages=languages
+        )
+        
         # Real-time toggle
         real_time = st.sidebar.checkbox("⚡ Real-time Updates", value=True)
         
@@ -193,25 +189,58 @@ class HealthDashboard:
             st.sidebar.error("🚨 Emergency Alert Sent to District Health Officer!")
             st.sidebar.info("SMS sent to: +91-98765-43210")
         
-        # Export data
+        # Export data (written by a background worker; progress survives reruns)
+        export_format = st.sidebar.selectbox("📁 Export Format", list(EXPORT_FORMATS))
         if st.sidebar.button("📥 Export Dashboard Data"):
-            st.sidebar.success("✅ Data exported to health_data.xlsx")
+            st.session_state["export_job"] = get_exporter().start(self.store, filters, export_format)
+        
+        with st.sidebar:
+            self.render_export_status()
         
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 📞 Emergency Contacts")
         st.sidebar.markdown("**District Health Officer:** 0771-2221111")
         st.sidebar.markdown("**ASHA Coordinator:** 0771-2222222")
         st.sidebar.markdown("**Emergency:** 108")
+
+        return filters
+    
+    def render_export_status(self):
+        """Sidebar export status; a fragment that redraws itself while the job runs"""
+        export_job = st.session_state.get("export_job")
+        running = export_job is not None and not export_job.done
+
+        @st.fragment(run_every=EXPORT_POLL_INTERVAL if running else None)
+        def export_status():
+            export_job = st.session_state.get("export_job")
+            if export_job is None:
+                return
+            if running and export_job.done:
+                # Finished since the last full run: rerun once more to stop polling
+                st.rerun()
+            if export_job.status == "failed":
+                st.error(f"❌ Export failed: {export_job.error}")
+            elif export_job.done:
+                st.success(f"✅ Data exported to {export_job.out_dir}")
+            else:
+                st.progress(
+                    export_job.progress,
+                    text=f"Exporting... {export_job.rows_written:,}/{export_job.total_rows:,} rows"
+                )
+
+        export_status()
     
-    def render_overview(self):
+    def render_overview(self, filters):
         """Render overview dashboard"""
         st.markdown("### 📊 FalconCare - System Overview")
         
+        summary = self.rollups.interaction_summary(filters)
+        
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_users = len(self.user_interactions)
+            total_users = summary['total']
             st.metric(
                 label="👥 Total Users Served",
                 value=f"{total_users:,}",
@@ -219,7 +248,7 @@ class HealthDashboard:
             )
         
         with col2:
-            emergency_cases = len(self.user_interactions[self.user_interactions['Triage_Level'] == 'RED'])
+            emergency_cases = summary['emergencies']
             st.metric(
                 label="🚨 Emergency Cases",
                 value=emergency_cases,
@@ -227,7 +256,7 @@ class HealthDashboard:
             )
         
         with col3:
-            avg_response = self.user_interactions['Response_Time'].mean()
+            avg_response = summary['avg_response_time']
             st.metric(
                 label="⚡ Avg Response Time",
                 value=f"{avg_response:.1f}s",
@@ -245,7 +274,7 @@ class HealthDashboard:
         # Disease trends
         st.markdown("### 📈 Disease Trends Across Districts")
         
-        disease_summary = self.health_data.groupby(['Disease', 'District'])['Cases'].sum().reset_index()
+        disease_summary = self.store.disease_by_district(filters)
         
         fig = px.bar(
             disease_summary,
@@ -281,7 +310,7 @@ class HealthDashboard:
             st.markdown("### 🗺️ Geographic Distribution")
             
             # District-wise case distribution
-            district_cases = self.health_data.groupby('District')['Cases'].sum().reset_index()
+            district_cases = self.store.cases_by_district(filters)
             
             fig = px.pie(
                 district_cases,
@@ -292,12 +321,12 @@ class HealthDashboard:
             fig.update_layout(height=300)
             st.plotly_chart(fig, use_container_width=True)
     
-    def render_disease_surveillance(self):
+    def render_disease_surveillance(self, filters):
         """Render disease surveillance dashboard"""
         st.markdown("### 🚨 Disease Surveillance & Outbreak Detection")
         
         # Outbreak alerts
-        high_risk = self.outbreak_data[self.outbreak_data['Status'] == 'High Risk']
+        high_risk = self.store.outbreak_risk(filters, status='High Risk')
         
         if not high_risk.empty:
             st.error("🚨 **HIGH RISK OUTBREAK DETECTED**")
@@ -309,7 +338,7 @@ class HealthDashboard:
         st.markdown("### 📊 Current Disease Status")
         
         # Enhanced disease data with color coding
-        display_data = self.health_data.copy()
+        display_data = self.store.surveillance_table(filters)
         
         # Color code based on alert status
         def get_status_color(row):
@@ -320,7 +349,10 @@ class HealthDashboard:
             else:
                 return "🟢"
         
-        display_data['Status'] = display_data.apply(get_status_color, axis=1)
+        if not display_data.empty:
+            display_data['Status'] = display_data.apply(get_status_color, axis=1)
+        else:
+            display_data['Status'] = []
         
         # Display table
         st.dataframe(
@@ -363,7 +395,7 @@ class HealthDashboard:
             st.markdown("### 🎯 Outbreak Prediction")
             
             # Risk matrix
-            risk_matrix = self.outbreak_data.pivot(
+            risk_matrix = self.store.outbreak_risk(filters).pivot(
                 index='District',
                 columns='Disease',
                 values='Risk_Score'
@@ -393,7 +425,7 @@ class HealthDashboard:
         for rec in recommendations:
             st.info(rec)
     
-    def render_ai_analytics(self):
+    def render_ai_analytics(self, filters):
         """Render AI analytics dashboard"""
         st.markdown("### 🤖 AI Performance & Analytics")
         
@@ -440,7 +472,7 @@ class HealthDashboard:
         # Triage accuracy
         st.markdown("### 🚦 Triage System Performance")
         
-        triage_data = self.user_interactions['Triage_Level'].value_counts()
+        triage_data = self.rollups.value_counts('Triage_Level', filters)
         
         col1, col2 = st.columns(2)
         
@@ -527,27 +559,29 @@ class HealthDashboard:
         
         st.plotly_chart(fig, use_container_width=True)
     
-    def render_asha_performance(self):
+    def render_asha_performance(self, filters):
         """Render ASHA worker performance dashboard"""
         st.markdown("### 👩‍⚕️ ASHA Worker Performance & Management")
         
+        asha_summary = self.asha.summary(filters)
+        
         # ASHA summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            active_asha = len(self.asha_performance)
+            active_asha = asha_summary['active']
             st.metric("👩‍⚕️ Active ASHA Workers", active_asha, "+3 this month")
         
         with col2:
-            avg_performance = self.asha_performance['Performance_Score'].mean()
+            avg_performance = asha_summary['avg_performance']
             st.metric("⭐ Avg Performance", f"{avg_performance:.1%}", "+2.3%")
         
         with col3:
-            total_households = self.asha_performance['Households_Visited'].sum()
+            total_households = asha_summary['households']
             st.metric("🏠 Households Reached", f"{total_households:,}", "+150 today")
         
         with col4:
-            emergency_responses = self.asha_performance['Emergency_Responses'].sum()
+            emergency_responses = asha_summary['emergency_responses']
             st.metric("🚨 Emergency Responses", emergency_responses, "+5 today")
         
         # Performance distribution
@@ -556,10 +590,10 @@ class HealthDashboard:
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = px.histogram(
-                self.asha_performance,
+            fig = px.bar(
+                self.asha.score_histogram(filters),
                 x='Performance_Score',
-                nbins=20,
+                y='ASHA_Workers',
                 title="ASHA Performance Score Distribution",
                 color_discrete_sequence=['#2E8B57']
             )
@@ -568,9 +602,9 @@ class HealthDashboard:
         
         with col2:
             # Top performers
-            top_performers = self.asha_performance.nlargest(10, 'Performance_Score')[
-                ['Name', 'District', 'Performance_Score', 'Households_Visited']
-            ]
+            top_performers = self.asha.top(
+                10, filters, ['Name', 'District', 'Performance_Score', 'Households_Visited']
+            )
             
             fig = px.bar(
                 top_performers,
@@ -586,12 +620,7 @@ class HealthDashboard:
         # District-wise performance
         st.markdown("### 🏘️ District-wise ASHA Performance")
         
-        district_performance = self.asha_performance.groupby('District').agg({
-            'Performance_Score': 'mean',
-            'Households_Visited': 'sum',
-            'Emergency_Responses': 'sum',
-            'Health_Education_Sessions': 'sum'
-        }).reset_index()
+        district_performance = self.asha.by_district(filters)
         
         fig = px.scatter(
             district_performance,
@@ -624,19 +653,19 @@ class HealthDashboard:
         # ASHA leaderboard
         st.markdown("### 🏆 ASHA Leaderboard (This Month)")
         
-        leaderboard = self.asha_performance.nlargest(5, 'Performance_Score')[
-            ['Name', 'District', 'Performance_Score', 'Households_Visited', 'Emergency_Responses']
-        ].copy()
+        leaderboard = self.asha.top(
+            5, filters, ['Name', 'District', 'Performance_Score', 'Households_Visited', 'Emergency_Responses']
+        )
         
         leaderboard['Rank'] = range(1, len(leaderboard) + 1)
-        leaderboard['Badge'] = ['🥇', '🥈', '🥉', '🏅', '🏅']
+        leaderboard['Badge'] = ['🥇', '🥈', '🥉', '🏅', '🏅'][:len(leaderboard)]
         
         st.dataframe(
             leaderboard[['Badge', 'Rank', 'Name', 'District', 'Performance_Score', 'Households_Visited']],
             use_container_width=True
         )
     
-    def render_user_engagement(self):
+    def render_user_engagement(self, filters):
         """Render user engagement analytics"""
         st.markdown("### 📱 User Engagement & Platform Analytics")
         
@@ -644,7 +673,7 @@ class HealthDashboard:
         col1, col2 = st.columns(2)
         
         with col1:
-            channel_data = self.user_interactions['Channel'].value_counts()
+            channel_data = self.rollups.value_counts('Channel', filters)
             
             fig = px.pie(
                 values=channel_data.values,
@@ -655,7 +684,7 @@ class HealthDashboard:
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            language_data = self.user_interactions['Language'].value_counts()
+            language_data = self.rollups.value_counts('Language', filters)
             
             fig = px.bar(
                 x=language_data.index,
@@ -689,7 +718,7 @@ class HealthDashboard:
         col1, col2 = st.columns(2)
         
         with col1:
-            age_data = self.user_interactions['Age_Group'].value_counts()
+            age_data = self.rollups.value_counts('Age_Group', filters)
             
             fig = px.bar(
                 x=age_data.index,
@@ -702,7 +731,7 @@ class HealthDashboard:
         
         with col2:
             # Query types
-            intent_data = self.user_interactions['Intent'].value_counts()
+            intent_data = self.rollups.value_counts('Intent', filters)
             
             fig = px.bar(
                 x=intent_data.values,
@@ -717,7 +746,7 @@ class HealthDashboard:
         # Geographic reach
         st.markdown("### 🗺️ Geographic Reach")
         
-        district_users = self.user_interactions['District'].value_counts().reset_index()
+        district_users = self.rollups.value_counts('District', filters).reset_index()
         district_users.columns = ['District', 'Users']
         
         fig = px.bar(
@@ -768,13 +797,14 @@ class HealthDashboard:
 
 def main():
     """Main dashboard application"""
-    dashboard = HealthDashboard()
-    dashboard.render_dashboard()
+    dashboard = get_dashboard()
+    with dashboard.render_lock:
+        dashboard.render_dashboard()
     
     # Auto-refresh option
     st.sidebar.markdown("---")
     if st.sidebar.button("🔄 Refresh Data"):
-        st.experimental_rerun()
+        st.rerun()
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,195 @@
+# FalconCare - Outbreak Detection Engine
+# Vectorized EWMA baseline + one-sided CUSUM over district x disease weekly counts
+# Shared by the dashboard risk matrix and the chatbot's disease stats alerts
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# Where the batch job stores detector state, and the per-district stats the
+# action server reads (plain JSON, so it needs neither numpy nor pandas)
+DEFAULT_STATE_PATH = os.getenv("FALCONCARE_OUTBREAK_STATE", "models/outbreak_state.npz")
+DEFAULT_STATS_PATH = os.getenv("FALCONCARE_OUTBREAK_STATS", "models/outbreak_stats.json")
+
+
+class OutbreakDetector:
+    """
+    Incremental outbreak detector over a district x disease grid
+
+    Each weekly update is O(cells) and touches only the running state:
+    an exponentially weighted mean/variance baseline, an EWMA of the
+    week-over-week change and a CUSUM of standardized excess counts.
+    """
+
+    def __init__(self, districts, diseases, alpha=0.25, k=0.5, h=4.0, warmup=4):
+        self.districts = list(districts)
+        self.diseases = list(diseases)
+        self.alpha = alpha      # EWMA smoothing for baseline and trend
+        self.k = k              # CUSUM slack (in standard deviations)
+        self.h = h              # CUSUM decision threshold
+        self.warmup = warmup    # Weeks of history before alarms are raised
+
+        shape = (len(self.districts), len(self.diseases))
+        self.mean = np.zeros(shape)
+        self.var = np.zeros(shape)
+        self.trend = np.zeros(shape)
+        self.cusum = np.zeros(shape)
+        self.last = np.zeros(shape)
+        self.weeks_seen = np.zeros(shape, dtype=np.int32)
+
+    # ---------- Updates ----------
+    def update(self, counts):
+        """Fold one new week of counts (districts x diseases, NaN = not reported)"""
+        x = np.asarray(counts, dtype=float)
+        observed = ~np.isnan(x)
+        first = observed & (self.weeks_seen == 0)
+        seen = observed & (self.weeks_seen > 0)
+
+        # Poisson floor keeps sparse series from alarming on single cases
+        sd = np.sqrt(np.maximum(self.var, np.maximum(self.mean, 1.0)))
+        z = (x - self.mean) / sd
+        cusum = np.maximum(0.0, self.cusum + z - self.k)
+
+        diff = x - self.mean
+        mean = self.mean + self.alpha * diff
+        var = (1 - self.alpha) * (self.var + self.alpha * diff ** 2)
+        trend = (1 - self.alpha) * self.trend + self.alpha * (x - self.last)
+
+        self.cusum = np.where(seen, cusum, self.cusum)
+        self.mean = np.where(seen, mean, np.where(first, x, self.mean))
+        self.var = np.where(seen, var, self.var)
+        self.trend = np.where(seen, trend, self.trend)
+        self.last = np.where(observed, x, self.last)
+        self.weeks_seen += observed
+
+    def fit(self, history):
+        """Replay a (districts x diseases x weeks) history"""
+        for week in range(history.shape[2]):
+            self.update(history[:, :, week])
+        return self
+
+    @classmethod
+    def from_weekly_cases(cls, weekly, **kwargs):
+        """Build and fit a detector from a District/Disease/Week/Cases frame"""
+        districts = list(pd.unique(weekly["District"]))
+        diseases = list(pd.unique(weekly["Disease"]))
+        weeks = np.sort(pd.unique(weekly["Week"]))
+
+        d_idx = pd.Categorical(weekly["District"], categories=districts).codes
+        s_idx = pd.Categorical(weekly["Disease"], categories=diseases).codes
+        w_idx = np.searchsorted(weeks, weekly["Week"].to_numpy())
+
+        history = np.full((len(districts), len(diseases), len(weeks)), np.nan)
+        history[d_idx, s_idx, w_idx] = weekly["Cases"].to_numpy()
+        return cls(districts, diseases, **kwargs).fit(history)
+
+    # ---------- Signals ----------
+    @property
+    def alerts(self):
+        return (self.cusum >= self.h) & (self.weeks_seen >= self.warmup)
+
+    @property
+    def risk_scores(self):
+        """CUSUM mapped to [0, 1); 0.5 at the decision threshold"""
+        return self.cusum / (self.cusum + self.h)
+
+    @property
+    def trends(self):
+        relative = self.trend / np.maximum(self.mean, 1.0)
+        return np.select([relative > 0.1, relative < -0.1], ["increasing", "decreasing"], "stable")
+
+    def snapshot(self):
+        """Current state as a frame in the dashboard's outbreak_data shape"""
+        risk = self.risk_scores
+        alerts = self.alerts
+        status = np.select([alerts, risk >= 0.25], ["High Risk", "Medium Risk"], "Low Risk")
+        predicted = np.maximum(self.last + self.trend, 0.0)
+        confidence = 1.0 - 1.0 / np.sqrt(self.weeks_seen + 1.0)
+
+        d_idx, s_idx = np.indices(risk.shape)
+        return pd.DataFrame({
+            "District": np.array(self.districts)[d_idx.ravel()],
+            "Disease": np.array(self.diseases)[s_idx.ravel()],
+            "Cases": self.last.ravel().astype(int),
+            "Risk_Score": risk.ravel(),
+            "Status": status.ravel(),
+            "Predicted_Cases": predicted.ravel().round().astype(int),
+            "Confidence": confidence.ravel(),
+            "Trend": self.trends.ravel(),
+            "Alert": alerts.ravel(),
+        })
+
+    def district_stats(self):
+        """Per-district disease stats keyed the way ActionDiseaseStats expects"""
+        trends = self.trends
+        alerts = self.alerts
+        stats = {}
+        for i, district in enumerate(self.districts):
+            stats[district.lower()] = {
+                disease.lower(): {
+                    "cases": int(self.last[i, j]),
+                    "trend": str(trends[i, j]),
+                    "alert": bool(alerts[i, j]),
+                }
+                for j, disease in enumerate(self.diseases)
+                if self.weeks_seen[i, j] > 0
+            }
+        return stats
+
+    # ---------- Persistence ----------
+    def save(self, path=DEFAULT_STATE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                districts=np.array(self.districts), diseases=np.array(self.diseases),
+                params=np.array([self.alpha, self.k, self.h, self.warmup]),
+                mean=self.mean, var=self.var, trend=self.trend, cusum=self.cusum,
+                last=self.last, weeks_seen=self.weeks_seen
+            )
+
+    def save_stats(self, path=DEFAULT_STATS_PATH):
+        """Write district_stats() as JSON, replacing the old file atomically"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.district_stats(), f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE_PATH):
+        with np.load(path, allow_pickle=False) as state:
+            alpha, k, h, warmup = state["params"]
+            detector = cls(state["districts"].tolist(), state["diseases"].tolist(),
+                           alpha=alpha, k=k, h=h, warmup=int(warmup))
+            for name in ("mean", "var", "trend", "cusum", "last", "weeks_seen"):
+                setattr(detector, name, state[name])
+        return detector
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Usage: python dashboard/outbreak_engine.py [weekly_cases.(csv|parquet)] [state_path] [stats_path]
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    state_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_STATE_PATH
+    stats_path = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_STATS_PATH
+
+    if source is None:
+        sys.path.append(str(Path(__file__).parent.parent))
+        from dashboard.synthetic_data import SyntheticDataGenerator
+        weekly = SyntheticDataGenerator().weekly_cases()
+    elif source.endswith(".parquet"):
+        weekly = pd.read_parquet(source)
+    else:
+        weekly = pd.read_csv(source)
+
+    detector = OutbreakDetector.from_weekly_cases(weekly)
+    detector.save(state_path)
+    detector.save_stats(stats_path)
+    print(f"✅ Outbreak state for {len(detector.districts)} districts saved to {state_path} and {stats_path}")
+    print(f"🚨 Active alerts: {int(detector.alerts.sum())}")
@@ -0,0 +1,202 @@
+# FalconCare - Interaction Rollups
+# Incrementally maintained hourly/daily aggregates of chatbot interactions
+# so the overview and engagement tabs never scan raw events
+
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from dashboard.data_store import CATEGORICAL_COLUMNS
+
+
+# Dimensions every rollup row is keyed on (besides the time bucket)
+ROLLUP_DIMENSIONS = ["District", "Channel", "Language", "Intent", "Triage_Level", "Age_Group"]
+
+# Rollup table name -> DuckDB date_trunc granularity
+ROLLUP_GRAINS = {
+    "interactions_hourly": "hour",
+    "interactions_daily": "day",
+}
+
+# Time ranges longer than this are answered from the daily rollup
+HOURLY_ROLLUP_HORIZON = timedelta(days=7)
+
+# Rollups are caught up with new raw events at most this often (seconds)
+CATCH_UP_INTERVAL = 30.0
+
+# Raw events are re-aggregated from this far behind the watermark on every
+# catch-up, so events arriving up to this late are still counted
+ROLLUP_LATENESS = timedelta(hours=6)
+
+
+class InteractionRollups:
+    """Hourly and daily interaction aggregates kept up to date batch by batch"""
+
+    def __init__(self, store, catch_up_interval=CATCH_UP_INTERVAL, lateness=ROLLUP_LATENESS):
+        self.store = store
+        self.con = store.con
+        self.catch_up_interval = catch_up_interval
+        self.lateness = lateness
+        self.caught_up_at = None
+        self._create_tables()
+
+    def _create_tables(self):
+        dimensions = ",\n".join(f"{d} VARCHAR" for d in ROLLUP_DIMENSIONS)
+        key = ", ".join(["Bucket"] + ROLLUP_DIMENSIONS)
+        for table in ROLLUP_GRAINS:
+            self.con.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    Bucket TIMESTAMP,
+                    {dimensions},
+                    Events BIGINT,
+                    Response_Time_Sum DOUBLE,
+                    PRIMARY KEY ({key})
+                )
+            """)
+        # High-water mark of ingested raw events, used by catch_up()
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS rollup_watermark (
+                Name VARCHAR PRIMARY KEY,
+                Last_Timestamp TIMESTAMP
+            )
+        """)
+
+    @property
+    def watermark(self):
+        row = self.con.execute(
+            "SELECT Last_Timestamp FROM rollup_watermark WHERE Name = 'user_interactions'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def apply(self, events):
+        """Fold a batch of new interaction events into every rollup"""
+        if events is None or len(events) == 0:
+            return 0
+
+        self.con.register("rollup_batch", events)
+        try:
+            dimensions = ", ".join(ROLLUP_DIMENSIONS)
+            for table, grain in ROLLUP_GRAINS.items():
+                self.con.execute(f"""
+                    INSERT INTO {table}
+                    SELECT date_trunc('{grain}', Timestamp) AS Bucket, {dimensions},
+                           COUNT(*) AS Events, SUM(Response_Time) AS Response_Time_Sum
+                    FROM rollup_batch
+                    GROUP BY ALL
+                    ON CONFLICT DO UPDATE SET
+                        Events = Events + EXCLUDED.Events,
+                        Response_Time_Sum = Response_Time_Sum + EXCLUDED.Response_Time_Sum
+                """)
+            self.con.execute("""
+                INSERT INTO rollup_watermark
+                SELECT 'user_interactions', MAX(Timestamp) FROM rollup_batch
+                ON CONFLICT DO UPDATE SET
+                    Last_Timestamp = greatest(Last_Timestamp, EXCLUDED.Last_Timestamp)
+            """)
+        finally:
+            self.con.unregister("rollup_batch")
+
+        return len(events)
+
+    def catch_up(self):
+        """
+        Re-aggregate raw interactions from `lateness` before the watermark on
+
+        Hourly buckets from that cutoff are rebuilt from the raw rows rather
+        than incremented, and daily buckets from the hourly ones, so rows
+        that share the watermark timestamp or arrive late are counted once.
+        Returns the number of raw events re-aggregated.
+        """
+        self.caught_up_at = time.monotonic()
+        if not self.store.has_table("user_interactions"):
+            return 0
+
+        watermark = self.watermark
+        if watermark is None:
+            where, hour_where, day_where, params, day_params = "", "", "", [], []
+        else:
+            cutoff = pd.Timestamp(watermark - self.lateness).floor("h")
+            where, hour_where, day_where = "WHERE Timestamp >= ?", "WHERE Bucket >= ?", "WHERE Bucket >= ?"
+            params, day_params = [cutoff], [cutoff.floor("D")]
+        dimensions = ", ".join(ROLLUP_DIMENSIONS)
+
+        self.con.begin()
+        try:
+            self.con.execute(f"DELETE FROM interactions_hourly {hour_where}", params)
+            self.con.execute(f"""
+                INSERT INTO interactions_hourly
+                SELECT date_trunc('hour', Timestamp) AS Bucket, {dimensions},
+                       COUNT(*) AS Events, SUM(Response_Time) AS Response_Time_Sum
+                FROM user_interactions {where}
+                GROUP BY ALL
+            """, params)
+            self.con.execute(f"DELETE FROM interactions_daily {day_where}", day_params)
+            self.con.execute(f"""
+                INSERT INTO interactions_daily
+                SELECT date_trunc('day', Bucket) AS Bucket, {dimensions},
+                       SUM(Events) AS Events, SUM(Response_Time_Sum) AS Response_Time_Sum
+                FROM interactions_hourly {day_where}
+                GROUP BY ALL
+            """, day_params)
+            events, latest = self.con.execute(
+                f"SELECT COUNT(*), MAX(Timestamp) FROM user_interactions {where}", params
+            ).fetchone()
+            if latest is not None:
+                self.con.execute("""
+                    INSERT INTO rollup_watermark VALUES ('user_interactions', ?)
+                    ON CONFLICT DO UPDATE SET
+                        Last_Timestamp = greatest(Last_Timestamp, EXCLUDED.Last_Timestamp)
+                """, [latest])
+            self.con.commit()
+        except Exception:
+            self.con.rollback()
+            raise
+        return events
+
+    def refresh(self):
+        """Catch up if the last catch-up is older than catch_up_interval"""
+        if self.caught_up_at is None or time.monotonic() - self.caught_up_at >= self.catch_up_interval:
+            self.catch_up()
+
+    def _table_for(self, filters):
+        if filters is not None and filters.since < pd.Timestamp.now() - HOURLY_ROLLUP_HORIZON:
+            return "interactions_daily"
+        return "interactions_hourly"
+
+    def _where(self, table, filters):
+        return self.store.where_clause(
+            filters, time_column="Bucket", filter_languages=True, time_grain=ROLLUP_GRAINS[table]
+        )
+
+    def interaction_summary(self, filters):
+        """Total interactions, RED triage count and mean response time"""
+        self.refresh()
+        table = self._table_for(filters)
+        where, params = self._where(table, filters)
+        row = self.con.execute(f"""
+            SELECT SUM(Events),
+                   SUM(Events) FILTER (WHERE Triage_Level = 'RED'),
+                   SUM(Response_Time_Sum) / NULLIF(SUM(Events), 0)
+            FROM {table} {where}
+        """, params).fetchone()
+        return {
+            "total": int(row[0] or 0),
+            "emergencies": int(row[1] or 0),
+            "avg_response_time": float(row[2] or 0.0),
+        }
+
+    def value_counts(self, column, filters):
+        """Equivalent of Series.value_counts() answered from the rollups"""
+        if column not in CATEGORICAL_COLUMNS["user_interactions"]:
+            raise ValueError(f"Unsupported column: {column}")
+        self.refresh()
+        table = self._table_for(filters)
+        where, params = self._where(table, filters)
+        frame = self.store.query(f"""
+            SELECT {column}, SUM(Events) AS count
+            FROM {table} {where}
+            GROUP BY {column}
+            ORDER BY count DESC
+        """, params)
+        return pd.Series(frame["count"].astype("int64").values, index=frame[column].values, name="count")
@@ -0,0 +1,257 @@
+# FalconCare - Synthetic Data Generator
+# Seeded, NumPy-vectorized mock data for the dashboard and load tests
+# Produces realistic shapes: diurnal usage, district skew and outbreak spikes
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dashboard.outbreak_engine import OutbreakDetector
+
+
+# Districts in Chhattisgarh (example state)
+DISTRICTS = ["Raipur", "Bilaspur", "Durg", "Korba", "Rajnandgaon", "Bastar", "Surguja"]
+
+DISEASES = ["Dengue", "Malaria", "Typhoid", "Diarrhea", "COVID-19"]
+
+INTENTS = ["symptom_fever", "vaccination_covid", "find_doctor", "emergency_severe", "myth_detection"]
+INTENT_WEIGHTS = [0.38, 0.22, 0.2, 0.05, 0.15]
+
+TRIAGE_LEVELS = ["GREEN", "YELLOW", "RED"]
+TRIAGE_WEIGHTS = [0.65, 0.28, 0.07]
+
+LANGUAGES = ["Hindi", "English", "Mixed"]
+LANGUAGE_WEIGHTS = [0.55, 0.25, 0.2]
+
+CHANNELS = ["WhatsApp", "SMS", "USSD", "Web"]
+CHANNEL_WEIGHTS = [0.45, 0.25, 0.15, 0.15]
+
+AGE_GROUPS = ["0-18", "18-35", "35-60", "60+"]
+AGE_WEIGHTS = [0.2, 0.4, 0.28, 0.12]
+
+# Relative query volume per hour of day: quiet nights, morning and evening peaks
+DIURNAL_PROFILE = np.array([
+    0.15, 0.1, 0.08, 0.08, 0.12, 0.3, 0.6, 0.9, 1.1, 1.25, 1.3, 1.2,
+    1.05, 1.0, 0.95, 0.95, 1.0, 1.1, 1.3, 1.4, 1.25, 0.9, 0.55, 0.3
+])
+
+# Sample chatbot inputs for backend/bot load tests
+SAMPLE_MESSAGES = [
+    "मुझे बुखार है", "mujhe bukhar hai", "I have fever since 2 days", "सिरदर्द हो रहा है",
+    "khansi aur bukhar", "I have a headache", "बच्चे का टीका कब लगवाएं", "covid vaccine center",
+    "नजदीकी अस्पताल कहां है", "chest pain", "सीने में दर्द", "हल्दी से कैंसर ठीक होता है",
+    "pet mein dard", "help", "1", "hi", "नमस्ते", "/affirm",
+]
+
+
+def _district_weights(districts, skew=1.1):
+    """Zipf-like weights so a few (urban) districts dominate traffic"""
+    ranks = np.arange(1, len(districts) + 1, dtype=float)
+    weights = 1.0 / ranks ** skew
+    return weights / weights.sum()
+
+
+def _categorical(rng, categories, weights, n):
+    """Sample a pandas Categorical without materializing Python strings"""
+    p = np.asarray(weights, dtype=float)
+    codes = rng.choice(len(categories), size=n, p=p / p.sum())
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+class SyntheticDataGenerator:
+    """Vectorized generator for every dashboard table"""
+
+    def __init__(self, seed=42, districts=None, now=None):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.districts = list(districts or DISTRICTS)
+        self.district_weights = _district_weights(self.districts)
+        self.now = now or datetime.now()
+
+    # ---------- User interactions ----------
+    def _timestamps(self, n, start, end):
+        """Timestamps in [start, end) following the diurnal profile, sorted"""
+        first_hour = pd.Timestamp(start).floor("h")
+        hours = pd.date_range(first_hour, pd.Timestamp(end), freq="h", inclusive="left")
+        if len(hours) == 0:
+            hours = pd.DatetimeIndex([first_hour])
+        weights = DIURNAL_PROFILE[hours.hour]
+        picked = self.rng.choice(len(hours), size=n, p=weights / weights.sum())
+        seconds = self.rng.integers(0, 3600, size=n)
+        stamps = hours.values[picked] + seconds.astype("timedelta64[s]")
+        stamps.sort()
+        return stamps
+
+    def user_interactions(self, n, days=7, start=None, end=None):
+        """Interaction events spread over the last `days` days"""
+        end = end or self.now
+        start = start or end - timedelta(days=days)
+        triage = _categorical(self.rng, TRIAGE_LEVELS, TRIAGE_WEIGHTS, n)
+        # Emergencies take longer to answer (follow-up actions, hospital lookup)
+        response_time = self.rng.gamma(4.0, 0.55, size=n) + np.where(triage.codes == 2, 1.0, 0.0)
+
+        return pd.DataFrame({
+            "Timestamp": self._timestamps(n, start, end),
+            "District": _categorical(self.rng, self.districts, self.district_weights, n),
+            "Intent": _categorical(self.rng, INTENTS, INTENT_WEIGHTS, n),
+            "Triage_Level": triage,
+            "Language": _categorical(self.rng, LANGUAGES, LANGUAGE_WEIGHTS, n),
+            "Channel": _categorical(self.rng, CHANNELS, CHANNEL_WEIGHTS, n),
+            "Age_Group": _categorical(self.rng, AGE_GROUPS, AGE_WEIGHTS, n),
+            "Response_Time": np.clip(response_time, 0.3, 15.0),
+        })
+
+    def iter_user_interactions(self, total, chunk_size=1_000_000, days=7):
+        """Yield interaction chunks in time order, each covering its own time slice"""
+        end = pd.Timestamp(self.now)
+        start = end - pd.Timedelta(days=days)
+        chunks = max(1, -(-total // chunk_size))
+        bounds = pd.date_range(start, end, periods=chunks + 1)
+        remaining = total
+        for i in range(chunks):
+            n = min(chunk_size, remaining)
+            remaining -= n
+            yield self.user_interactions(n, start=bounds[i], end=bounds[i + 1])
+
+    # ---------- Disease surveillance ----------
+    def weekly_cases(self, weeks=52, diseases=None, spikes=3):
+        """District x disease weekly case counts with seasonality and injected outbreaks"""
+        if weeks < 1:
+            raise ValueError("weeks must be at least 1")
+        diseases = list(diseases or DISEASES)
+        n_districts, n_diseases = len(self.districts), len(diseases)
+
+        # Baseline per district/disease scaled by district population skew
+        base = self.rng.uniform(15, 60, size=(n_districts, n_diseases))
+        base *= (self.district_weights / self.district_weights.mean())[:, None] ** 0.5
+
+        # Monsoon seasonality for vector/water-borne diseases
+        week_index = np.arange(1, weeks + 1)
+        season = 1.0 + 0.6 * np.sin((week_index - 20) / 52 * 2 * np.pi)
+        seasonal = np.array([d in ("Dengue", "Malaria", "Diarrhea") for d in diseases])
+        factor = np.where(seasonal[None, :, None], season[None, None, :], 1.0)
+
+        expected = base[:, :, None] * factor
+
+        # Outbreaks: multiplicative ramps over a few weeks in random cells
+        for _ in range(spikes):
+            i = self.rng.integers(n_districts)
+            j = self.rng.integers(n_diseases)
+            onset = self.rng.integers(max(0, weeks - 8), weeks)
+            ramp = np.clip(np.arange(weeks) - onset + 1, 0, None)
+            expected[i, j] *= 1.0 + 0.8 * ramp
+
+        cases = self.rng.poisson(expected)
+        district_idx, disease_idx, week_idx = np.indices(cases.shape)
+
+        return pd.DataFrame({
+            "District": np.array(self.districts)[district_idx.ravel()],
+            "Disease": np.array(diseases)[disease_idx.ravel()],
+            "Week": week_index[week_idx.ravel()],
+            "Cases": cases.ravel(),
+        })
+
+    def health_data(self, weeks=12, alert_threshold=100, weekly=None):
+        """Latest-week disease status per district, with trend from the prior week"""
+        if weekly is None:
+            weekly = self.weekly_cases(weeks=weeks)
+        pivot = weekly.pivot_table(index=["District", "Disease"], columns="Week", values="Cases")
+        weeks = int(pivot.columns[-1])
+        # A single week of history has no prior week; its trend is Stable
+        current = pivot[weeks]
+        previous = pivot[pivot.columns[-2]] if len(pivot.columns) > 1 else current
+
+        change = (current - previous) / previous.clip(lower=1)
+        trend = np.select([change > 0.1, change < -0.1], ["Increasing", "Decreasing"], "Stable")
+
+        frame = pivot.index.to_frame(index=False)
+        frame["Cases"] = current.values.astype(int)
+        frame["Trend"] = trend
+        frame["Alert"] = (frame["Cases"] > alert_threshold) & (frame["Trend"] == "Increasing")
+        frame["Week"] = f"Week {weeks}"
+        return frame
+
+    # ---------- ASHA workers ----------
+    def asha_data(self, n=50):
+        """ASHA worker performance snapshot"""
+        ids = pd.Series(np.arange(1, n + 1)).astype(str)
+        households = self.rng.poisson(120, size=n).clip(20, None)
+        score = 0.6 + 0.4 * self.rng.beta(5.0, 2.0, size=n)
+
+        return pd.DataFrame({
+            "ASHA_ID": "ASHA_" + ids.str.zfill(3),
+            "Name": "ASHA Worker " + ids,
+            "District": _categorical(self.rng, self.districts, self.district_weights, n),
+            "Villages_Covered": self.rng.integers(3, 9, size=n),
+            "Households_Visited": households,
+            "Emergency_Responses": self.rng.poisson(6, size=n),
+            "Health_Education_Sessions": self.rng.integers(5, 31, size=n),
+            "Vaccination_Referrals": self.rng.integers(10, 51, size=n),
+            "Performance_Score": score,
+            "Last_Active": self.now - pd.to_timedelta(self.rng.integers(0, 72 * 3600, size=n), unit="s"),
+        })
+
+    def asha_activity(self, workers, n, hours=24):
+        """Activity events for existing workers over the last `hours` hours"""
+        activities = ["household_visit", "emergency_response", "education_session", "vaccination_referral"]
+        picked = self.rng.integers(0, len(workers), size=n)
+        return pd.DataFrame({
+            "ASHA_ID": workers["ASHA_ID"].to_numpy()[picked],
+            "Activity": _categorical(self.rng, activities, [0.7, 0.05, 0.1, 0.15], n),
+            "Count": np.ones(n, dtype=np.int32),
+            "Timestamp": self._timestamps(n, self.now - timedelta(hours=hours), self.now),
+        })
+
+    # ---------- Load-test inputs ----------
+    def chat_messages(self, n):
+        """Sample chatbot messages (skewed towards a few frequent inputs)"""
+        weights = _district_weights(SAMPLE_MESSAGES, skew=0.8)
+        return list(np.array(SAMPLE_MESSAGES, dtype=object)[self.rng.choice(len(SAMPLE_MESSAGES), size=n, p=weights)])
+
+    # ---------- Parquet output ----------
+    def write_user_interactions_parquet(self, out_dir, total, chunk_size=1_000_000, days=7):
+        """Stream interaction chunks to <out_dir>/user_interactions/part-*.parquet"""
+        table_dir = Path(out_dir) / "user_interactions"
+        table_dir.mkdir(parents=True, exist_ok=True)
+
+        written = 0
+        for i, chunk in enumerate(self.iter_user_interactions(total, chunk_size, days)):
+            pq.write_table(
+                pa.Table.from_pandas(chunk, preserve_index=False),
+                table_dir / f"part-{i:05d}.parquet",
+                row_group_size=128 * 1024
+            )
+            written += len(chunk)
+        return written
+
+    def write_dataset(self, out_dir, interactions, chunk_size=1_000_000, asha_workers=50):
+        """Write every dashboard table in the layout DashboardDataStore reads"""
+        out_dir = Path(out_dir)
+        weekly = self.weekly_cases()
+        for table, frame in [
+            ("health_data", self.health_data(weekly=weekly)),
+            ("outbreak_data", OutbreakDetector.from_weekly_cases(weekly).snapshot()),
+            ("asha_performance", self.asha_data(asha_workers)),
+        ]:
+            table_dir = out_dir / table
+            table_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), table_dir / "part-00000.parquet")
+        return self.write_user_interactions_parquet(out_dir, interactions, chunk_size)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else "dashboard_data"
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000
+
+    print(f"🧪 Generating {rows:,} interactions into {out_dir}/ ...")
+    started = time.perf_counter()
+    written = SyntheticDataGenerator().write_dataset(out_dir, rows)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {written:,} rows in {elapsed:.1f}s ({written / elapsed:,.0f} rows/s)")
@@ -3,11 +3,15 @@ import React, { useEffect, useState } from 'react';
 const Forum = () => {
   const [posts, setPosts] = useState([]);
   const [content, setContent] = useState('');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [notice, setNotice] = useState('');
 
-  const fetchPosts = async () => {
-    const res = await fetch('http://localhost:5001/api/forum');
+  const fetchPosts = async (before) => {
+    const url = before ? `http://localhost:5001/api/forum?before=${encodeURIComponent(before)}` : 'http://localhost:5001/api/forum';
+    const res = await fetch(url);
     const data = await res.json();
-    setPosts(data);
+    setPosts(before ? prev => [...prev, ...data.posts] : data.posts);
+    setNextCursor(data.next_cursor);
   };
 
   useEffect(() => { fetchPosts(); }, []);
@@ -15,6 +19,7 @@ const Forum = () => {
   const create = async () => {
     await fetch('http://localhost:5001/api/forum', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ content }) });
     setContent('');
+    setNotice('Thanks! Your post will appear once it has been reviewed.');
     fetchPosts();
   };
 
@@ -26,6 +31,7 @@ const Forum = () => {
         <div className="bg-white rounded-xl shadow p-4 mt-4">
           <textarea className="w-full border rounded p-2" rows="3" placeholder="Share your question or experience anonymously..." value={content} onChange={e => setContent(e.target.value)} />
           <button onClick={create} className="mt-2 px-4 py-2 rounded bg-blue-600 text-white">Post</button>
+          {notice && <p className="mt-2 text-sm text-green-700">{notice}</p>}
         </div>
         <div className="mt-6 space-y-3">
           {posts.map(p => (
@@ -35,6 +41,9 @@ const Forum = () => {
             </div>
           ))}
         </div>
+        {nextCursor && (
+          <button onClick={() => fetchPosts(nextCursor)} className="mt-4 px-4 py-2 rounded border border-blue-600 text-blue-600">Load more</button>
+        )}
       </div>
     </div>
   );
@@ -10,6 +10,8 @@ from twilio.rest import Client
 from twilio.twiml.messaging_response import MessagingResponse
 import asyncio
 
+from symptom_normalizer import NORMALIZER
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,13 +74,14 @@ class SMSChannel:
             return self.quick_responses[message_lower]
         
         # Symptom detection
-        if any(word in message_lower for word in ["bukhar", "बुखार", "fever"]):
+        symptoms = NORMALIZER.symptoms(message_lower)
+        if "fever" in symptoms:
             return "🌡️ बुखार की जांच:\nकब से? 1=आज 2=2दिन 3=सप्ताह\nगंभीरता? A=हल्का B=तेज\nउदाहरण: '2B' भेजें"
         
-        if any(word in message_lower for word in ["khansi", "खांसी", "cough"]):
+        if "cough" in symptoms:
             return "😷 खांसी की जांच:\nकब से? 1=आज 2=3दिन 3=सप्ताह\nकफ? Y=हां N=नहीं\nउदाहरण: '2Y' भेजें"
         
-        if any(word in message_lower for word in ["pet", "पेट", "stomach", "diarrhea"]):
+        if "abdominal pain" in symptoms or "diarrhea" in symptoms:
             return "🤢 पेट की समस्या:\nORS घोल पिएं। दस्त? Y=हां N=नहीं\nउल्टी? Y=हां N=नहीं\nगंभीर हो तो 108 कॉल करें।"
         
         # Emergency keywords
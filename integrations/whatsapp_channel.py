@@ -10,6 +10,8 @@ from rasa.core.channels.channel import InputChannel
 from rasa.core.channels.channel import UserMessage, OutputChannel
 from flask import Blueprint, request, jsonify, Flask
 
+from symptom_normalizer import NORMALIZER, expand_shorthand
+
 logger = logging.getLogger(__name__)
 
 
@@ -181,7 +183,8 @@ class WhatsAppInput(InputChannel):
                 metadata={
                     "whatsapp_number": sender_id,
                     "platform": "whatsapp",
-                    "media_url": media_url
+                    "media_url": media_url,
+                    "symptoms": NORMALIZER.symptoms(message_body),
                 }
             )
             
@@ -203,24 +206,7 @@ class WhatsAppInput(InputChannel):
     def _preprocess_whatsapp_text(self, text: Text) -> Text:
         """Preprocess WhatsApp text for better understanding"""
         # Convert common WhatsApp shortcuts to full words
-        shortcuts = {
-            "u": "you",
-            "ur": "your", 
-            "n": "and",
-            "w8": "wait",
-            "2": "to",
-            "4": "for",
-            # Hindi shortcuts
-            "kya": "क्या",
-            "hai": "है",
-            "nhi": "नहीं",
-            "thik": "ठीक",
-        }
-        
-        words = text.lower().split()
-        processed_words = [shortcuts.get(word, word) for word in words]
-        
-        return " ".join(processed_words)
+        return expand_shorthand(text)
     
     def _process_media_message(self, media_url: Text, caption: Text) -> Text:
         """Process media messages (images of symptoms, prescriptions, etc.)"""
@@ -0,0 +1,230 @@
+"""
+FalconCare Symptom Normalizer
+Maps English, Devanagari Hindi and romanized Hindi symptom mentions to one set
+of canonical symptom IDs, shared by the backend, the action server and the
+SMS/USSD and WhatsApp channels
+
+The lexicon is compiled once at import into a token trie; a message is
+tokenized in a single regex pass and matched greedily (longest phrase wins),
+so normalization costs a few dict lookups per word. Postpositions such as
+"में"/"mein" are skipped inside a phrase, so "pet mein dard" matches "pet dard".
+
+Canonical IDs use the names in backend/data/conditions.json where they exist.
+"""
+
+import re
+import unicodedata
+
+# canonical symptom ID -> surface forms (English, Devanagari, romanized Hindi)
+SYMPTOM_LEXICON = {
+    'fever': [
+        'fever', 'feverish', 'temperature', 'bukhar', 'bukhaar', 'bukar', 'taap', 'jwar',
+        'बुखार', 'बुख़ार', 'ताप', 'ज्वर',
+    ],
+    'high fever': [
+        'high fever', 'high temperature', 'tez bukhar', 'bahut bukhar', 'tez bukhaar',
+        'तेज बुखार', 'तेज़ बुखार', 'बहुत बुखार',
+    ],
+    'persistent fever': [
+        'persistent fever', 'continuous fever', 'lagatar bukhar', 'bukhar nahi utar raha',
+        'लगातार बुखार', 'बुखार नहीं उतर रहा',
+    ],
+    'chills': ['chills', 'shivering', 'kapkapi', 'thand lagna', 'कंपकंपी', 'ठंड लगना', 'ठंड लगकर'],
+    'cough': ['cough', 'coughing', 'khansi', 'khaansi', 'khasi', 'खांसी', 'खाँसी', 'kaph', 'कफ'],
+    'dry cough': ['dry cough', 'sukhi khansi', 'सूखी खांसी'],
+    'cough with blood': [
+        'cough with blood', 'coughing blood', 'blood in cough', 'khansi mein khoon',
+        'खांसी में खून', 'खून की खांसी',
+    ],
+    'runny nose': [
+        'runny nose', 'common cold', 'head cold', 'caught a cold', 'sardi', 'zukam', 'jukam', 'naak beh rahi', 'सर्दी', 'जुकाम', 'ज़ुकाम',
+        'नाक बह रही',
+    ],
+    'nasal congestion': ['nasal congestion', 'blocked nose', 'stuffy nose', 'naak band', 'नाक बंद'],
+    'sneezing': ['sneezing', 'sneeze', 'chheenk', 'chheek', 'छींक'],
+    'sore throat': ['sore throat', 'throat pain', 'gala kharab', 'gale mein dard', 'गला खराब', 'गले में दर्द'],
+    'headache': [
+        'headache', 'headaches', 'head pain', 'head ache', 'migraine', 'sir dard', 'sirdard',
+        'sar dard', 'sir mein dard', 'सिरदर्द', 'सिर दर्द', 'सिर में दर्द', 'अधकपारी',
+    ],
+    'severe headache': ['severe headache', 'tez sir dard', 'तेज सिरदर्द', 'तेज सिर दर्द'],
+    'abdominal pain': [
+        'abdominal pain', 'stomach pain', 'stomach ache', 'stomachache', 'tummy ache', 'upset stomach',
+        'pet dard', 'pet kharab', 'पेट दर्द', 'पेट खराब', 'पेट ख़राब',
+    ],
+    'diarrhea': [
+        'diarrhea', 'diarrhoea', 'loose motion', 'loose motions', 'dast', 'dast lag rahe',
+        'दस्त', 'पतले दस्त',
+    ],
+    'severe diarrhea': ['severe diarrhea', 'severe diarrhoea', 'bahut dast', 'बहुत दस्त'],
+    'blood in stool': ['blood in stool', 'bloody stool', 'khoon ke dast', 'खून के दस्त', 'मल में खून'],
+    'vomiting': ['vomiting', 'vomit', 'throwing up', 'ulti', 'ultee', 'उल्टी', 'उलटी'],
+    'severe vomiting': ['severe vomiting', 'bahut ulti', 'बहुत उल्टी'],
+    'vomiting blood': ['vomiting blood', 'blood in vomit', 'khoon ki ulti', 'खून की उल्टी'],
+    'nausea': ['nausea', 'nauseous', 'ji michlana', 'ji michla', 'जी मिचलाना', 'जी मिचला'],
+    'heartburn': ['heartburn', 'acidity', 'acid reflux', 'एसिडिटी'],
+    'bloating': ['bloating', 'gas', 'gas problem', 'गैस'],
+    'constipation': ['constipation', 'kabz', 'kabj', 'कब्ज', 'कब्ज़'],
+    'dehydration': ['dehydration', 'dehydrated', 'pani ki kami', 'पानी की कमी'],
+    'body ache': ['body ache', 'body pain', 'badan dard', 'sharir dard', 'बदन दर्द', 'शरीर दर्द'],
+    'joint pain': ['joint pain', 'joints pain', 'jodon mein dard', 'jodo ka dard', 'जोड़ों में दर्द', 'जोड़ों का दर्द'],
+    'muscle pain': ['muscle pain', 'muscle ache', 'maanspeshi dard', 'मांसपेशियों में दर्द'],
+    'weakness': ['weakness', 'weak', 'kamzori', 'kamjori', 'कमजोरी', 'कमज़ोरी'],
+    'severe weakness': ['very weak', 'bahut kamzori', 'बहुत कमजोरी', 'बहुत कमज़ोरी'],
+    'fatigue': ['fatigue', 'tired', 'tiredness', 'exhausted', 'thakan', 'thakaan', 'थकान', 'थकावट'],
+    'dizziness': ['dizziness', 'dizzy', 'chakkar', 'chakkar aana', 'चक्कर'],
+    'rash': ['rash', 'skin rash', 'red spots', 'daane', 'dane', 'chakatte', 'दाने', 'चकत्ते', 'लाल दाने'],
+    'itching': ['itching', 'itchy', 'khujli', 'khujlee', 'खुजली'],
+    'chest pain': [
+        'chest pain', 'pain in chest', 'seene mein dard', 'sine mein dard', 'seena dard',
+        'सीने में दर्द', 'छाती में दर्द', 'सीने का दर्द',
+    ],
+    'chest tightness': ['chest tightness', 'chest congestion', 'seene mein jakdan', 'सीने में जकड़न'],
+    'shortness of breath': [
+        'shortness of breath', 'difficulty breathing', 'breathing problem', 'breathless',
+        "can't breathe", 'cant breathe', 'cannot breathe', 'saans phool rahi', 'saans nahi aa rahi',
+        'saans lene mein takleef', 'सांस फूल रही', 'सांस नहीं आ रही', 'सांस लेने में तकलीफ',
+        'साँस फूल रही', 'साँस नहीं आ रही',
+    ],
+    'wheezing': ['wheezing', 'saans mein awaaz', 'सांस में आवाज'],
+    'rapid heartbeat': ['rapid heartbeat', 'palpitations', 'dhadkan tez', 'धड़कन तेज'],
+    'loss of appetite': ['loss of appetite', 'no appetite', 'bhookh nahi', 'bhook nahi', 'भूख नहीं'],
+    'loss of taste': ['loss of taste', 'no taste', 'swad nahi', 'स्वाद नहीं'],
+    'loss of smell': ['loss of smell', 'no smell', 'gandh nahi', 'गंध नहीं'],
+    'yellow eyes': ['yellow eyes', 'peeli aankhen', 'पीली आंखें', 'पीली आँखें'],
+    'jaundice': ['jaundice', 'piliya', 'peeliya', 'पीलिया'],
+    'red eyes': ['red eyes', 'pink eye', 'laal aankhen', 'लाल आंखें', 'लाल आँखें'],
+    'ear pain': ['ear pain', 'earache', 'kaan dard', 'kaan mein dard', 'कान दर्द', 'कान में दर्द'],
+    'burning urination': ['burning urination', 'peshab mein jalan', 'पेशाब में जलन'],
+    'weight loss': ['weight loss', 'losing weight', 'vajan kam', 'वजन कम', 'वज़न कम'],
+    'night sweats': ['night sweats', 'raat ko pasina', 'रात को पसीना'],
+    'neck stiffness': ['neck stiffness', 'stiff neck', 'gardan akadna', 'गर्दन अकड़ना'],
+    'seizures': ['seizure', 'seizures', 'fits', 'convulsions', 'daura padna', 'दौरा पड़ना', 'मिर्गी'],
+    'confusion': ['confusion', 'confused', 'disoriented'],
+    'severe bleeding': [
+        'severe bleeding', 'bleeding heavily', 'heavy bleeding', 'khoon beh raha', 'bahut khoon',
+        'खून बह रहा', 'बहुत खून',
+    ],
+    'unconscious': ['unconscious', 'fainted', 'passed out', 'behosh', 'बेहोश'],
+    'heart attack': ['heart attack', 'dil ka daura', 'दिल का दौरा'],
+    'stroke': ['stroke', 'paralysis', 'lakwa', 'laqwa', 'लकवा'],
+    'suicidal thoughts': ['suicide', 'suicidal', 'kill myself', 'aatmahatya', 'atmahatya', 'आत्महत्या'],
+    'injury': ['accident', 'injury', 'injured', 'durghatna', 'chot', 'दुर्घटना', 'चोट'],
+}
+
+# Compound symptoms also count as their base symptom (for condition scoring)
+IMPLIED_SYMPTOMS = {
+    'high fever': ('fever',),
+    'persistent fever': ('fever',),
+    'dry cough': ('cough',),
+    'cough with blood': ('cough',),
+    'severe headache': ('headache',),
+    'severe diarrhea': ('diarrhea',),
+    'blood in stool': ('diarrhea',),
+    'severe vomiting': ('vomiting',),
+    'vomiting blood': ('vomiting',),
+    'severe weakness': ('weakness',),
+}
+
+# Words skipped between the words of a phrase ("pet mein dard" == "pet dard")
+FILLER_WORDS = frozenset([
+    'में', 'मे', 'का', 'की', 'के', 'mein', 'me', 'main', 'ka', 'ki', 'ke', 'my', 'the',
+])
+
+# Chat shorthand expanded before NLU (WhatsApp, SMS)
+SHORTHAND = {
+    'u': 'you',
+    'ur': 'your',
+    'n': 'and',
+    'w8': 'wait',
+    '2': 'to',
+    '4': 'for',
+    # Hindi shortcuts
+    'kya': 'क्या',
+    'hai': 'है',
+    'nhi': 'नहीं',
+    'thik': 'ठीक',
+}
+
+_TOKEN = re.compile(r"[\wऀ-ॣ०-ॿ']+")
+
+# Chandrabindu spelled as anusvara, zero-width joiners dropped, curly apostrophes
+_FOLD = str.maketrans({'ँ': 'ं', '\u200c': None, '\u200d': None, '\u2019': "'"})
+
+# Trie key marking the end of a phrase; its value is the phrase's symptom IDs
+_END = ''
+
+
+def fold(text):
+    """Lowercase and fold spelling variants that don't change meaning"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFC', text).translate(_FOLD)
+
+
+def tokenize(text):
+    return _TOKEN.findall(fold(text))
+
+
+class SymptomNormalizer:
+    """Token trie over the lexicon; immutable after construction, safe to share across threads"""
+
+    def __init__(self, lexicon=SYMPTOM_LEXICON, implied=IMPLIED_SYMPTOMS, fillers=FILLER_WORDS):
+        self.fillers = frozenset(fold(word) for word in fillers)
+        self.trie = {}
+        for symptom, variants in lexicon.items():
+            ids = (symptom,) + tuple(implied.get(symptom, ()))
+            for variant in [symptom] + list(variants):
+                node = self.trie
+                for token in tokenize(variant):
+                    node = node.setdefault(token, {})
+                node[_END] = ids
+        self.symptom_ids = frozenset(lexicon)
+
+    def symptoms(self, text):
+        """Canonical symptom IDs mentioned in text, in order of first mention"""
+        tokens = tokenize(text)
+        found = {}
+        trie, fillers = self.trie, self.fillers
+        i, n = 0, len(tokens)
+        while i < n:
+            node = trie.get(tokens[i])
+            if node is None:
+                i += 1
+                continue
+            match, end = node.get(_END), i + 1
+            j = i + 1
+            while j < n:
+                token = tokens[j]
+                child = node.get(token)
+                if child is None:
+                    if token in fillers:
+                        j += 1
+                        continue
+                    break
+                node = child
+                j += 1
+                if _END in node:
+                    match, end = node[_END], j
+            if match:
+                for symptom in match:
+                    found[symptom] = None
+                i = end
+            else:
+                i += 1
+        return list(found)
+
+    def canonical(self, name):
+        """Canonical ID for a single symptom name, or None if it isn't one"""
+        symptoms = self.symptoms(name)
+        return symptoms[0] if symptoms else None
+
+
+def expand_shorthand(text):
+    """Lowercase text with chat shorthand words expanded"""
+    return " ".join(SHORTHAND.get(word, word) for word in text.lower().split())
+
+
+# Built once per process
+NORMALIZER = SymptomNormalizer()
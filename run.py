@@ -5,20 +5,48 @@ Script to run the FalconCare health assistant bot programmatically
 """
 
 import asyncio
+import copy
+import fcntl
+import functools
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
+import shutil
+import socket
 import sys
+import tarfile
+import tempfile
+import time
+import unicodedata
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add the current directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
 from rasa.core.agent import Agent
+from rasa.core.lock_store import LockStore
+from rasa.core.nlg import TemplatedNaturalLanguageGenerator
+from rasa.core.processor import MessageProcessor
+from rasa.core.tracker_store import TrackerStore
+from rasa.core.channels.channel import UserMessage
 from rasa.core.channels.console import ConsoleInputChannel
 from rasa.core.channels.socketio import SocketIOInput
 from rasa.core.channels.rest import RestInput
-from rasa.core.utils import EndpointConfig
+from rasa.core.utils import EndpointConfig, read_endpoint_config
 from rasa.utils.endpoints import EndpointConfig as RasaEndpointConfig
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.engine.storage.storage import ModelMetadata
+from rasa.nlu.classifiers.regex_message_handler import RegexMessageHandler
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.training_data.message import Message
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +55,404 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Unpacked models, one directory per archive content hash
+MODEL_CACHE_DIR = os.getenv("FALCONCARE_MODEL_CACHE", "models/.cache")
+
+# Canned messages run through a freshly loaded agent before it serves traffic
+WARMUP_MESSAGES = [
+    "hello",
+    "I have fever and headache",
+    "mujhe bukhar hai",
+    "vaccination schedule for my child",
+]
+WARMUP_SENDER_ID = "falconcare-warmup"
+
+# Seconds between checks for a newer model (local directory or model server)
+MODEL_POLL_INTERVAL = int(os.getenv("FALCONCARE_MODEL_POLL_INTERVAL", "10"))
+
+# Archives pulled from the model server that are kept on disk
+PULLED_MODELS_KEEP = int(os.getenv("FALCONCARE_PULLED_MODELS_KEEP", "2"))
+
+# NLU micro-batching: max messages per batch and max time the first one waits
+NLU_BATCH_SIZE = int(os.getenv("FALCONCARE_NLU_BATCH_SIZE", "32"))
+NLU_MAX_WAIT = float(os.getenv("FALCONCARE_NLU_MAX_WAIT_MS", "10")) / 1000
+
+# Parse results kept per process for repeated short messages
+PARSE_CACHE_SIZE = int(os.getenv("FALCONCARE_PARSE_CACHE_SIZE", "10000"))
+
+# REST server processes; > 1 needs a shared tracker_store and a redis lock_store in endpoints.yml
+REST_WORKERS = int(os.getenv("FALCONCARE_WORKERS", "1"))
+
+
+class StartupTimer:
+    """Wall-clock timing of each startup phase"""
+
+    def __init__(self):
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    @property
+    def total(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def report(self):
+        for name, seconds in self.phases:
+            logger.info(f"  {name:<12} {seconds * 1000:9.1f}ms")
+        logger.info(f"  {'total':<12} {self.total * 1000:9.1f}ms")
+
+
+def model_fingerprint(archive: Path) -> str:
+    """SHA-256 of the model archive contents"""
+    digest = hashlib.sha256()
+    with open(archive, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Open lock files of the unpacked models this process is using; see hold_model()
+_held_models = {}
+
+
+def hold_model(model_dir: Path):
+    """
+    Take a shared lock on an unpacked model for as long as this process uses it
+
+    Any number of processes (REST workers, replicas sharing the cache) can hold
+    the same model; unpack_model() only prunes models it can lock exclusively.
+    """
+    if model_dir in _held_models:
+        return
+    lock = open(model_dir.parent / f".{model_dir.name}.lock", "a")
+    fcntl.flock(lock, fcntl.LOCK_SH)
+    _held_models[model_dir] = lock
+
+
+def release_model(model_dir: Path):
+    """Drop this process's lock on an unpacked model it no longer serves"""
+    lock = _held_models.pop(model_dir, None)
+    if lock is not None:
+        lock.close()
+
+
+def prune_unpacked_models(cache: Path, keep: int = 2):
+    """Delete all but the `keep` most recently used models that no process holds"""
+    unpacked = sorted(
+        (d for d in cache.iterdir() if d.is_dir() and not d.name.startswith(".")),
+        key=os.path.getmtime, reverse=True
+    )
+    for stale in unpacked[keep:]:
+        # The lock files themselves stay: deleting one could let a process
+        # lock an orphaned file while another deletes the model under it
+        with open(cache / f".{stale.name}.lock", "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue  # still served somewhere
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def unpack_model(archive: Path, fingerprint: str, cache_dir: str = MODEL_CACHE_DIR, keep: int = 2):
+    """
+    Unpack a model archive once into <cache_dir>/<fingerprint> and hold it
+
+    Returns (model_dir, cache_hit). Extraction goes to a scratch directory
+    that is renamed into place, so a crashed start never leaves a partial model.
+    The caller holds the model (hold_model()) until it calls release_model().
+    """
+    cache = Path(cache_dir)
+    model_dir = cache / fingerprint
+    cache.mkdir(parents=True, exist_ok=True)
+    # Held before looking, so a concurrent prune can't delete it in between
+    hold_model(model_dir)
+    if (model_dir / "metadata.json").exists():
+        os.utime(model_dir)
+        return model_dir, True
+
+    scratch = Path(tempfile.mkdtemp(dir=cache, prefix=".unpack-"))
+    try:
+        with tarfile.open(archive, mode="r:gz") as tar:
+            # "data" rejects absolute paths, links out of the archive and device files
+            tar.extractall(scratch, filter="data")
+        try:
+            os.rename(scratch, model_dir)
+        except OSError:
+            # Another replica unpacked the same model first
+            shutil.rmtree(scratch, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(scratch, ignore_errors=True)
+        release_model(model_dir)
+        raise
+
+    prune_unpacked_models(cache, keep)
+    return model_dir, False
+
+
+def normalize_text(text: str) -> str:
+    """Cache key form of a message: NFKC, case-folded, whitespace collapsed"""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class ParseCache:
+    """
+    LRU of NLU parse results keyed by (model fingerprint, normalized text)
+
+    A hit whose result has entities is only used for the exact same text,
+    since entity offsets point into the original message.
+    """
+
+    def __init__(self, maxsize=PARSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint, text):
+        key = (fingerprint, normalize_text(text))
+        entry = self.entries.get(key)
+        if entry is None or (entry["entities"] and entry["text"] != text):
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        parse_data = copy.deepcopy(entry)
+        parse_data["text"] = text
+        return parse_data
+
+    def put(self, fingerprint, text, parse_data):
+        if self.maxsize <= 0:
+            return
+        key = (fingerprint, normalize_text(text))
+        self.entries[key] = copy.deepcopy(parse_data)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+def parse_payload(text, domain=None):
+    """Parse a /intent{...} button payload without running the NLU pipeline"""
+    message = RegexMessageHandler().process([Message(data={"text": text})], domain)[0]
+    parse_data = {"text": text, "intent": {"name": None, "confidence": 0.0}, "entities": []}
+    parse_data.update(message.as_dict(only_output_properties=True))
+    return parse_data
+
+
+class CachedModelProcessor(MessageProcessor):
+    """
+    Message processor that loads the graph from an already unpacked model
+    and answers repeated messages from the parse cache
+
+    With a batcher, NLU parses are micro-batched with concurrent messages
+    (the batcher consults the parse cache itself).
+    """
+
+    parse_cache = None
+    fingerprint = None
+    batcher = None
+
+    async def parse_message(self, message, tracker=None, only_output_properties=True):
+        text = message.text or ""
+        if text.startswith("/"):
+            return parse_payload(text, self.domain)
+        if self.batcher is not None:
+            return await self.batcher.parse(text)
+        if self.parse_cache is None:
+            return await super().parse_message(message, tracker, only_output_properties)
+
+        parse_data = self.parse_cache.get(self.fingerprint, text)
+        if parse_data is None:
+            parse_data = await super().parse_message(message, tracker, only_output_properties)
+            self.parse_cache.put(self.fingerprint, text, parse_data)
+        return parse_data
+
+    @staticmethod
+    def _load_model(model_path):
+        model_dir = Path(model_path)
+        with open(model_dir / "metadata.json", encoding="utf-8") as f:
+            metadata = ModelMetadata.from_dict(json.load(f))
+        runner = DaskGraphRunner.create(
+            graph_schema=metadata.predict_schema,
+            model_storage=LocalModelStorage(model_dir / "components"),
+            execution_context=ExecutionContext(
+                graph_schema=metadata.predict_schema, model_id=metadata.model_id
+            ),
+        )
+        return model_dir.name, metadata, runner
+
+
+def load_unpacked_agent(model_dir: Path, fingerprint: str, action_endpoint=None,
+                        tracker_store=None, lock_store=None, parse_cache=None) -> Agent:
+    """Agent.load() for an unpacked model directory"""
+    agent = Agent(action_endpoint=action_endpoint, tracker_store=tracker_store, lock_store=lock_store)
+    agent.processor = CachedModelProcessor(
+        model_path=model_dir,
+        tracker_store=agent.tracker_store,
+        lock_store=agent.lock_store,
+        action_endpoint=agent.action_endpoint,
+        generator=agent.nlg,
+        http_interpreter=agent.http_interpreter,
+    )
+    agent.processor.parse_cache = parse_cache
+    agent.processor.fingerprint = fingerprint
+    agent.domain = agent.processor.domain
+    agent.fingerprint = fingerprint
+    agent.tracker_store.domain = agent.domain
+    if isinstance(agent.nlg, TemplatedNaturalLanguageGenerator):
+        agent.nlg.responses = agent.domain.responses if agent.domain else {}
+    return agent
+
+
+def parse_messages(agent, texts):
+    """
+    Run the NLU part of the model graph over many messages in one pass
+
+    Same output as agent.parse_message(), but tokenizers, featurizers and
+    classifiers each see the whole list at once instead of one message per
+    graph run.
+    """
+    processor = agent.processor
+    target = processor.model_metadata.nlu_target
+    results = processor.graph_runner.run(
+        inputs={PLACEHOLDER_MESSAGE: [UserMessage(text) for text in texts], PLACEHOLDER_TRACKER: None},
+        targets=[target],
+    )
+    parsed = []
+    for message in results[target]:
+        parse_data = {"text": "", "intent": {"name": None, "confidence": 0.0}, "entities": []}
+        parse_data.update(message.as_dict(only_output_properties=True))
+        parsed.append(parse_data)
+    return parsed
+
+
+class NLUBatcher:
+    """
+    Collects concurrent parse requests into micro-batches
+
+    A batch is sent once batch_size requests are waiting or the oldest has
+    waited max_wait seconds, whichever comes first. The collecting task
+    exits when the queue runs dry and is restarted by the next request.
+    """
+
+    def __init__(self, parse_batch, batch_size=NLU_BATCH_SIZE, max_wait=NLU_MAX_WAIT):
+        self.parse_batch = parse_batch
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue = None
+        self._task = None
+
+    async def parse(self, text):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self.queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        future = loop.create_future()
+        self.queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await self.parse_batch([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+
+            if self.queue.empty():
+                return
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+
+
+class AgentProxy:
+    """
+    Stable handle on the bot's current agent for the HTTP server
+
+    Attributes resolve on every access, so each new request is served by the
+    newest agent while requests already in flight finish on the one they started with.
+    """
+
+    def __init__(self, bot):
+        self._bot = bot
+
+    def __getattr__(self, name):
+        return getattr(self._bot.agent, name)
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Listening socket that other worker processes can bind too (SO_REUSEPORT)"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+    sock.set_inheritable(True)
+    return sock
+
+
+async def serve_app(app, host: str, port: int):
+    """Serve a Sanic app on the running event loop until cancelled"""
+    server = await app.create_server(host=host, port=port, access_log=False, return_asyncio_server=True)
+    await server.startup()
+    await server.before_start()
+    await server.after_start()
+    try:
+        await server.serve_forever()
+    finally:
+        await server.before_stop()
+        await server.close()
+        await server.after_stop()
+
+
+def serve_rest_worker(model_path: str, endpoints_file: str, host: str, port: int, worker: int):
+    """Entry point of one REST worker process"""
+    logger.info(f"REST worker {worker} (pid {os.getpid()}) starting on {host}:{port}")
+    bot = FalconCareBot(model_path, endpoints_file)
+    app = bot.rest_app(port, pull_models=False)
+    app.run(sock=bind_socket(host, port), access_log=False, register_sys_signals=True)
+
 
 class FalconCareBot:
     """FalconCare Health Assistant Bot"""
@@ -42,33 +468,257 @@ class FalconCareBot:
         self.model_path = model_path
         self.endpoints_file = endpoints_file
         self.agent = None
+        self.model_archive = None
+        self.fingerprint = None
+        self.model_dir = None
+        self.action_endpoint = EndpointConfig(url="http://localhost:5055/webhook")
+        self.model_server = read_endpoint_config(endpoints_file, "models")
+        self._model_etag = None
+        self.pulled = []  # archives this process pulled, oldest first
+        self.broken_archives = set()  # (path, mtime, size) of archives that failed to load
+        self.batcher = NLUBatcher(functools.partial(self.parse_batch, use_cache=True))
+        self.parse_cache = ParseCache()
+        self.startup = StartupTimer()
         
+    async def prepare_model(self):
+        """Find, fingerprint and unpack the newest model; (archive, fingerprint, dir) or None"""
+        with self.startup.phase("find model"):
+            if self.model_server and not self.latest_model():
+                await self.pull_model()
+            latest_model = self.latest_model()
+        if latest_model is None:
+            logger.error(f"No trained models found in {self.model_path}")
+            logger.info("Please train a model first using: rasa train")
+            return None
+
+        with self.startup.phase("fingerprint"):
+            fingerprint = model_fingerprint(latest_model)
+        with self.startup.phase("unpack"):
+            model_dir, cache_hit = unpack_model(latest_model, fingerprint)
+        logger.info(f"Model cache {'hit' if cache_hit else 'miss'}: {model_dir}")
+        return latest_model, fingerprint, model_dir
+
     async def load_agent(self):
-        """Load the trained Rasa agent"""
+        """Load the trained Rasa agent (from the unpacked model cache when possible)"""
         try:
-            # Find the latest model
-            model_files = list(Path(self.model_path).glob("*.tar.gz"))
-            if not model_files:
-                logger.error(f"No trained models found in {self.model_path}")
-                logger.info("Please train a model first using: rasa train")
+            prepared = await self.prepare_model()
+            if prepared is None:
                 return False
-                
-            latest_model = max(model_files, key=os.path.getctime)
+            latest_model, fingerprint, model_dir = prepared
             logger.info(f"Loading model: {latest_model}")
             
             # Load the agent
-            self.agent = Agent.load(
-                model_path=str(latest_model),
-                action_endpoint=EndpointConfig(url="http://localhost:5055/webhook")
-            )
+            with self.startup.phase("load"):
+                self.agent = load_unpacked_agent(
+                    model_dir, fingerprint,
+                    action_endpoint=self.action_endpoint,
+                    tracker_store=TrackerStore.create(read_endpoint_config(self.endpoints_file, "tracker_store")),
+                    lock_store=LockStore.create(read_endpoint_config(self.endpoints_file, "lock_store")),
+                    parse_cache=self.parse_cache,
+                )
+            self.batcher = self.attach_batcher(self.agent)
+            with self.startup.phase("warm-up"):
+                await self.warm_up(self.agent)
+            self.model_archive, self.fingerprint, self.model_dir = latest_model, fingerprint, model_dir
             
-            logger.info("FalconCare bot loaded successfully!")
+            logger.info("FalconCare bot loaded successfully! Startup phases:")
+            self.startup.report()
             return True
             
         except Exception as e:
             logger.error(f"Failed to load agent: {e}")
             return False
     
+    async def warm_up(self, agent):
+        """
+        Run canned messages through NLU and policy prediction so first requests
+        don't pay lazy init
+
+        The conversation lives only in a throwaway tracker and predicted actions
+        are not run, so nothing reaches the tracker store or the action server.
+        NLU parses go through the agent's batcher and policy predictions run on
+        a worker thread, so first-call graph tracing never blocks the event loop
+        while a hot swap warms up next to live traffic.
+        """
+        loop = asyncio.get_running_loop()
+        processor = agent.processor
+        tracker = DialogueStateTracker(WARMUP_SENDER_ID, agent.domain.slots)
+        for text in WARMUP_MESSAGES:
+            await processor._handle_message_with_tracker(UserMessage(text, sender_id=WARMUP_SENDER_ID), tracker)
+            await loop.run_in_executor(None, processor.predict_next_with_tracker_if_should, tracker)
+
+    def latest_model(self):
+        """Newest model archive in the models directory, or None"""
+        model_files = list(Path(self.model_path).glob("*.tar.gz"))
+        return max(model_files, key=os.path.getctime) if model_files else None
+
+    async def handle_text_async(self, text, sender_id="default"):
+        """Handle a message on whichever agent is current when it arrives"""
+        agent = self.agent
+        return await agent.handle_text_async(text, sender_id=sender_id)
+
+    def attach_batcher(self, agent):
+        """Micro-batch the agent's NLU parses on that agent's own model"""
+        agent.processor.batcher = NLUBatcher(functools.partial(self.parse_batch, agent=agent, use_cache=True))
+        return agent.processor.batcher
+
+    async def parse_batch(self, texts, batch_size=NLU_BATCH_SIZE, agent=None, use_cache=False):
+        """
+        NLU parse results for many messages, run in batches off the event loop
+
+        Bulk (offline) calls leave the parse cache alone so they don't evict the
+        live traffic's entries; the micro-batchers pass use_cache=True.
+        """
+        agent = agent or self.agent
+        fingerprint = agent.fingerprint
+        cache = self.parse_cache if use_cache else None
+        parsed = [None] * len(texts)
+        misses = []
+        for i, text in enumerate(texts):
+            if text.startswith("/"):
+                parsed[i] = parse_payload(text, agent.domain)
+            else:
+                parsed[i] = cache.get(fingerprint, text) if cache is not None else None
+                if parsed[i] is None:
+                    misses.append(i)
+
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            results = await loop.run_in_executor(None, parse_messages, agent, [texts[i] for i in chunk])
+            for i, parse_data in zip(chunk, results):
+                parsed[i] = parse_data
+                if cache is not None:
+                    cache.put(fingerprint, texts[i], parse_data)
+        return parsed
+
+    async def parse(self, text):
+        """NLU parse of one message, micro-batched with concurrent callers"""
+        return await self.batcher.parse(text)
+
+    async def swap_model(self, archive):
+        """
+        Load, warm up and switch to a new model without pausing traffic
+
+        Loading runs on a worker thread; the agent reference is replaced in a
+        single assignment once the new agent is ready. Conversations carry over
+        because the new agent shares the old one's tracker and lock stores.
+        Returns False if the archive holds the model already being served.
+        """
+        loop = asyncio.get_running_loop()
+        fingerprint = await loop.run_in_executor(None, model_fingerprint, archive)
+        if fingerprint == self.fingerprint:
+            self.model_archive = archive
+            return False
+
+        started = time.perf_counter()
+        model_dir, _ = await loop.run_in_executor(None, unpack_model, archive, fingerprint)
+        try:
+            agent = await loop.run_in_executor(None, functools.partial(
+                load_unpacked_agent, model_dir, fingerprint,
+                action_endpoint=self.action_endpoint,
+                tracker_store=self.agent.tracker_store if self.agent else None,
+                lock_store=self.agent.lock_store if self.agent else None,
+                parse_cache=self.parse_cache,
+            ))
+            batcher = self.attach_batcher(agent)
+            await self.warm_up(agent)
+        except BaseException:
+            release_model(model_dir)
+            raise
+
+        # Messages the old agent is still parsing finish on its own batcher
+        self.agent, self.batcher = agent, batcher
+        old_model_dir = self.model_dir
+        self.model_archive, self.fingerprint, self.model_dir = archive, fingerprint, model_dir
+        if old_model_dir is not None:
+            # The loaded graph no longer reads its files; other processes may prune it
+            release_model(old_model_dir)
+        # Entries for the old fingerprint can never hit again
+        self.parse_cache.clear()
+        logger.info(f"Swapped to model {archive} in {time.perf_counter() - started:.1f}s")
+        return True
+
+    async def pull_model(self):
+        """Download a new archive from the endpoints.yml model server, if it changed"""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        headers = {"If-None-Match": self._model_etag} if self._model_etag else {}
+        async with aiohttp.ClientSession() as session:
+            async with session.get(self.model_server.url, headers=headers) as response:
+                if response.status == 304:
+                    return None
+                response.raise_for_status()
+
+                # File I/O runs on worker threads so the event loop keeps serving
+                models = Path(self.model_path)
+                await loop.run_in_executor(None, functools.partial(models.mkdir, parents=True, exist_ok=True))
+                # Unique even when replicas sharing the directory pull in the same second
+                name = f"pulled-{int(time.time())}-{uuid.uuid4().hex[:8]}.tar.gz"
+                scratch = models / f".{name}.part"
+                f = await loop.run_in_executor(None, open, scratch, "wb")
+                try:
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        await loop.run_in_executor(None, f.write, chunk)
+                    await loop.run_in_executor(None, f.close)
+                    archive = models / name
+                    await loop.run_in_executor(None, os.rename, scratch, archive)
+                except BaseException:
+                    f.close()
+                    scratch.unlink(missing_ok=True)
+                    raise
+
+                self._model_etag = response.headers.get("ETag")
+                logger.info(f"Pulled model from {self.model_server.url}: {archive}")
+                await loop.run_in_executor(None, self.prune_pulled_models, archive)
+                return archive
+
+    def prune_pulled_models(self, newest, keep=PULLED_MODELS_KEEP):
+        """
+        Delete all but the `keep` newest archives this process pulled, never
+        the one being served; archives pulled by other processes are theirs to prune
+        """
+        self.pulled.append(newest)
+        stale, self.pulled = self.pulled[:-keep], self.pulled[-keep:]
+        for archive in stale:
+            if archive == self.model_archive:
+                self.pulled.insert(0, archive)
+            else:
+                archive.unlink(missing_ok=True)
+
+    async def watch_models(self, interval=MODEL_POLL_INTERVAL, pull=True, swap=True):
+        """
+        Poll for newer models and hot-swap them in; runs until cancelled
+
+        pull=False only swaps in archives that appear in the models directory
+        (REST workers, whose parent pulls); swap=False only pulls (that parent).
+        """
+        if self.model_server:
+            interval = self.model_server.kwargs.get("wait_time_between_pulls") or interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if pull and self.model_server:
+                    await self.pull_model()
+                latest = self.latest_model()
+                if swap and latest is not None and latest != self.model_archive:
+                    await self.swap_if_loadable(latest)
+            except Exception as e:
+                logger.error(f"Model hot-swap failed, still serving {self.model_archive}: {e}")
+
+    async def swap_if_loadable(self, archive):
+        """swap_model(), skipping archives that already failed to load until they are replaced"""
+        stat = archive.stat()
+        key = (archive, stat.st_mtime_ns, stat.st_size)
+        if key in self.broken_archives:
+            return False
+        try:
+            return await self.swap_model(archive)
+        except Exception:
+            self.broken_archives.add(key)
+            raise
+
     async def run_console(self):
         """Run the bot in console mode"""
         if not self.agent:
@@ -80,8 +730,8 @@ class FalconCareBot:
         logger.info("=" * 50)
         
         try:
-            await self.agent.handle_text_async("Hello! I'm FalconCare, your health assistant.")
-            await self.agent.handle_text_async("How can I help you with your health concerns today?")
+            await self.handle_text_async("Hello! I'm FalconCare, your health assistant.")
+            await self.handle_text_async("How can I help you with your health concerns today?")
             
             while True:
                 user_input = input("\nYou: ").strip()
@@ -91,7 +741,7 @@ class FalconCareBot:
                     break
                     
                 if user_input:
-                    response = await self.agent.handle_text_async(user_input)
+                    response = await self.handle_text_async(user_input)
                     print(f"FalconCare: {response}")
                     
         except KeyboardInterrupt:
@@ -108,16 +758,94 @@ class FalconCareBot:
         logger.info(f"Starting FalconCare bot REST API on {host}:{port}")
         
         try:
-            from rasa.core import run
-            await run.serve_application(
-                self.agent,
-                channel=RestInput(),
-                http_port=port,
-                host=host
-            )
+            await serve_app(self.rest_app(port), host, port)
         except Exception as e:
             logger.error(f"Error starting REST API: {e}")
     
+    def channel_app(self, channel, port: int = 5005, pull_models: bool = True):
+        """
+        Sanic app serving an input channel from the current agent
+
+        Requests go to AgentProxy(self), so hot-swapped models are served as
+        soon as they are ready. The agent is loaded when the server starts
+        unless it already is. With pull_models=False new models are only
+        picked up from the models directory, not pulled from the model server.
+        """
+        from rasa.core.run import configure_app
+        from sanic import response
+
+        app = configure_app([channel], enable_api=False, port=port)
+
+        async def load_agent_on_start(app, loop):
+            if self.agent is None and not await self.load_agent():
+                raise RuntimeError("Agent could not be loaded")
+            app.ctx.agent = AgentProxy(self)
+            app.ctx.model_watcher = loop.create_task(self.watch_models(pull=pull_models))
+
+        async def stop_watching_models(app, loop):
+            app.ctx.model_watcher.cancel()
+
+        async def parse_cache_stats(request):
+            return response.json(self.parse_cache.stats())
+
+        app.register_listener(load_agent_on_start, "before_server_start")
+        app.register_listener(stop_watching_models, "before_server_stop")
+        app.add_route(parse_cache_stats, "/nlu/cache", methods=["GET"])
+        return app
+
+    def rest_app(self, port: int = 5005, pull_models: bool = True):
+        """Sanic app serving the REST channel"""
+        return self.channel_app(RestInput(), port, pull_models)
+
+    async def run_rest_workers(self, host: str = "localhost", port: int = 5005, workers: int = REST_WORKERS):
+        """
+        Serve the REST API from several processes sharing one port via SO_REUSEPORT
+
+        The parent only unpacks the model, so every worker loads it from the
+        cache, and is the only process that pulls from the model server;
+        workers swap in whatever archive appears in the models directory. The kernel spreads connections across workers without regard to
+        sender_id, so conversations must live in a tracker store shared by all
+        workers, and a redis lock_store must keep one sender's messages in order.
+        """
+        if read_endpoint_config(self.endpoints_file, "tracker_store") is None:
+            logger.error("Multi-worker mode needs a shared tracker_store in endpoints.yml; "
+                         "with the in-memory store each worker would see only part of a conversation")
+            return
+        lock_store = read_endpoint_config(self.endpoints_file, "lock_store")
+        if lock_store is None or lock_store.type != "redis":
+            logger.error("Multi-worker mode needs a redis lock_store in endpoints.yml; "
+                         "with per-process locks two workers could handle one sender's messages at once")
+            return
+        prepared = await self.prepare_model()
+        if prepared is None:
+            return
+        # The workers hold the model themselves once they load it
+        release_model(prepared[2])
+
+        logger.info(f"Starting FalconCare bot REST API on {host}:{port} with {workers} workers")
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=serve_rest_worker,
+                args=(self.model_path, self.endpoints_file, host, port, worker),
+                name=f"falconcare-rest-{worker}"
+            )
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        loop = asyncio.get_running_loop()
+        puller = loop.create_task(self.watch_models(swap=False)) if self.model_server else None
+        try:
+            await asyncio.gather(*(loop.run_in_executor(None, process.join) for process in processes))
+        finally:
+            if puller is not None:
+                puller.cancel()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
     async def run_socketio(self, host: str = "localhost", port: int = 5005):
         """Run the bot with SocketIO support"""
         if not self.agent:
@@ -126,18 +854,13 @@ class FalconCareBot:
             
         logger.info(f"Starting FalconCare bot SocketIO server on {host}:{port}")
         
+        channel = SocketIOInput(
+            user_message_evt="user_uttered",
+            bot_message_evt="bot_uttered",
+            session_persistence=True
+        )
         try:
-            from rasa.core import run
-            await run.serve_application(
-                self.agent,
-                channel=SocketIOInput(
-                    user_message_evt="user_uttered",
-                    bot_message_evt="bot_uttered",
-                    session_persistence=True
-                ),
-                http_port=port,
-                host=host
-            )
+            await serve_app(self.channel_app(channel, port), host, port)
         except Exception as e:
             logger.error(f"Error starting SocketIO server: {e}")
 
@@ -149,15 +872,22 @@ async def main():
     
     # Initialize the bot
     bot = FalconCareBot()
-    
+    mode = sys.argv[1].lower() if len(sys.argv) > 1 else "console"
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else REST_WORKERS
+
+    # Worker processes load their own agents
+    if mode == "rest" and workers > 1:
+        host = sys.argv[2] if len(sys.argv) > 2 else "localhost"
+        port = int(sys.argv[3]) if len(sys.argv) > 3 else 5005
+        await bot.run_rest_workers(host, port, workers)
+        return
+
     # Load the agent
     if not await bot.load_agent():
         sys.exit(1)
     
     # Check command line arguments
     if len(sys.argv) > 1:
-        mode = sys.argv[1].lower()
-        
         if mode == "console":
             await bot.run_console()
         elif mode == "rest":
@@ -169,9 +899,9 @@ async def main():
             port = int(sys.argv[3]) if len(sys.argv) > 3 else 5005
             await bot.run_socketio(host, port)
         else:
-            print("Usage: python run.py [console|rest|socketio] [host] [port]")
+            print("Usage: python run.py [console|rest|socketio] [host] [port] [workers]")
             print("  console  - Run in interactive console mode")
-            print("  rest     - Run as REST API server")
+            print("  rest     - Run as REST API server (workers > 1 for multi-process)")
             print("  socketio - Run with SocketIO support")
             sys.exit(1)
     else:
@@ -12,6 +12,11 @@ from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.core.channels.console import ConsoleInputChannel
 from typing import Dict, List
 
+from conversation_scenarios import (
+    CONVERSATION_FLOW, EMERGENCY_CASES, GREETING_CASES, MULTILINGUAL_CASES,
+    MYTH_CASES, SYMPTOM_CASES, VACCINATION_CASES
+)
+
 
 class FalconCareTester:
     """Comprehensive test suite for FalconCare"""
@@ -34,28 +39,7 @@ class FalconCareTester:
         """Test basic conversation flow"""
         print("\n🔄 Testing Basic Conversation...")
         
-        test_cases = [
-            {
-                "input": "नमस्ते",
-                "expected_intent": "greet",
-                "description": "Hindi greeting"
-            },
-            {
-                "input": "Hello",
-                "expected_intent": "greet", 
-                "description": "English greeting"
-            },
-            {
-                "input": "आप कौन हैं?",
-                "expected_intent": "bot_challenge",
-                "description": "Bot identity question in Hindi"
-            },
-            {
-                "input": "What can you do?",
-                "expected_intent": "bot_capabilities",
-                "description": "Capabilities inquiry"
-            }
-        ]
+        test_cases = GREETING_CASES
         
         for test in test_cases:
             result = await self.agent.parse_message(test["input"])
@@ -72,32 +56,7 @@ class FalconCareTester:
         """Test symptom recognition and entity extraction"""
         print("\n🔄 Testing Symptom Recognition...")
         
-        test_cases = [
-            {
-                "input": "मुझे बुखार है",
-                "expected_intent": "symptom_fever",
-                "expected_entities": ["symptom"],
-                "description": "Fever in Hindi"
-            },
-            {
-                "input": "I have a cough since 3 days",
-                "expected_intent": "symptom_cough", 
-                "expected_entities": ["symptom", "duration"],
-                "description": "Cough with duration"
-            },
-            {
-                "input": "पेट में दर्द हो रहा है",
-                "expected_intent": "symptom_stomachache",
-                "expected_entities": ["symptom"],
-                "description": "Stomach pain in Hindi"
-            },
-            {
-                "input": "सिरदर्द बहुत तेज है",
-                "expected_intent": "symptom_headache",
-                "expected_entities": ["symptom", "severity"],
-                "description": "Severe headache"
-            }
-        ]
+        test_cases = SYMPTOM_CASES
         
         for test in test_cases:
             result = await self.agent.parse_message(test["input"])
@@ -118,32 +77,7 @@ class FalconCareTester:
         """Test emergency triage system"""
         print("\n🔄 Testing Emergency Detection...")
         
-        emergency_cases = [
-            {
-                "input": "सीने में तेज दर्द है",
-                "expected_intent": "emergency_severe",
-                "triage_level": "RED",
-                "description": "Chest pain emergency"
-            },
-            {
-                "input": "सांस नहीं आ रही",
-                "expected_intent": "symptom_breathing",
-                "triage_level": "RED", 
-                "description": "Breathing difficulty"
-            },
-            {
-                "input": "accident happened, bleeding heavily",
-                "expected_intent": "emergency_severe",
-                "triage_level": "RED",
-                "description": "Accident with bleeding"
-            },
-            {
-                "input": "3 दिन से तेज बुखार है",
-                "expected_intent": "symptom_fever",
-                "triage_level": "YELLOW",
-                "description": "Persistent high fever"
-            }
-        ]
+        emergency_cases = EMERGENCY_CASES
         
         for test in emergency_cases:
             result = await self.agent.parse_message(test["input"])
@@ -162,23 +96,7 @@ class FalconCareTester:
         """Test vaccination information queries"""
         print("\n🔄 Testing Vaccination Queries...")
         
-        test_cases = [
-            {
-                "input": "बच्चे का टीका कब लगवाएं",
-                "expected_intent": "vaccination_child",
-                "description": "Child vaccination inquiry"
-            },
-            {
-                "input": "कोविड वैक्सीन कहां मिलेगी",
-                "expected_intent": "vaccination_covid",
-                "description": "COVID vaccine location"
-            },
-            {
-                "input": "vaccination schedule for 6 months baby",
-                "expected_intent": "vaccination_schedule",
-                "description": "Vaccination schedule"
-            }
-        ]
+        test_cases = VACCINATION_CASES
         
         for test in test_cases:
             result = await self.agent.parse_message(test["input"])
@@ -195,23 +113,7 @@ class FalconCareTester:
         """Test health myth detection"""
         print("\n🔄 Testing Myth Detection...")
         
-        myth_cases = [
-            {
-                "input": "हल्दी से कैंसर ठीक हो जाता है",
-                "expected_intent": "myth_home_remedies",
-                "description": "Turmeric cancer cure myth"
-            },
-            {
-                "input": "TB छूने से फैलता है",
-                "expected_intent": "myth_false_cures", 
-                "description": "TB transmission myth"
-            },
-            {
-                "input": "गौमूत्र से कोविड ठीक होता है",
-                "expected_intent": "myth_false_cures",
-                "description": "COVID cure myth"
-            }
-        ]
+        myth_cases = MYTH_CASES
         
         for test in myth_cases:
             result = await self.agent.parse_message(test["input"])
@@ -228,28 +130,7 @@ class FalconCareTester:
         """Test multilingual capabilities"""
         print("\n🔄 Testing Multilingual Support...")
         
-        language_tests = [
-            {
-                "input": "नमस्ते डॉक्टर",
-                "language": "Hindi (Devanagari)",
-                "expected_intent": "greet"
-            },
-            {
-                "input": "namaste doctor",
-                "language": "Hindi (Roman)",
-                "expected_intent": "greet"
-            },
-            {
-                "input": "bukhar hai",
-                "language": "Hindi (Roman)",
-                "expected_intent": "symptom_fever"
-            },
-            {
-                "input": "pet dard",
-                "language": "Hindi (Roman)",
-                "expected_intent": "symptom_stomachache"
-            }
-        ]
+        language_tests = MULTILINGUAL_CASES
         
         for test in language_tests:
             result = await self.agent.parse_message(test["input"])
@@ -267,12 +148,7 @@ class FalconCareTester:
         print("\n🔄 Testing Conversation Flow...")
         
         # Simulate a complete symptom assessment conversation
-        conversation = [
-            ("मुझे बुखार है", "symptom_fever"),
-            ("3 दिन से", "inform_duration"), 
-            ("बहुत तेज", "inform_severity"),
-            ("सिरदर्द भी है", "inform_symptom")
-        ]
+        conversation = CONVERSATION_FLOW
         
         print("Testing symptom assessment flow...")
         for user_input, expected_intent in conversation:
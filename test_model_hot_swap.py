@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+FalconCare - Model Hot-Swap Test
+Keeps traffic flowing through FalconCareBot while a new model is swapped in
+"""
+
+import asyncio
+import fcntl
+import io
+import os
+import random
+import tarfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import run
+from run import WARMUP_MESSAGES, FalconCareBot
+
+
+class FakeProcessor:
+    """Records the messages it parses and predicts for"""
+
+    def __init__(self):
+        self.parsed = []
+
+    async def _handle_message_with_tracker(self, message, tracker):
+        self.parsed.append(message.text)
+        tracker.events.append(message.text)
+
+    def predict_next_with_tracker_if_should(self, tracker):
+        return "action_listen", None
+
+
+class FakeAgent:
+    """Stands in for a loaded Rasa agent; slow to build, answers with its model name"""
+
+    def __init__(self, name, tracker_store=None, lock_store=None):
+        self.name = name
+        self.tracker_store = tracker_store if tracker_store is not None else {}
+        self.lock_store = lock_store if lock_store is not None else object()
+        self.processor = FakeProcessor()
+        self.domain = SimpleNamespace(slots=[])
+
+    async def handle_text_async(self, text, sender_id="default"):
+        await asyncio.sleep(random.uniform(0, 0.005))
+        self.tracker_store.setdefault(sender_id, []).append(text)
+        return [{"recipient_id": sender_id, "text": self.name}]
+
+    async def handle_message(self, message):
+        self.tracker_store.setdefault(message.sender_id, []).append(message.text)
+        await message.output_channel.send_text_message(message.sender_id, self.name)
+
+
+def fake_load(model_dir, fingerprint, action_endpoint=None, tracker_store=None, lock_store=None, **kwargs):
+    time.sleep(0.2)
+    return FakeAgent(fingerprint, tracker_store, lock_store)
+
+
+def test_hot_swap_under_traffic():
+    """No request fails and conversations survive while the agent is replaced"""
+
+    async def scenario():
+        bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+        bot.agent = FakeAgent("model-a")
+        bot.model_archive, bot.fingerprint = Path("models/a.tar.gz"), "model-a"
+
+        failures, served = [], []
+        stop = asyncio.Event()
+
+        async def user(i):
+            while not stop.is_set():
+                try:
+                    response = await bot.handle_text_async("mujhe bukhar hai", sender_id=f"user-{i}")
+                    served.append(response[0]["text"])
+                except Exception as e:
+                    failures.append(e)
+
+        with patch.object(run, "model_fingerprint", lambda archive: "model-b"), \
+                patch.object(run, "unpack_model", lambda archive, fingerprint: (Path(archive), False)), \
+                patch.object(run, "load_unpacked_agent", fake_load):
+            users = [asyncio.create_task(user(i)) for i in range(50)]
+            await asyncio.sleep(0.05)
+            old_agent = bot.agent
+            assert await bot.swap_model(Path("models/b.tar.gz"))
+            await asyncio.sleep(0.05)
+            stop.set()
+            await asyncio.gather(*users)
+
+        return bot, old_agent, failures, served
+
+    bot, old_agent, failures, served = asyncio.run(scenario())
+
+    assert failures == []
+    assert bot.agent.name == "model-b"
+    assert {"model-a", "model-b"} <= set(served)
+    assert bot.agent.tracker_store is old_agent.tracker_store
+    assert bot.model_archive == Path("models/b.tar.gz")
+
+
+def test_swap_same_model_is_noop():
+    """Re-saving an identical archive does not reload the agent"""
+
+    async def scenario():
+        bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+        bot.agent = FakeAgent("model-a")
+        bot.fingerprint = "model-a"
+        with patch.object(run, "model_fingerprint", lambda archive: "model-a"):
+            swapped = await bot.swap_model(Path("models/a-copy.tar.gz"))
+        return bot, swapped
+
+    bot, swapped = asyncio.run(scenario())
+    assert not swapped
+    assert bot.agent.name == "model-a"
+
+
+def test_rest_webhook_follows_the_swap():
+    """The HTTP channel answers from whichever agent is current"""
+    bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+    bot.agent = FakeAgent("model-a")
+    app = bot.rest_app()
+    message = {"sender": "user-1", "message": "mujhe bukhar hai"}
+
+    _, before = app.test_client.post("/webhooks/rest/webhook", json=message)
+    bot.agent = FakeAgent("model-b", bot.agent.tracker_store, bot.agent.lock_store)
+    _, after = app.test_client.post("/webhooks/rest/webhook", json=message)
+
+    assert before.json == [{"recipient_id": "user-1", "text": "model-a"}]
+    assert after.json == [{"recipient_id": "user-1", "text": "model-b"}]
+    assert bot.agent.tracker_store["user-1"] == ["mujhe bukhar hai"] * 2
+
+
+def test_warm_up_leaves_no_conversation_behind():
+    """Warm-up messages reach the model but not the tracker store"""
+    bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+    agent = FakeAgent("model-a")
+    asyncio.run(bot.warm_up(agent))
+
+    assert agent.processor.parsed == WARMUP_MESSAGES
+    assert agent.tracker_store == {}
+
+
+def test_prune_pulled_models_keeps_newest_and_served(tmp_path):
+    """Old archives this process pulled are deleted, except the newest ones and the one being served"""
+    archives = []
+    for i in range(5):
+        archive = tmp_path / f"pulled-{i}.tar.gz"
+        archive.write_bytes(b"model")
+        archives.append(archive)
+    bot = FalconCareBot(model_path=str(tmp_path), endpoints_file="/nonexistent/endpoints.yml")
+    bot.model_archive = archives[0]
+    bot.pulled = archives[:3]  # archives[3] was pulled by another replica
+
+    bot.prune_pulled_models(archives[4], keep=2)
+
+    assert sorted(tmp_path.iterdir()) == [archives[0], archives[2], archives[3], archives[4]]
+    assert bot.pulled == [archives[0], archives[2], archives[4]]
+
+
+def test_rest_workers_only_swap(tmp_path):
+    """Worker processes pick up archives from the models directory; only the parent pulls"""
+
+    async def scenario(pull):
+        bot = FalconCareBot(model_path=str(tmp_path), endpoints_file="/nonexistent/endpoints.yml")
+        bot.model_server = SimpleNamespace(url="http://models.example/latest", kwargs={})
+        pulls, swaps = [], []
+
+        async def pull_model():
+            pulls.append(True)
+
+        async def swap_model(archive):
+            swaps.append(archive)
+            bot.model_archive = archive
+
+        bot.pull_model, bot.swap_model = pull_model, swap_model
+        watcher = asyncio.create_task(bot.watch_models(interval=0.01, pull=pull))
+        await asyncio.sleep(0.05)
+        watcher.cancel()
+        return pulls, swaps
+
+    (tmp_path / "pulled-1.tar.gz").write_bytes(b"model")
+    pulls, swaps = asyncio.run(scenario(pull=False))
+    assert pulls == [] and swaps == [tmp_path / "pulled-1.tar.gz"]
+    pulls, _ = asyncio.run(scenario(pull=True))
+    assert pulls
+
+
+def test_broken_archive_is_tried_once(tmp_path):
+    """An archive that fails to load is skipped on later polls until it is replaced"""
+
+    async def scenario():
+        bot = FalconCareBot(model_path=str(tmp_path), endpoints_file="/nonexistent/endpoints.yml")
+        attempts = []
+
+        async def swap_model(archive):
+            attempts.append(archive)
+            raise ValueError("not a model archive")
+
+        bot.swap_model = swap_model
+        watcher = asyncio.create_task(bot.watch_models(interval=0.01))
+        await asyncio.sleep(0.05)
+        broken.write_bytes(b"fixed model")
+        await asyncio.sleep(0.05)
+        watcher.cancel()
+        return attempts
+
+    broken = tmp_path / "pulled-1.tar.gz"
+    broken.write_bytes(b"garbage")
+    assert asyncio.run(scenario()) == [broken, broken]
+
+
+def model_archive(path, name):
+    with tarfile.open(path, "w:gz") as tar:
+        data = f'{{"model_id": "{name}"}}'.encode()
+        info = tarfile.TarInfo("metadata.json")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_unpack_cache_keeps_models_other_processes_hold(tmp_path):
+    """Pruning the shared unpack cache skips models another worker or replica still holds"""
+    cache = tmp_path / "cache"
+    archives = {name: model_archive(tmp_path / f"{name}.tar.gz", name) for name in ("a", "b", "c")}
+
+    model_a, _ = run.unpack_model(archives["a"], "a", cache_dir=str(cache), keep=1)
+    run.release_model(model_a)
+    # Another process is serving model a
+    other = open(cache / ".a.lock", "a")
+    fcntl.flock(other, fcntl.LOCK_SH)
+    os.utime(model_a, (0, 0))
+
+    model_b, _ = run.unpack_model(archives["b"], "b", cache_dir=str(cache), keep=1)
+    assert (model_a / "metadata.json").exists()
+
+    other.close()
+    run.release_model(model_b)
+    model_c, cache_hit = run.unpack_model(archives["c"], "c", cache_dir=str(cache), keep=1)
+    run.release_model(model_c)
+    assert not cache_hit
+    assert sorted(d.name for d in cache.iterdir() if not d.name.startswith(".")) == ["c"]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+FalconCare - NLU Micro-Batching Test
+Concurrent parse requests are grouped into bounded batches and answered in order
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import run
+from run import CachedModelProcessor, FalconCareBot, NLUBatcher, UserMessage
+
+
+def test_micro_batches_are_bounded_and_ordered():
+    batches = []
+
+    async def parse_batch(texts):
+        batches.append(len(texts))
+        await asyncio.sleep(0.001)
+        return [{"text": text, "intent": {"name": f"intent_{text}"}} for text in texts]
+
+    async def scenario():
+        batcher = NLUBatcher(parse_batch, batch_size=16, max_wait=0.05)
+        results = await asyncio.gather(*(batcher.parse(str(i)) for i in range(100)))
+        batcher.close()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [r["text"] for r in results] == [str(i) for i in range(100)]
+    assert max(batches) <= 16
+    assert len(batches) < 100
+
+
+def test_lone_request_waits_at_most_max_wait():
+    async def parse_batch(texts):
+        return texts
+
+    async def scenario():
+        batcher = NLUBatcher(parse_batch, batch_size=64, max_wait=0.01)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await batcher.parse("hello")
+        batcher.close()
+        return result, loop.time() - start
+
+    result, elapsed = asyncio.run(scenario())
+    assert result == "hello"
+    assert elapsed < 0.5
+
+
+def test_processor_parses_through_the_batcher():
+    """Channel messages reach the NLU graph in batches; button payloads skip it"""
+    batches = []
+
+    async def parse_batch(texts):
+        batches.append(list(texts))
+        return [{"text": text, "intent": {"name": "greet"}, "entities": []} for text in texts]
+
+    async def scenario():
+        processor = CachedModelProcessor.__new__(CachedModelProcessor)
+        processor.domain = None
+        processor.batcher = NLUBatcher(parse_batch, batch_size=8, max_wait=0.05)
+        messages = [UserMessage(f"hello {i}") for i in range(8)] + [UserMessage("/greet")]
+        results = await asyncio.gather(*(processor.parse_message(message) for message in messages))
+        processor.batcher.close()
+        return results
+
+    with patch.object(run, "parse_payload", lambda text, domain: {"text": text, "intent": {"name": "payload"}}):
+        results = asyncio.run(scenario())
+
+    assert batches == [[f"hello {i}" for i in range(8)]]
+    assert [r["intent"]["name"] for r in results] == ["greet"] * 8 + ["payload"]
+
+
+def test_bulk_parses_are_chunked_and_skip_the_parse_cache():
+    """Offline parse_batch calls run in NLU_BATCH_SIZE chunks and leave live cache entries alone"""
+    chunks = []
+
+    def parse_messages(agent, texts):
+        chunks.append(len(texts))
+        return [{"text": text, "intent": {"name": "greet"}, "entities": []} for text in texts]
+
+    bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+    bot.agent = SimpleNamespace(fingerprint="model-a", domain=None)
+    bot.parse_cache.put("model-a", "live message", {"text": "live message", "intent": {"name": "live"}, "entities": []})
+    texts = [f"offline {i}" for i in range(run.NLU_BATCH_SIZE * 2 + 1)]
+
+    with patch.object(run, "parse_messages", parse_messages):
+        parsed = asyncio.run(bot.parse_batch(texts))
+        assert chunks == [run.NLU_BATCH_SIZE, run.NLU_BATCH_SIZE, 1]
+        assert [p["text"] for p in parsed] == texts
+        assert bot.parse_cache.stats()["size"] == 1
+
+        asyncio.run(bot.parse_batch(["hello"], use_cache=True))
+        assert bot.parse_cache.get("model-a", "hello")["intent"]["name"] == "greet"
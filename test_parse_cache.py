@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+FalconCare - NLU Parse Cache Test
+Repeated messages are served from the cache, per model fingerprint
+"""
+
+from run import ParseCache
+
+
+def parse_result(text, entities=None):
+    return {"text": text, "intent": {"name": "symptom_query", "confidence": 0.9}, "entities": entities or []}
+
+
+def test_normalized_hits_and_hit_rate():
+    cache = ParseCache(maxsize=10)
+    assert cache.get("model-a", "बुखार है") is None
+    cache.put("model-a", "बुखार है", parse_result("बुखार है"))
+
+    hit = cache.get("model-a", "  बुखार   है ")
+    assert hit["intent"]["name"] == "symptom_query"
+    assert hit["text"] == "  बुखार   है "
+    assert cache.get("model-a", "HELP") is None
+    assert cache.hit_rate == 1 / 3
+
+
+def test_keyed_by_fingerprint_and_bounded():
+    cache = ParseCache(maxsize=2)
+    cache.put("model-a", "hi", parse_result("hi"))
+    assert cache.get("model-b", "hi") is None
+
+    cache.put("model-a", "1", parse_result("1"))
+    cache.put("model-a", "help", parse_result("help"))
+    assert cache.get("model-a", "hi") is None
+    assert cache.stats()["size"] == 2
+
+
+def test_entity_results_only_reused_for_identical_text():
+    cache = ParseCache()
+    entities = [{"entity": "symptom", "value": "fever", "start": 7, "end": 12}]
+    cache.put("model-a", "I have fever", parse_result("I have fever", entities))
+
+    assert cache.get("model-a", "I have fever")["entities"] == entities
+    assert cache.get("model-a", "i have  fever") is None
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+FalconCare - Multi-Worker REST Test
+Several worker processes are only started with shared conversation and lock stores
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import run
+from run import FalconCareBot
+
+
+def endpoints(**configs):
+    return lambda endpoints_file, name: configs.get(name)
+
+
+@pytest.mark.parametrize("configs,expected", [
+    ({}, False),
+    ({"tracker_store": SimpleNamespace(type="sql")}, False),
+    ({"tracker_store": SimpleNamespace(type="sql"), "lock_store": SimpleNamespace(type="in_memory")}, False),
+    ({"tracker_store": SimpleNamespace(type="sql"), "lock_store": SimpleNamespace(type="redis")}, True),
+])
+def test_workers_need_shared_tracker_and_redis_lock_store(configs, expected):
+    bot = FalconCareBot(endpoints_file="/nonexistent/endpoints.yml")
+    prepared = []
+
+    async def prepare_model():
+        prepared.append(True)
+        return None
+
+    bot.prepare_model = prepare_model
+    with patch.object(run, "read_endpoint_config", endpoints(**configs)):
+        asyncio.run(bot.run_rest_workers(workers=2))
+
+    assert bool(prepared) == expected
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+FalconCare - Symptom Normalizer Test
+English, Devanagari and romanized Hindi mentions map to the same symptom IDs
+"""
+
+import json
+from pathlib import Path
+
+from symptom_normalizer import NORMALIZER, SYMPTOM_LEXICON, SymptomNormalizer, expand_shorthand
+
+
+def test_scripts_map_to_same_symptom():
+    for text in ["I have fever", "मुझे बुखार है", "bukhar hai", "bukhaar", "बुख़ार"]:
+        assert NORMALIZER.symptoms(text) == ["fever"], text
+    for text in ["chest pain", "सीने में दर्द", "seene mein dard", "तेज सीने का दर्द"]:
+        assert NORMALIZER.symptoms(text) == ["chest pain"], text
+
+
+def test_longest_phrase_wins_and_implies_base():
+    assert NORMALIZER.symptoms("khoon ki ulti ho rahi hai") == ["vomiting blood", "vomiting"]
+    assert NORMALIZER.symptoms("severe headache and high fever") == [
+        "severe headache", "headache", "high fever", "fever"
+    ]
+    assert NORMALIZER.symptoms("बुखार और दाने") == ["fever", "rash"]
+
+
+def test_fillers_only_skipped_inside_phrases():
+    assert NORMALIZER.symptoms("pet mein dard") == ["abdominal pain"]
+    assert NORMALIZER.symptoms("mein theek hoon") == []
+    assert NORMALIZER.symptoms("petrol pump kahan hai") == []
+
+
+def test_ambiguous_words_only_match_inside_phrases():
+    for text in ["my pet dog is sick", "a cold drink", "पेट भर खाना खाया", "stomach full after lunch"]:
+        assert NORMALIZER.symptoms(text) == [], text
+    assert NORMALIZER.symptoms("पेट में दर्द") == ["abdominal pain"]
+    assert NORMALIZER.symptoms("caught a cold") == ["runny nose"]
+
+
+def test_folds_spelling_variants():
+    assert NORMALIZER.symptoms("खाँसी") == NORMALIZER.symptoms("खांसी") == ["cough"]
+    assert NORMALIZER.symptoms("I can’t breathe") == ["shortness of breath"]
+    assert NORMALIZER.canonical("Stomach Pain") == "abdominal pain"
+    assert NORMALIZER.canonical("hello") is None
+
+
+def test_custom_lexicon():
+    normalizer = SymptomNormalizer({"fever": ["jwar"]}, implied={}, fillers=[])
+    assert normalizer.symptoms("JWAR aur khansi") == ["fever"]
+
+
+def test_canonical_ids_match_condition_database():
+    conditions = json.loads((Path(__file__).parent / "backend" / "data" / "conditions.json").read_text())
+    known = {symptom for symptoms in conditions["conditions"].values() for symptom in symptoms}
+    for symptom in ["fever", "cough", "headache", "abdominal pain", "diarrhea", "rash", "chest pain"]:
+        assert symptom in SYMPTOM_LEXICON and symptom in known
+
+
+def test_expand_shorthand():
+    assert expand_shorthand("Kya u thik ho") == "क्या you ठीक ho"